@@ -0,0 +1,245 @@
+"""baseline schema
+
+create_all 로 만들던 초기 스키마입니다.
+이미 create_all 로 만든 DB는 이 리비전을 실행하지 말고 `alembic stamp 0001` 로 기록만 합니다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 00:00:00
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from pgvector.sqlalchemy import Vector
+
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ENUM_TYPES = (
+    "portfoliostatus",
+    "portfoliosourcetype",
+    "portfolioitemtype",
+    "portfolioitemstatus",
+    "chatmessagetype",
+    "qnastatus",
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+
+    op.create_table(
+        "users",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("first_name", sa.String(length=255), nullable=True),
+        sa.Column("last_name", sa.String(length=255), nullable=True),
+        sa.Column("picture", sa.String(length=2048), nullable=True),
+        sa.Column("locale", sa.String(length=10), nullable=True),
+        sa.Column("fcm_token", sa.String(length=255), nullable=True),
+        sa.Column("nickname", sa.String(length=32), nullable=True),
+        sa.Column("address", sa.String(length=64), nullable=True),
+        sa.Column("job", sa.String(length=32), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("nickname"),
+    )
+    op.create_index(op.f("ix_users_email"), "users", ["email"], unique=True)
+
+    op.create_table(
+        "chatbot_setting",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("tone_examples", sa.JSON(), nullable=True),
+        sa.Column("persona", sa.String(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id"),
+    )
+
+    op.create_table(
+        "portfolios",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("name", sa.String(), nullable=True),
+        sa.Column("theme", sa.String(), nullable=True),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "DELETED",
+                "DRAFT",
+                "PENDING",
+                "CONFIRMED",
+                "DRAFT_QNA",
+                "PENDING_QNA",
+                "PUBLISHED",
+                "FAILED",
+                name="portfoliostatus",
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "source_type",
+            sa.Enum("PDF", "TEXT", name="portfoliosourcetype"),
+            nullable=False,
+        ),
+        sa.Column("source_url", sa.String(length=1024), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    op.create_table(
+        "chat_sessions",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("session_id", sa.String(length=128), nullable=False),
+        sa.Column("portfolio_id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["portfolio_id"], ["portfolios.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_chat_sessions_session_id"),
+        "chat_sessions",
+        ["session_id"],
+        unique=False,
+    )
+
+    op.create_table(
+        "portfolio_items",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("portfolio_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "type",
+            sa.Enum(
+                "INTRODUCTION",
+                "EXPERIENCE",
+                "PROJECT",
+                "SKILLS",
+                "EDUCATION",
+                "CONTACT",
+                name="portfolioitemtype",
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "status",
+            sa.Enum("DELETED", "PENDING", "CONFIRMED", name="portfolioitemstatus"),
+            nullable=False,
+        ),
+        sa.Column("topic", sa.String(length=255), nullable=True),
+        sa.Column("start_date", sa.Date(), nullable=True),
+        sa.Column("end_date", sa.Date(), nullable=True),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("tech_stack", sa.ARRAY(sa.String()), nullable=True),
+        sa.Column("embedding", Vector(768), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["portfolio_id"], ["portfolios.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    op.create_table(
+        "chat_messages",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column(
+            "type",
+            sa.Enum(
+                "TECH",
+                "PERSONAL",
+                "EDUCATION",
+                "SUGGEST",
+                "CONTACT",
+                "NO_INFO",
+                "ETC",
+                name="chatmessagetype",
+            ),
+            nullable=False,
+        ),
+        sa.Column("chat_session_id", sa.UUID(), nullable=False),
+        sa.Column("question", sa.Text(), nullable=False),
+        sa.Column("answer", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["chat_session_id"], ["chat_sessions.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    op.create_table(
+        "qnas",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("question", sa.Text(), nullable=False),
+        sa.Column("answer", sa.Text(), nullable=False),
+        sa.Column("embedding", Vector(768), nullable=True),
+        sa.Column(
+            "status",
+            sa.Enum("PENDING", "CONFIRMED", "DELETED", name="qnastatus"),
+            nullable=False,
+        ),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("portfolio_item_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["portfolio_item_id"], ["portfolio_items.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("qnas")
+    op.drop_table("chat_messages")
+    op.drop_table("portfolio_items")
+    op.drop_index(op.f("ix_chat_sessions_session_id"), table_name="chat_sessions")
+    op.drop_table("chat_sessions")
+    op.drop_table("portfolios")
+    op.drop_table("chatbot_setting")
+    op.drop_index(op.f("ix_users_email"), table_name="users")
+    op.drop_table("users")
+    for enum_type in ENUM_TYPES:
+        sa.Enum(name=enum_type).drop(op.get_bind(), checkfirst=True)
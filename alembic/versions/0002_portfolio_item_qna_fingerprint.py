@@ -0,0 +1,33 @@
+"""add portfolio_items.qna_fingerprint
+
+Q&A 재생성 시 내용이 바뀐 항목만 다시 생성하기 위한 해시 컬럼입니다.
+create_all 은 기존 테이블에 컬럼을 추가하지 않으므로 이미 운영 중인 DB에는 이 리비전이 필요합니다.
+기존 행은 NULL로 남고, Q&A 재생성 시 이미 Q&A가 있는 항목은 변경되지 않은 것으로 보고 지문만 기록합니다.
+
+Alembic 도입 전에는 이 컬럼이 모델에만 추가되어, 그 사이 create_all 로 새로 만든 DB에는 컬럼이 이미 있고
+기존 DB에는 없습니다. 두 경우 모두 `alembic stamp 0001` 후 업그레이드할 수 있도록 IF NOT EXISTS 로 추가합니다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 00:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE portfolio_items "
+        "ADD COLUMN IF NOT EXISTS qna_fingerprint VARCHAR(64)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE portfolio_items DROP COLUMN IF EXISTS qna_fingerprint")
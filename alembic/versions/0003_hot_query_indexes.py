@@ -0,0 +1,50 @@
+"""add indexes for hot CRUD filters
+
+포트폴리오/항목/Q&A/채팅 메시지 조회가 외래 키와 status 로 필터링하지만 인덱스가 없어
+테이블이 커질수록 순차 스캔이 됩니다.
+
+status 조건은 asyncpg 바인드 파라미터(status <> $1)로 전달되어, 준비된 문장의 generic plan 에서는
+planner 가 부분 인덱스(WHERE status <> 'DELETED')의 조건을 증명하지 못합니다.
+그래서 부분 인덱스 대신 (외래 키, status) 복합 인덱스를 사용합니다.
+scripts/check_query_plans.py 로 custom/generic plan 모두 인덱스를 쓰는지 확인합니다.
+
+운영 중인 테이블의 쓰기를 막지 않도록 CREATE INDEX CONCURRENTLY 로 만듭니다.
+(트랜잭션 밖에서 실행해야 하므로 autocommit_block 사용)
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 00:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ("ix_portfolios_user_id_status", "portfolios", ["user_id", "status"]),
+    (
+        "ix_portfolio_items_portfolio_id_status",
+        "portfolio_items",
+        ["portfolio_id", "status"],
+    ),
+    ("ix_qnas_portfolio_item_id_status", "qnas", ["portfolio_item_id", "status"]),
+    ("ix_qnas_user_id", "qnas", ["user_id"]),
+    ("ix_chat_messages_chat_session_id", "chat_messages", ["chat_session_id"]),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
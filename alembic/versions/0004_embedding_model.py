@@ -0,0 +1,44 @@
+"""add embedding_model to portfolio_items / qnas
+
+저장된 임베딩을 만든 모델 이름입니다. EMBEDDING_MODEL 을 바꾸면 기존 벡터와 새 벡터가
+같은 공간에 섞여 유사도 검색이 무의미해지므로, 서버/워커는 시작할 때 이 값이 현재 모델과
+다른 벡터가 남아 있으면 시작하지 않습니다. (scripts/reembed.py 로 다시 임베딩)
+
+기존 벡터는 모두 기본 모델(gemini-embedding-001)로 만들어졌으므로 그 이름으로 채웁니다.
+다른 모델을 쓰던 배포는 upgrade 후 값을 직접 고치거나 재임베딩하세요.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 00:00:00
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("portfolio_items", "qnas")
+LEGACY_EMBEDDING_MODEL = "gemini-embedding-001"
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.add_column(
+            table, sa.Column("embedding_model", sa.String(length=255), nullable=True)
+        )
+        op.execute(
+            sa.text(
+                f"UPDATE {table} SET embedding_model = :model "
+                "WHERE embedding IS NOT NULL"
+            ).bindparams(model=LEGACY_EMBEDDING_MODEL)
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.drop_column(table, "embedding_model")
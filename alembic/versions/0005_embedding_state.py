@@ -0,0 +1,42 @@
+"""add embedding_state to portfolio_items / qnas
+
+확정된 항목/Q&A의 임베딩 생성 상태(EMBEDDING, READY, FAILED)입니다.
+이전에는 확정 시 embedding 을 NULL 로 비워 "생성 중"을 표시했기 때문에, 임베딩 작업이
+dead-letter로 옮겨지면 행이 검색에서 빠진 채 다시 생성할 방법이 없었습니다.
+이제 기존 벡터는 새 벡터를 저장할 때까지 유지하고, 생성 상태는 이 컬럼으로 관리합니다.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 00:00:00
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("portfolio_items", "qnas")
+embedding_status = sa.Enum("EMBEDDING", "READY", "FAILED", name="embeddingstatus")
+
+
+def upgrade() -> None:
+    embedding_status.create(op.get_bind(), checkfirst=True)
+    for table in TABLES:
+        op.add_column(table, sa.Column("embedding_state", embedding_status, nullable=True))
+        # 확정된 행만 상태를 가집니다. 임베딩이 없는 확정 행은 다시 생성할 수 있도록 EMBEDDING 으로 둡니다.
+        op.execute(
+            f"UPDATE {table} SET embedding_state = CASE "
+            "WHEN embedding IS NULL THEN 'EMBEDDING' ELSE 'READY' END::embeddingstatus "
+            "WHERE status = 'CONFIRMED'"
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.drop_column(table, "embedding_state")
+    embedding_status.drop(op.get_bind(), checkfirst=True)
@@ -1,4 +1,5 @@
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 from app.api.v1.endpoints import (
     auth,
     portfolio,
@@ -8,9 +9,10 @@ from app.api.v1.endpoints import (
     chat_message,
     chat_session,
     user,
+    job,
 )
 
-api_router = APIRouter()
+api_router = APIRouter(default_response_class=ORJSONResponse)
 
 api_router.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 api_router.include_router(user.router, prefix="/user", tags=["User"])
@@ -25,3 +27,4 @@ api_router.include_router(
 )
 
 api_router.include_router(chat_message.router, prefix="/chat-message", tags=["Chat"])
+api_router.include_router(job.router, prefix="/job", tags=["Job"])
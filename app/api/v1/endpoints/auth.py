@@ -1,7 +1,6 @@
 from fastapi import APIRouter, Depends, Body
 from app.schemas.token_schema import Token
-from app.models.user import User
-from app.schemas.user_schema import UserRead
+from app.schemas.user_schema import UserRead, UserSnapshot
 from app.services.auth_service import (
     AuthService,
     get_current_user,
@@ -22,7 +21,7 @@ async def login_with_google(
 
 @router.post("/refresh", response_model=Token, tags=["Authentication"])
 async def refresh_token(
-    current_user: User = Depends(get_current_user_from_refresh_token),
+    current_user: UserSnapshot = Depends(get_current_user_from_refresh_token),
     auth_service: AuthService = Depends(),
 ):
     return {
@@ -34,7 +33,7 @@ async def refresh_token(
 
 @router.get("/user", response_model=UserRead)
 async def get_user_from_token(
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
 ) -> UserRead:
     return UserRead(
         id=current_user.id,
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends
 
 from app.schemas.chatbot_setting_schema import ChatbotSettingRead, ChatbotSettingUpdate
-from app.models.user import User
+from app.schemas.user_schema import UserSnapshot
 from app.services.auth_service import get_current_user
 from app.services.chatbot_setting_service import ChatbotSettingService
 
@@ -10,7 +10,7 @@ router = APIRouter()
 
 @router.get("/tone", response_model=ChatbotSettingRead, summary="챗봇 어조 설정 조회")
 async def get_chatbot_settings(
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     service: ChatbotSettingService = Depends(),
 ):
     return await service.get_settings(current_user=current_user)
@@ -19,7 +19,7 @@ async def get_chatbot_settings(
 @router.put("/tone", response_model=ChatbotSettingRead, summary="챗봇 어조 설정 수정")
 async def update_chatbot_settings(
     service: ChatbotSettingService = Depends(),
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     *,
     settings_in: ChatbotSettingUpdate,
 ):
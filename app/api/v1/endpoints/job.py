@@ -0,0 +1,42 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from app.schemas.user_schema import UserSnapshot
+from app.services.auth_service import get_current_user
+from app.services.job_progress import JobProgress, format_sse, get_job_progress
+
+
+router = APIRouter()
+
+
+@router.get("/{job_id}/progress")
+async def stream_job_progress(
+    current_user: UserSnapshot = Depends(get_current_user),
+    job_progress: JobProgress = Depends(get_job_progress),
+    *,
+    job_id: str,
+) -> StreamingResponse:
+    """
+    PDF 포트폴리오 생성 / Q&A 생성 작업의 진행 상황을 Server-Sent Events로 전달합니다.
+
+    - 이벤트 이름은 단계(queued, download, extract, structure, save, qna, retrying, done, failed)입니다.
+    - data는 `{job_id, stage, percent, detail, timestamp}` JSON이며, done/failed 이후 스트림이 종료됩니다.
+    - 연결 직후 현재 단계가 한 번 전달되므로 재연결 시에도 상태를 복원할 수 있습니다.
+    - 진행 상황이 만료되었거나 JOB_PROGRESS_STREAM_MAX_SECONDS 가 지나면 종료 이벤트 없이 스트림이 끝납니다.
+    """
+    owner = await job_progress.get_owner(job_id)
+    if owner != str(current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="작업을 찾을 수 없거나 해당 작업에 접근할 권한이 없습니다.",
+        )
+
+    async def event_stream():
+        async for event in job_progress.stream(job_id):
+            yield format_sse(event)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
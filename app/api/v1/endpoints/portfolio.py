@@ -5,8 +5,9 @@ from fastapi import (
     Depends,
     Body,
     HTTPException,
+    Request,
+    Response,
     status,
-    BackgroundTasks,
 )
 
 from app.schemas.portfolio_schema import (
@@ -18,10 +19,13 @@ from app.schemas.portfolio_schema import (
     PortfolioCreateFromText,
     PortfolioCreateWithPdf,
     PortfolioCreationResponse,
+    PortfolioConfirmResponse,
 )
-from app.models.user import User
+from app.core.etag import etag_matches, make_etag, not_modified
+from app.schemas.user_schema import UserSnapshot
 from app.services.auth_service import get_current_user
 from app.services.portfolio_service import PortfolioService
+from app.services.portfolio_version import PortfolioVersion, get_portfolio_version
 from app.services.storage_service import StorageService
 
 router = APIRouter()
@@ -29,7 +33,7 @@ router = APIRouter()
 
 @router.post("/upload-url", response_model=UploadURLResponse)
 async def get_upload_url(
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     storage_service: StorageService = Depends(),
     *,
     file_name: str = Body(..., embed=True, description="업로드할 파일의 원본 이름"),
@@ -51,20 +55,26 @@ async def get_upload_url(
 
 @router.get("/published/{nickname}", response_model=PublishedPortfolioRead)
 async def get_published_portfolio_by_email(
+    request: Request,
     nickname: str,
     service: PortfolioService = Depends(),
-) -> PublishedPortfolioRead:
+) -> Response:
     """
-    이메일과 포트폴리오 ID로 PUBLISHED 포트폴리오를 조회합니다. (공개)
+    닉네임으로 PUBLISHED 포트폴리오를 조회합니다. (공개)
+    미리 직렬화된 캐시 JSON을 그대로 반환하며, ETag는 응답 본문의 해시입니다.
     """
-    return await service.get_published_portfolio_by_email(
-        nickname=nickname
+    body = await service.get_published_portfolio_by_email(nickname=nickname)
+    etag = make_etag(body)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return Response(
+        content=body, media_type="application/json", headers={"ETag": etag}
     )
 
 
 @router.post("/text", response_model=PortfolioRead)
 async def create_portfolio_from_text(
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     service: PortfolioService = Depends(),
     *,
     portfolio_in: PortfolioCreateFromText,
@@ -83,8 +93,7 @@ async def create_portfolio_from_text(
     response_model=PortfolioCreationResponse,
 )
 async def create_portfolio_from_pdf(
-    background_tasks: BackgroundTasks,
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     service: PortfolioService = Depends(),
     *,
     portfolio_in: PortfolioCreateWithPdf,
@@ -93,38 +102,27 @@ async def create_portfolio_from_pdf(
     업로드된 PDF 파일로부터 포트폴리오 생성을 시작합니다.
 
     1. `/upload-url`을 통해 받은 `file_path`와 포트폴리오 이름을 전달합니다.
-    2. 즉시 `DRAFT` 상태의 포트폴리오 정보를 반환하고, 백그라운드에서 PDF 처리 및 분석을 시작합니다.
+    2. 즉시 `DRAFT` 상태의 포트폴리오 정보를 반환하고, 작업 큐 워커에서 PDF 처리 및 분석을 시작합니다.
     3. 작업이 완료되면 FCM을 통해 사용자에게 알림이 전송됩니다.
+       응답의 `job_id`로 `/job/{job_id}/progress`를 구독하면 단계별 진행 상황을 받을 수 있습니다.
     """
-    draft_portfolio = await service.create_draft_portfolio(
+    return await service.start_portfolio_creation_from_pdf(
         portfolio_in=portfolio_in, current_user=current_user
     )
 
-    background_tasks.add_task(
-        service.create_portfolio_from_pdf_background,
-        portfolio_id=draft_portfolio.id,
-        user_id=current_user.id,
-        file_path=portfolio_in.file_path,
-    )
-
-    return PortfolioCreationResponse(
-        id=draft_portfolio.id,
-        name=draft_portfolio.name,
-        status=draft_portfolio.status,
-        theme=draft_portfolio.theme
-    )
 
-
-@router.post("/{portfolio_id}/confirm", response_model=PortfolioRead)
+@router.post("/{portfolio_id}/confirm", response_model=PortfolioConfirmResponse)
 async def confirm_portfolio(
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     service: PortfolioService = Depends(),
     *,
     portfolio_id: uuid.UUID,
-) -> PortfolioRead:
+) -> PortfolioConfirmResponse:
     """
     PENDING 상태의 포트폴리오를 CONFIRMED 상태로 확정합니다.
-    이 과정에서 각 항목의 임베딩이 생성 및 저장됩니다.
+    각 항목의 임베딩은 백그라운드에서 생성되며, 완료 전까지 embedding_status는 EMBEDDING 입니다.
+    진행 상황은 /job/{job_id}/progress 로 구독할 수 있습니다.
+    임베딩 생성에 실패한(embedding_status=FAILED) 항목이 있으면 다시 호출해 해당 항목만 재시도합니다.
     """
     return await service.confirm_portfolio(
         portfolio_id=portfolio_id, current_user=current_user
@@ -133,7 +131,7 @@ async def confirm_portfolio(
 
 @router.post("/{portfolio_id}/publish", response_model=PortfolioReadWithoutItems)
 async def publish_portfolio(
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     service: PortfolioService = Depends(),
     *,
     portfolio_id: uuid.UUID,
@@ -149,7 +147,7 @@ async def publish_portfolio(
 
 @router.get("", response_model=List[PortfolioReadWithoutItems])
 async def get_portfolios_by_user(
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     service: PortfolioService = Depends(),
 ) -> List[PortfolioReadWithoutItems]:
     """
@@ -160,14 +158,23 @@ async def get_portfolios_by_user(
 
 @router.get("/{portfolio_id}", response_model=PortfolioRead)
 async def get_portfolio_by_id(
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    response: Response,
+    current_user: UserSnapshot = Depends(get_current_user),
     service: PortfolioService = Depends(),
+    portfolio_version: PortfolioVersion = Depends(get_portfolio_version),
     *,
     portfolio_id: uuid.UUID,
 ) -> PortfolioRead:
     """
     ID로 특정 포트폴리오를 조회합니다.
+    If-None-Match가 현재 버전의 ETag와 같으면 포트폴리오를 읽지 않고 304를 반환합니다.
     """
+    etag = await portfolio_version.etag("portfolio", portfolio_id, current_user.id)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    if etag:
+        response.headers["ETag"] = etag
     return await service.get_portfolio_by_id(
         portfolio_id=portfolio_id, current_user=current_user
     )
@@ -175,7 +182,7 @@ async def get_portfolio_by_id(
 
 @router.delete("/{portfolio_id}")
 async def delete_portfolio(
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     service: PortfolioService = Depends(),
     *,
     portfolio_id: uuid.UUID,
@@ -190,7 +197,7 @@ async def delete_portfolio(
 
 @router.put("/{portfolio_id}", response_model=PortfolioReadWithoutItems)
 async def update_portfolio(
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     service: PortfolioService = Depends(),
     *,
     portfolio_id: uuid.UUID,
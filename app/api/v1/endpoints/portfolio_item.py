@@ -1,6 +1,6 @@
 from typing import List
 import uuid
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 
 from app.schemas.portfolio_item_schema import (
     PortfolioItemRead,
@@ -8,16 +8,18 @@ from app.schemas.portfolio_item_schema import (
     PortfolioItemsUpdate,
     PortfolioItemDelete,
 )
-from app.models.user import User
+from app.core.etag import etag_matches, not_modified
+from app.schemas.user_schema import UserSnapshot
 from app.services.auth_service import get_current_user
 from app.services.portfolio_item_service import PortfolioItemService
+from app.services.portfolio_version import PortfolioVersion, get_portfolio_version
 
 router = APIRouter()
 
 
 @router.post("", response_model=List[PortfolioItemRead])
 async def create_portfolio_items(
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     service: PortfolioItemService = Depends(),
     *,
     portfolio_items_create: PortfolioItemsCreate,
@@ -29,13 +31,24 @@ async def create_portfolio_items(
 
 @router.get("/by-portfolio/{portfolio_id}", response_model=List[PortfolioItemRead])
 async def get_portfolio_items_by_portfolio_id(
+    request: Request,
+    response: Response,
     portfolio_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     service: PortfolioItemService = Depends(),
+    portfolio_version: PortfolioVersion = Depends(get_portfolio_version),
 ) -> List[PortfolioItemRead]:
     """
     포트폴리오 ID로 포트폴리오 항목 목록을 조회합니다.
+    If-None-Match가 현재 버전의 ETag와 같으면 항목을 읽지 않고 304를 반환합니다.
     """
+    etag = await portfolio_version.etag(
+        "portfolio_items", portfolio_id, current_user.id
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    if etag:
+        response.headers["ETag"] = etag
     return await service.get_portfolio_items_by_portfolio_id(
         portfolio_id=portfolio_id, current_user=current_user
     )
@@ -43,7 +56,7 @@ async def get_portfolio_items_by_portfolio_id(
 
 @router.put("", response_model=List[PortfolioItemRead])
 async def update_portfolio_items(
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     service: PortfolioItemService = Depends(),
     *,
     items_in: PortfolioItemsUpdate,
@@ -59,7 +72,7 @@ async def update_portfolio_items(
 
 @router.delete("")
 async def delete_portfolio_items(
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     service: PortfolioItemService = Depends(),
     *,
     portfolio_delete: PortfolioItemDelete,
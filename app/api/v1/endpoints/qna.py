@@ -1,11 +1,13 @@
 import uuid
-from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from typing import List
 
-from app.schemas.portfolio_schema import PortfolioReadWithoutItems
+from app.schemas.portfolio_schema import PortfolioJobResponse
 from app.schemas.qna_schema import QnARead, QnAsConfirm, QnAsDelete, QnAsUpdate
-from app.models.user import User
+from app.core.etag import etag_matches, not_modified
+from app.schemas.user_schema import UserSnapshot
 from app.services.auth_service import get_current_user
+from app.services.portfolio_version import PortfolioVersion, get_portfolio_version
 from app.services.qna_service import QnAService
 
 router = APIRouter()
@@ -14,21 +16,21 @@ router = APIRouter()
 @router.post(
     "/generate",
     summary="포트폴리오 기반 Q&A 생성 (백그라운드)",
-    response_model=PortfolioReadWithoutItems,
+    response_model=PortfolioJobResponse,
 )
 async def generate_qna(
-    background_tasks: BackgroundTasks,
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     service: QnAService = Depends(),
     *,
     portfolio_id: uuid.UUID,
-) -> PortfolioReadWithoutItems:
+) -> PortfolioJobResponse:
     """
-    사용자의 모든 포트폴리오 항목에 대한 Q&A 생성을 백그라운드 작업으로 시작합니다.
-    API는 즉시 응답을 반환하며, 실제 생성 작업은 백그라운드에서 수행됩니다.
+    사용자의 모든 포트폴리오 항목에 대한 Q&A 생성을 작업 큐에 등록합니다.
+    마지막 생성 이후 topic/content/tech_stack이 바뀐 항목만 다시 생성하며, 나머지 Q&A는 유지됩니다.
+    API는 즉시 응답을 반환하며, 실제 생성 작업은 작업 큐 워커에서 수행됩니다.
+    응답의 `job_id`로 `/job/{job_id}/progress`를 구독해 진행 상황을 받을 수 있습니다.
     """
     return await service.add_qna_generation_task(
-        background_tasks=background_tasks,
         current_user=current_user,
         portfolio_id=portfolio_id,
     )
@@ -40,7 +42,7 @@ async def generate_qna(
 #     response_model=List[QnARead],
 # )
 # async def generate_qna_sync(
-#     current_user: User = Depends(get_current_user),
+#     current_user: UserSnapshot = Depends(get_current_user),
 #     service: QnAService = Depends(),
 #     *,
 #     portfolio_id: uuid.UUID,
@@ -59,11 +61,29 @@ async def generate_qna(
 
 @router.get("/{portfolio_id}", response_model=List[QnARead], summary="내 Q&A 목록 조회")
 async def get_qnas_by_portfolio(
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    response: Response,
+    current_user: UserSnapshot = Depends(get_current_user),
     service: QnAService = Depends(),
+    portfolio_version: PortfolioVersion = Depends(get_portfolio_version),
     *,
     portfolio_id: uuid.UUID,
 ):
+    """
+    포트폴리오의 Q&A 목록을 조회합니다.
+    Q&A 생성 중에는 완료된 항목의 Q&A가 먼저 포함되며,
+    `X-QnA-Generation-Status: in_progress` 헤더로 생성이 진행 중임을 알립니다.
+    If-None-Match가 현재 버전의 ETag와 같으면 Q&A를 읽지 않고 304를 반환합니다.
+    """
+    etag = await portfolio_version.etag("qnas", portfolio_id, current_user.id)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    if etag:
+        response.headers["ETag"] = etag
+    if await service.is_qna_generation_in_progress(
+        portfolio_id=portfolio_id, current_user=current_user
+    ):
+        response.headers["X-QnA-Generation-Status"] = "in_progress"
     return await service.get_qnas_by_portfolio(
         current_user=current_user, portfolio_id=portfolio_id
     )
@@ -71,7 +91,7 @@ async def get_qnas_by_portfolio(
 
 @router.put("/confirm", response_model=List[QnARead], summary="Q&A 확정")
 async def confirm_qnas(
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     service: QnAService = Depends(),
     *,
     qnas_confirm: QnAsConfirm,
@@ -83,7 +103,7 @@ async def confirm_qnas(
 
 @router.put("/bulk", response_model=List[QnARead], summary="Q&A 벌크 수정")
 async def update_qnas(
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     service: QnAService = Depends(),
     *,
     qnas_in: QnAsUpdate,
@@ -93,7 +113,7 @@ async def update_qnas(
 
 @router.delete("", response_model=List[QnARead], summary="Q&A 벌크 삭제")
 async def delete_qnas(
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     service: QnAService = Depends(),
     *,
     qnas_delete: QnAsDelete,
@@ -1,7 +1,6 @@
 from fastapi import APIRouter, Depends
 
-from app.models.user import User
-from app.schemas.user_schema import CheckNickname, UserRead, UserUpdate
+from app.schemas.user_schema import CheckNickname, UserRead, UserSnapshot, UserUpdate
 from app.services.auth_service import get_current_user
 from app.services.user_service import UserService
 
@@ -11,7 +10,7 @@ router = APIRouter()
 
 @router.put("", response_model=UserRead)
 async def update_user(
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     user_service: UserService = Depends(),
     *,
     user_update: UserUpdate,
@@ -23,7 +22,7 @@ async def update_user(
 
 @router.get("/check/nickname")
 async def check_nickname(
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     user_service: UserService = Depends(),
     *,
     nickname: str,
@@ -1,3 +1,4 @@
+from typing import List, Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -10,6 +11,20 @@ class Settings(BaseSettings):
 
     # Database and Services
     DATABASE_URL: str = Field(..., env="DATABASE_URL")
+    # 읽기 전용 복제본 (미설정 시 모든 조회가 DATABASE_URL을 사용)
+    DATABASE_READ_URL: Optional[str] = Field(None, env="DATABASE_READ_URL")
+    DATABASE_READ_MAX_LAG_SECONDS: float = Field(
+        5.0, env="DATABASE_READ_MAX_LAG_SECONDS"
+    )
+    DATABASE_READ_LAG_CHECK_INTERVAL_SECONDS: float = Field(
+        5.0, env="DATABASE_READ_LAG_CHECK_INTERVAL_SECONDS"
+    )
+    # 시작 시 alembic_version 이 head 인지 확인 (스키마 변경은 alembic upgrade head 로 적용)
+    DATABASE_SCHEMA_CHECK_ENABLED: bool = Field(
+        True, env="DATABASE_SCHEMA_CHECK_ENABLED"
+    )
+    # 한 번에 이 행 수 이상을 적재하면 INSERT ... VALUES 대신 COPY 경로를 사용 (scripts/benchmark_bulk_insert.py)
+    BULK_COPY_MIN_ROWS: int = Field(1000, env="BULK_COPY_MIN_ROWS")
     REDIS_URL: str = Field(..., env="REDIS_URL")
     REDIS_PASSWORD: str = Field(..., env="REDIS_PASSWORD")
 
@@ -26,6 +41,25 @@ class Settings(BaseSettings):
 
     # Google Auth
     GOOGLE_CLIENT_ID: str = Field(..., env="GOOGLE_CLIENT_ID")
+    GOOGLE_JWKS_DEFAULT_TTL_SECONDS: int = Field(
+        3600, env="GOOGLE_JWKS_DEFAULT_TTL_SECONDS"
+    )  # Cache-Control이 없을 때
+    GOOGLE_JWKS_REFRESH_MARGIN_SECONDS: int = Field(
+        600, env="GOOGLE_JWKS_REFRESH_MARGIN_SECONDS"
+    )
+    GOOGLE_JWKS_MIN_REFETCH_SECONDS: int = Field(
+        30, env="GOOGLE_JWKS_MIN_REFETCH_SECONDS"
+    )
+    GOOGLE_JWKS_HTTP_TIMEOUT_SECONDS: float = Field(
+        5.0, env="GOOGLE_JWKS_HTTP_TIMEOUT_SECONDS"
+    )
+
+    # Storage
+    STORAGE_BACKEND: str = Field("gcs", env="STORAGE_BACKEND")  # gcs or local
+    LOCAL_STORAGE_PATH: str = Field("./storage", env="LOCAL_STORAGE_PATH")
+    STORAGE_DOWNLOAD_CHUNK_SIZE: int = Field(
+        4 * 1024 * 1024, env="STORAGE_DOWNLOAD_CHUNK_SIZE"
+    )
 
     # GCS
     GCS_BUCKET_NAME: str = Field(..., env="GCS_BUCKET_NAME")
@@ -33,12 +67,100 @@ class Settings(BaseSettings):
 
     # Firebase
     FIREBASE_CREDENTIALS: str = Field(..., env="FIREBASE_CREDENTIALS")
+    NOTIFICATION_BACKEND: str = Field(
+        "firebase", env="NOTIFICATION_BACKEND"
+    )  # firebase or local
+    NOTIFICATION_QUEUE_SIZE: int = Field(1000, env="NOTIFICATION_QUEUE_SIZE")
+    NOTIFICATION_BATCH_SIZE: int = Field(100, env="NOTIFICATION_BATCH_SIZE")
+    NOTIFICATION_BATCH_WINDOW_MS: int = Field(50, env="NOTIFICATION_BATCH_WINDOW_MS")
+    NOTIFICATION_MAX_ATTEMPTS: int = Field(3, env="NOTIFICATION_MAX_ATTEMPTS")
+    NOTIFICATION_RETRY_BACKOFF_SECONDS: float = Field(
+        1.0, env="NOTIFICATION_RETRY_BACKOFF_SECONDS"
+    )
+
+    # PDF
+    PDF_EXTRACT_WORKERS: int = Field(2, env="PDF_EXTRACT_WORKERS")
+    PDF_EXTRACT_PAGES_PER_TASK: int = Field(8, env="PDF_EXTRACT_PAGES_PER_TASK")
+    PDF_RESULT_CACHE_ENABLED: bool = Field(True, env="PDF_RESULT_CACHE_ENABLED")
+    PDF_RESULT_CACHE_TTL_SECONDS: int = Field(
+        30 * 24 * 3600, env="PDF_RESULT_CACHE_TTL_SECONDS"
+    )
+
+    # Published portfolio
+    PUBLISHED_PORTFOLIO_CACHE_ENABLED: bool = Field(
+        True, env="PUBLISHED_PORTFOLIO_CACHE_ENABLED"
+    )
+    PUBLISHED_PORTFOLIO_CACHE_TTL_SECONDS: int = Field(
+        24 * 3600, env="PUBLISHED_PORTFOLIO_CACHE_TTL_SECONDS"
+    )
+
+    # Portfolio ETag version
+    PORTFOLIO_VERSION_TTL_SECONDS: int = Field(
+        30 * 24 * 3600, env="PORTFOLIO_VERSION_TTL_SECONDS"
+    )  # 마지막 변경 후 이 시간이 지나면 ETag 없이 응답
+
+    # Authenticated user cache
+    USER_SNAPSHOT_CACHE_ENABLED: bool = Field(True, env="USER_SNAPSHOT_CACHE_ENABLED")
+    USER_SNAPSHOT_CACHE_TTL_SECONDS: int = Field(
+        300, env="USER_SNAPSHOT_CACHE_TTL_SECONDS"
+    )  # Redis
+    USER_SNAPSHOT_LOCAL_TTL_SECONDS: float = Field(
+        5, env="USER_SNAPSHOT_LOCAL_TTL_SECONDS"
+    )  # 프로세스 내 캐시
+    USER_SNAPSHOT_LOCAL_MAX_SIZE: int = Field(10000, env="USER_SNAPSHOT_LOCAL_MAX_SIZE")
+
+    # Portfolio structuring
+    PORTFOLIO_STRUCTURE_MODE: str = Field(
+        "auto", env="PORTFOLIO_STRUCTURE_MODE"
+    )  # single, chunked or auto
+    PORTFOLIO_CHUNK_MAX_CHARS: int = Field(12000, env="PORTFOLIO_CHUNK_MAX_CHARS")
+    PORTFOLIO_STRUCTURE_CONCURRENCY: int = Field(
+        4, env="PORTFOLIO_STRUCTURE_CONCURRENCY"
+    )
+
+    # QnA generation
+    QNA_GENERATION_CONCURRENCY: int = Field(4, env="QNA_GENERATION_CONCURRENCY")
+    QNA_BATCH_ENABLED: bool = Field(True, env="QNA_BATCH_ENABLED")
+    QNA_BATCH_TOKEN_BUDGET: int = Field(3000, env="QNA_BATCH_TOKEN_BUDGET")
+    QNA_BATCH_MAX_ITEMS: int = Field(6, env="QNA_BATCH_MAX_ITEMS")
+
+    # Job queue
+    JOB_WORKER_CONCURRENCY: int = Field(4, env="JOB_WORKER_CONCURRENCY")
+    JOB_MAX_ATTEMPTS: int = Field(3, env="JOB_MAX_ATTEMPTS")
+    JOB_RETRY_BACKOFF_SECONDS: int = Field(10, env="JOB_RETRY_BACKOFF_SECONDS")
+    JOB_RETRY_BACKOFF_MAX_SECONDS: int = Field(
+        300, env="JOB_RETRY_BACKOFF_MAX_SECONDS"
+    )
+    JOB_WORKER_HEARTBEAT_TTL: int = Field(30, env="JOB_WORKER_HEARTBEAT_TTL")
+    JOB_PROGRESS_TTL_SECONDS: int = Field(86400, env="JOB_PROGRESS_TTL_SECONDS")
+    JOB_PROGRESS_KEEPALIVE_SECONDS: int = Field(
+        15, env="JOB_PROGRESS_KEEPALIVE_SECONDS"
+    )
+    # SSE 연결 최대 유지 시간 (넘으면 종료하고, 클라이언트는 재연결해 마지막 이벤트부터 이어 받음)
+    JOB_PROGRESS_STREAM_MAX_SECONDS: int = Field(
+        600, env="JOB_PROGRESS_STREAM_MAX_SECONDS"
+    )
 
     # API
     API_V1_STR: str = Field("/api/v1", env="API_V1_STR")
+    # 시작 직후 백그라운드에서 LangChain 등 무거운 SDK를 미리 import
+    WARMUP_ENABLED: bool = Field(True, env="WARMUP_ENABLED")
+    GZIP_MINIMUM_SIZE: int = Field(1024, env="GZIP_MINIMUM_SIZE")  # bytes
+    GZIP_COMPRESS_LEVEL: int = Field(6, env="GZIP_COMPRESS_LEVEL")
+    # /metrics 조회용 Bearer 토큰 (미설정 시 /metrics 는 404)
+    METRICS_TOKEN: Optional[str] = Field(None, env="METRICS_TOKEN")
 
     # Model
-    EMBEDDING_MODEL: str = Field("gemini-embedding-001", env="EMBEDDING_MODEL")
+    EMBEDDING_MODEL: str = Field(
+        "gemini-embedding-001", env="EMBEDDING_MODEL"
+    )  # Gemini 모델명 또는 onnx:<모델 디렉터리>
+    EMBEDDING_DIMENSION: int = Field(768, env="EMBEDDING_DIMENSION")
+    EMBEDDING_BATCH_WINDOW_MS: int = Field(5, env="EMBEDDING_BATCH_WINDOW_MS")
+    EMBEDDING_MAX_BATCH_SIZE: int = Field(100, env="EMBEDDING_MAX_BATCH_SIZE")
+    EMBEDDING_MAX_CONCURRENCY: int = Field(4, env="EMBEDDING_MAX_CONCURRENCY")
+    EMBEDDING_ONNX_WORKERS: int = Field(2, env="EMBEDDING_ONNX_WORKERS")
+    EMBEDDING_ONNX_THREADS: int = Field(1, env="EMBEDDING_ONNX_THREADS")
+    EMBEDDING_ONNX_MAX_LENGTH: int = Field(512, env="EMBEDDING_ONNX_MAX_LENGTH")
     PDF_PARSING_LLM_MODEL: str = Field(
         "gemini-2.5-flash-lite", env="PDF_PARSING_LLM_MODEL"
     )
@@ -50,6 +172,19 @@ class Settings(BaseSettings):
     )
     CHAT_LLM_MODEL: str = Field("gemini-2.5-flash", env="CHAT_LLM_MODEL")
     SUMMARIZE_LLM_MODEL: str = Field("gemini-2.5-flash-lite", env="SUMMARIZE_LLM_MODEL")
+    CHAT_LITE_LLM_MODEL: str = Field(
+        "gemini-2.5-flash-lite", env="CHAT_LITE_LLM_MODEL"
+    )
+
+    # Chat model routing
+    CHAT_ROUTING_ENABLED: bool = Field(True, env="CHAT_ROUTING_ENABLED")
+    CHAT_ROUTING_LITE_TYPES: List[str] = Field(
+        ["CONTACT", "EDUCATION", "ETC"], env="CHAT_ROUTING_LITE_TYPES"
+    )
+    CHAT_ROUTING_LITE_MAX_ITEMS: int = Field(2, env="CHAT_ROUTING_LITE_MAX_ITEMS")
+    CHAT_ROUTING_LITE_MAX_QUESTION_LENGTH: int = Field(
+        80, env="CHAT_ROUTING_LITE_MAX_QUESTION_LENGTH"
+    )
 
     class Config:
         env_file = ".env"
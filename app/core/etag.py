@@ -0,0 +1,33 @@
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+from app.core.metrics import metrics
+
+
+def make_etag(value: str) -> str:
+    """
+    value의 SHA-256으로 만든 약한 ETag.
+    GZipMiddleware가 같은 ETag로 gzip/무압축 본문을 모두 내보내므로 바이트 단위로 같다는
+    강한 ETag 대신 의미상 같다는 약한 ETag(W/)를 사용합니다.
+    """
+    return f'W/"{hashlib.sha256(value.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def etag_matches(request: Request, etag: Optional[str]) -> bool:
+    """If-None-Match 헤더가 etag와 일치하는지 확인합니다. (약한 비교, RFC 9110)"""
+    if not etag:
+        return False
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def not_modified(etag: str) -> Response:
+    metrics.increment("http_not_modified_total")
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
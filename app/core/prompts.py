@@ -105,6 +105,25 @@ tech_stack: {tech_stack}
 content: {content}
 """
 
+# 배치 프롬프트는 단건 프롬프트의 Phase 1~2 지침을 그대로 쓰고, 배치 입력 안내와 결과 형식만 바꿉니다.
+GENERATE_BATCH_QNA_SYSTEM_PROMPT = (
+    GENERATE_QNA_SYSTEM_PROMPT.split("**Phase 3: 최종 JSON 취합")[0]
+    + """### 여러 항목 처리 (Batch)
+이번에는 여러 개의 포트폴리오 항목이 한 번에 주어집니다. 위 지침을 항목마다 **각각 독립적으로** 적용하며, 모든 답변은 반드시 **해당 항목**에 명시된 내용에 기반하여야 하고 다른 항목의 내용을 섞어서는 안 됩니다.
+
+**Phase 3: 최종 JSON 취합 (Final JSON Assembly)**
+1.  항목마다 `item_id`를 입력에 주어진 값 그대로 사용하고, 해당 항목의 Q&A 세트(`LLMQnASet` 객체들)를 `qnas` 리스트에 담아 `results`에 추가합니다.
+2.  입력된 모든 항목에 대해 정확히 하나의 결과를 만들어야 하며, 항목을 누락하거나 합치지 않습니다.
+3.  서론, 결론, 설명 없이 최종 JSON 객체만을 코드 블록에 담아 출력합니다.
+{format_instructions}
+"""
+)
+
+GENERATE_BATCH_QNA_USER_PROMPT = """
+주어진 항목들은 다음과 같습니다.
+{items}
+"""
+
 VECTOR_QUERY_GENERATOR_SYSTEM_PROMPT = """
 당신은 사용자의 질문을 분석하여 백엔드 시스템이 정보를 검색하는 데 사용할 검색용 질문(Query)을 생성하는 **'핵심 질문 분석가(Query Decomposition Expert)'**입니다.
 
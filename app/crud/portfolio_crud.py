@@ -7,7 +7,7 @@ from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload, aliased
 from pgvector.sqlalchemy import Vector
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.models.portfolio import Portfolio, PortfolioSourceType, PortfolioStatus
 from app.models.portfolio_item import (
     PortfolioItem,
@@ -79,8 +79,9 @@ class PortfolioCRUD:
         return result.scalars().first()
 
     async def get_published_portfolio_by_user_id_with_items(
-        self, *, user_id: uuid.UUID
+        self, *, user_id: uuid.UUID, populate_existing: bool = False
     ) -> Portfolio | None:
+        """populate_existing: 같은 세션에 이미 로드된 포트폴리오/항목도 DB 값으로 다시 채웁니다."""
         result = await self.db.execute(
             select(Portfolio)
             .options(
@@ -94,6 +95,7 @@ class PortfolioCRUD:
                 Portfolio.user_id == user_id,
                 Portfolio.status == PortfolioStatus.PUBLISHED,
             )
+            .execution_options(populate_existing=populate_existing)
         )
         return result.scalars().first()
 
@@ -208,6 +210,8 @@ class PortfolioCRUD:
             .where(
                 items_alias.portfolio_id == portfolio_id,
                 items_alias.status == PortfolioItemStatus.CONFIRMED,
+                # 확정 직후 임베딩이 아직 생성되지 않은 항목은 제외합니다.
+                items_alias.embedding.is_not(None),
             )
             .order_by(
                 items_alias.embedding.l2_distance(
@@ -226,3 +230,10 @@ class PortfolioCRUD:
         )
         results = await self.db.execute(stmt)
         return list(results.scalars().unique().all())
+
+
+class PortfolioReadCRUD(PortfolioCRUD):
+    """읽기 전용 복제본 세션(get_read_db)을 사용하는 PortfolioCRUD. 조회 메서드에만 사용합니다."""
+
+    def __init__(self, db: AsyncSession = Depends(get_read_db)):
+        super().__init__(db)
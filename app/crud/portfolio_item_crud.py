@@ -1,12 +1,14 @@
-from typing import List
+from typing import List, Optional
 import uuid
 from fastapi import Depends
-from sqlalchemy import desc, insert
+from sqlalchemy import desc, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from app.db.bulk_copy import copy_insert
 from app.db.session import get_db
 from app.models.portfolio_item import (
+    EmbeddingStatus,
     PortfolioItem,
     PortfolioItemStatus,
 )
@@ -33,6 +35,50 @@ class PortfolioItemCRUD:
         created_items = result.scalars().all()
         return list(created_items)
 
+    async def copy_create_portfolio_items(
+        self,
+        *,
+        portfolio_items_create: PortfolioItemsCreate,
+        embeddings: Optional[List[List[float]]] = None,
+        embedding_model: Optional[str] = None,
+    ) -> List[uuid.UUID]:
+        """
+        COPY 경로로 포트폴리오 항목을 대량 적재하고 생성된 id 목록을 반환합니다.
+        수천 건 이상의 적재에서 create_portfolio_items 대신 사용합니다.
+        embeddings 를 함께 적재할 때는 만든 모델(embedding_model)도 넘겨야 합니다.
+        """
+        items = portfolio_items_create.portfolio_items
+        ids = [uuid.uuid4() for _ in items]
+        await copy_insert(
+            self.db,
+            PortfolioItem.__table__,
+            (
+                {
+                    **item.model_dump(),
+                    "id": item_id,
+                    "portfolio_id": portfolio_items_create.portfolio_id,
+                    "status": PortfolioItemStatus.PENDING,
+                    "embedding": embeddings[i] if embeddings else None,
+                    "embedding_model": embedding_model if embeddings else None,
+                }
+                for i, (item_id, item) in enumerate(zip(ids, items))
+            ),
+            columns=[
+                "id",
+                "portfolio_id",
+                "type",
+                "status",
+                "topic",
+                "start_date",
+                "end_date",
+                "content",
+                "tech_stack",
+                "embedding",
+                "embedding_model",
+            ],
+        )
+        return ids
+
     async def get_portfolio_item_by_ids(
         self, *, portfolio_item_ids: List[uuid.UUID]
     ) -> List[PortfolioItem]:
@@ -55,20 +101,66 @@ class PortfolioItemCRUD:
         )
         return list(result.scalars().all())
 
+    async def get_portfolio_ids_by_item_ids(
+        self, *, portfolio_item_ids: List[uuid.UUID]
+    ) -> List[uuid.UUID]:
+        result = await self.db.execute(
+            select(PortfolioItem.portfolio_id)
+            .where(PortfolioItem.id.in_(portfolio_item_ids))
+            .distinct()
+        )
+        return list(result.scalars().all())
+
+    async def get_confirmed_portfolio_items_to_embed(
+        self, *, portfolio_id: uuid.UUID
+    ) -> List[PortfolioItem]:
+        result = await self.db.execute(
+            select(PortfolioItem).where(
+                PortfolioItem.portfolio_id == portfolio_id,
+                PortfolioItem.status == PortfolioItemStatus.CONFIRMED,
+                PortfolioItem.embedding_state == EmbeddingStatus.EMBEDDING,
+            )
+        )
+        return list(result.scalars().all())
+
+    async def get_confirmed_portfolio_items_failed_embedding(
+        self, *, portfolio_id: uuid.UUID
+    ) -> List[PortfolioItem]:
+        result = await self.db.execute(
+            select(PortfolioItem).where(
+                PortfolioItem.portfolio_id == portfolio_id,
+                PortfolioItem.status == PortfolioItemStatus.CONFIRMED,
+                PortfolioItem.embedding_state == EmbeddingStatus.FAILED,
+            )
+        )
+        return list(result.scalars().all())
+
+    async def mark_embedding_failed(self, *, portfolio_id: uuid.UUID) -> None:
+        await self.db.execute(
+            update(PortfolioItem)
+            .where(
+                PortfolioItem.portfolio_id == portfolio_id,
+                PortfolioItem.status == PortfolioItemStatus.CONFIRMED,
+                PortfolioItem.embedding_state == EmbeddingStatus.EMBEDDING,
+            )
+            .values(embedding_state=EmbeddingStatus.FAILED)
+        )
+
     async def delete_portfolio_items(
         self, *, portfolio_item_ids: List[uuid.UUID]
-    ) -> bool:
+    ) -> List[PortfolioItem]:
+        """삭제(DELETED) 처리한 항목 목록을 반환합니다. 없으면 빈 목록입니다."""
         db_portfolio_items = await self.get_portfolio_item_by_ids(
             portfolio_item_ids=portfolio_item_ids
         )
         if not db_portfolio_items:
-            return False
+            return []
 
         for item in db_portfolio_items:
             item.status = PortfolioItemStatus.DELETED
 
         await self.db.flush()
-        return True
+        return db_portfolio_items
 
     async def get_portfolio_items_by_portfolio_id(
         self, *, portfolio_id: uuid.UUID
@@ -1,7 +1,7 @@
 import uuid
-from typing import List
+from typing import List, Optional, Set
 from fastapi import Depends
-from sqlalchemy import cast, literal_column, values, insert
+from sqlalchemy import cast, literal_column, values, insert, update
 from sqlalchemy.orm import aliased
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
@@ -9,8 +9,9 @@ from pgvector.sqlalchemy import Vector
 
 from app.models.qna import QnA, QnAStatus
 from app.schemas.qna_schema import QnACreate
-from app.db.session import get_db
-from app.models.portfolio_item import PortfolioItem
+from app.db.bulk_copy import copy_insert
+from app.db.session import get_db, get_read_db
+from app.models.portfolio_item import EmbeddingStatus, PortfolioItem
 
 
 class QnACRUD:
@@ -52,6 +53,80 @@ class QnACRUD:
         result = await self.db.execute(insert(QnA).values(qnas_data).returning(QnA))
         return list(result.scalars().all())
 
+    async def copy_create_qnas(
+        self,
+        *,
+        qna_list: List[QnACreate],
+        user_id: uuid.UUID,
+        embeddings: Optional[List[List[float]]] = None,
+        embedding_model: Optional[str] = None,
+    ) -> List[uuid.UUID]:
+        """
+        COPY 경로로 Q&A를 대량 적재하고 생성된 id 목록을 반환합니다.
+        수천 건 이상의 적재에서 bulk_create_qnas 대신 사용합니다.
+        embeddings 를 함께 적재할 때는 만든 모델(embedding_model)도 넘겨야 합니다.
+        """
+        ids = [uuid.uuid4() for _ in qna_list]
+        await copy_insert(
+            self.db,
+            QnA.__table__,
+            (
+                {
+                    "id": qna_id,
+                    "question": qna.question,
+                    "answer": qna.answer,
+                    "portfolio_item_id": qna.portfolio_item_id,
+                    "user_id": user_id,
+                    "status": QnAStatus.PENDING,
+                    "embedding": embeddings[i] if embeddings else None,
+                    "embedding_model": embedding_model if embeddings else None,
+                }
+                for i, (qna_id, qna) in enumerate(zip(ids, qna_list))
+            ),
+            columns=[
+                "id",
+                "question",
+                "answer",
+                "portfolio_item_id",
+                "user_id",
+                "status",
+                "embedding",
+                "embedding_model",
+            ],
+        )
+        return ids
+
+    async def delete_qnas_by_portfolio_item_ids(
+        self, *, portfolio_item_ids: List[uuid.UUID], user_id: uuid.UUID
+    ) -> None:
+        if not portfolio_item_ids:
+            return
+        await self.db.execute(
+            update(QnA)
+            .where(
+                QnA.portfolio_item_id.in_(portfolio_item_ids),
+                QnA.user_id == user_id,
+                QnA.status != QnAStatus.DELETED,
+            )
+            .values(status=QnAStatus.DELETED)
+        )
+
+    async def get_portfolio_item_ids_with_qnas(
+        self, *, portfolio_item_ids: List[uuid.UUID], user_id: uuid.UUID
+    ) -> Set[uuid.UUID]:
+        if not portfolio_item_ids:
+            return set()
+        result = await self.db.execute(
+            select(QnA.portfolio_item_id)
+            .where(
+                QnA.portfolio_item_id.in_(portfolio_item_ids),
+                QnA.user_id == user_id,
+                QnA.status != QnAStatus.DELETED,
+            )
+            .distinct()
+        )
+        return set(result.scalars().all())
+
     async def get_qnas_by_ids(
         self, *, ids: List[uuid.UUID], user_id: uuid.UUID
     ) -> List[QnA]:
@@ -60,6 +135,33 @@ class QnACRUD:
         )
         return list(result.scalars().all())
 
+    async def get_confirmed_qnas_to_embed(
+        self, *, ids: List[uuid.UUID], user_id: uuid.UUID
+    ) -> List[QnA]:
+        result = await self.db.execute(
+            select(QnA).where(
+                QnA.id.in_(ids),
+                QnA.user_id == user_id,
+                QnA.status == QnAStatus.CONFIRMED,
+                QnA.embedding_state == EmbeddingStatus.EMBEDDING,
+            )
+        )
+        return list(result.scalars().all())
+
+    async def mark_embedding_failed(
+        self, *, ids: List[uuid.UUID], user_id: uuid.UUID
+    ) -> None:
+        await self.db.execute(
+            update(QnA)
+            .where(
+                QnA.id.in_(ids),
+                QnA.user_id == user_id,
+                QnA.status == QnAStatus.CONFIRMED,
+                QnA.embedding_state == EmbeddingStatus.EMBEDDING,
+            )
+            .values(embedding_state=EmbeddingStatus.FAILED)
+        )
+
     async def search_qnas_by_embeddings(
         self,
         *,
@@ -77,7 +179,11 @@ class QnACRUD:
         )
 
         qna_alias = aliased(QnA)
-        query = select(qna_alias).where(qna_alias.status == QnAStatus.CONFIRMED)
+        # 확정 직후 임베딩이 아직 생성되지 않은 Q&A는 제외합니다.
+        query = select(qna_alias).where(
+            qna_alias.status == QnAStatus.CONFIRMED,
+            qna_alias.embedding.is_not(None),
+        )
 
         if portfolio_item_ids:
             query = query.where(qna_alias.portfolio_item_id.in_(portfolio_item_ids))
@@ -101,3 +207,10 @@ class QnACRUD:
         results = await self.db.execute(stmt)
 
         return list(results.scalars().unique().all())
+
+
+class QnAReadCRUD(QnACRUD):
+    """읽기 전용 복제본 세션(get_read_db)을 사용하는 QnACRUD. 조회 메서드에만 사용합니다."""
+
+    def __init__(self, db: AsyncSession = Depends(get_read_db)):
+        super().__init__(db)
@@ -6,7 +6,7 @@ from fastapi import Depends
 
 from app.models.user import User
 from app.schemas.user_schema import UserCreate
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 
 
 class UserCRUD:
@@ -17,8 +17,15 @@ class UserCRUD:
         result = await self.db.execute(select(User).where(User.email == email))
         return result.scalars().first()
 
-    async def get_user_by_id(self, *, user_id: uuid.UUID) -> Optional[User]:
-        result = await self.db.execute(select(User).where(User.id == user_id))
+    async def get_user_by_id(
+        self, *, user_id: uuid.UUID, populate_existing: bool = False
+    ) -> Optional[User]:
+        """populate_existing: 같은 세션에 이미 로드된 사용자도 DB 값으로 다시 채웁니다."""
+        result = await self.db.execute(
+            select(User)
+            .where(User.id == user_id)
+            .execution_options(populate_existing=populate_existing)
+        )
         return result.scalars().first()
     
     async def get_user_by_nickname(self, *, nickname: str) -> Optional[User]:
@@ -37,3 +44,10 @@ class UserCRUD:
         await self.db.flush()
         await self.db.refresh(db_obj)
         return db_obj
+
+
+class UserReadCRUD(UserCRUD):
+    """읽기 전용 복제본 세션(get_read_db)을 사용하는 UserCRUD. 조회 메서드에만 사용합니다."""
+
+    def __init__(self, db: AsyncSession = Depends(get_read_db)):
+        super().__init__(db)
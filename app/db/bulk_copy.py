@@ -0,0 +1,86 @@
+"""
+asyncpg 바이너리 COPY를 이용한 대량 적재.
+
+멀티 로우 INSERT ... VALUES 는 행 수 x 컬럼 수만큼 바인드 파라미터가 늘어나
+(asyncpg 한도 32767개) 큰 적재에서는 문장 크기와 파싱 비용이 문제가 됩니다.
+여기서는 트랜잭션 범위의 임시 스테이징 테이블로 COPY 한 뒤,
+INSERT ... SELECT 한 번으로 대상 테이블에 옮깁니다.
+
+Enum / vector 컬럼은 스테이징 테이블에 text로 적재하고 INSERT ... SELECT 에서 캐스팅합니다.
+"""
+
+import uuid
+from enum import Enum
+from typing import Any, Dict, Iterable, List
+
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import Column, Enum as SQLAlchemyEnum, Table, cast, column, insert
+from sqlalchemy import select, table, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def _is_text_staged(target_column: Column) -> bool:
+    return isinstance(target_column.type, (SQLAlchemyEnum, Vector))
+
+
+def _staging_type(target_column: Column) -> str:
+    if _is_text_staged(target_column):
+        return "text"
+    return target_column.type.compile(dialect=postgresql.dialect())
+
+
+def _to_copy_value(target_column: Column, value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(target_column.type, SQLAlchemyEnum):
+        # SQLAlchemy Enum은 멤버 이름으로 저장합니다.
+        return value.name if isinstance(value, Enum) else value
+    if isinstance(target_column.type, Vector):
+        return "[" + ",".join(repr(float(v)) for v in value) + "]"
+    return value
+
+
+async def copy_insert(
+    db: AsyncSession, target: Table, rows: Iterable[Dict[str, Any]], columns: List[str]
+) -> int:
+    """
+    rows 를 target 테이블에 COPY 경로로 적재하고 삽입된 행 수를 반환합니다.
+    세션의 현재 트랜잭션 안에서 실행되므로 커밋/롤백은 호출자가 결정합니다.
+    """
+    target_columns = [target.c[name] for name in columns]
+    staging_name = f"_copy_{target.name}_{uuid.uuid4().hex[:8]}"
+    ddl = ", ".join(f'"{c.name}" {_staging_type(c)}' for c in target_columns)
+
+    connection = await db.connection()
+    await connection.execute(
+        text(f'CREATE TEMP TABLE "{staging_name}" ({ddl}) ON COMMIT DROP')
+    )
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        staging_name,
+        records=(
+            tuple(_to_copy_value(c, row.get(c.name)) for c in target_columns)
+            for row in rows
+        ),
+        columns=columns,
+    )
+
+    staging = table(staging_name, *(column(name) for name in columns))
+    result = await connection.execute(
+        insert(target).from_select(
+            columns,
+            select(
+                *(
+                    (
+                        cast(staging.c[c.name], c.type)
+                        if _is_text_staged(c)
+                        else staging.c[c.name]
+                    )
+                    for c in target_columns
+                )
+            ),
+        )
+    )
+    await connection.execute(text(f'DROP TABLE "{staging_name}"'))
+    return result.rowcount
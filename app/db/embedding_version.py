@@ -0,0 +1,52 @@
+"""
+시작 시 저장된 임베딩과 임베딩 설정 확인.
+
+portfolio_items / qnas 의 embedding 컬럼 차원이 EMBEDDING_DIMENSION 과 같은지,
+저장된 벡터가 모두 현재 EMBEDDING_MODEL 로 만들어졌는지(embedding_model) 확인합니다.
+다른 모델의 벡터가 섞이면 유사도 검색 결과가 무의미해지므로 재임베딩 전에는 시작하지 않습니다.
+"""
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+
+EMBEDDING_TABLES = ("portfolio_items", "qnas")
+
+
+class EmbeddingVersionError(RuntimeError):
+    pass
+
+
+async def verify_embedding_version(engine: AsyncEngine, model_tag: str) -> None:
+    """컬럼 차원이 다르거나 model_tag 와 다른 모델의 벡터가 있으면 EmbeddingVersionError 로 시작을 중단합니다."""
+    expected_type = f"vector({settings.EMBEDDING_DIMENSION})"
+    async with engine.connect() as conn:
+        for table in EMBEDDING_TABLES:
+            column_type = await conn.scalar(
+                text(
+                    "SELECT format_type(atttypid, atttypmod) FROM pg_attribute "
+                    "WHERE attrelid = CAST(:table AS regclass) AND attname = 'embedding'"
+                ),
+                {"table": table},
+            )
+            if column_type != expected_type:
+                raise EmbeddingVersionError(
+                    f"{table}.embedding 컬럼({column_type})이 "
+                    f"EMBEDDING_DIMENSION={settings.EMBEDDING_DIMENSION} 과 다릅니다. "
+                    "차원을 바꾸려면 컬럼을 바꾸는 마이그레이션이 필요합니다."
+                )
+
+            stale_model = await conn.scalar(
+                text(
+                    f"SELECT coalesce(embedding_model, '(unknown)') FROM {table} "
+                    "WHERE embedding IS NOT NULL "
+                    "AND embedding_model IS DISTINCT FROM :model LIMIT 1"
+                ),
+                {"model": model_tag},
+            )
+            if stale_model is not None:
+                raise EmbeddingVersionError(
+                    f"{table} 에 다른 임베딩 모델({stale_model})로 만든 벡터가 있습니다 "
+                    f"(현재 {model_tag}). `python -m scripts.reembed` 로 다시 임베딩하세요."
+                )
@@ -0,0 +1,71 @@
+"""
+시작 시 DB 스키마 버전 확인.
+
+스키마 변경은 배포 전에 `alembic upgrade head` 로 적용하고, 서버/워커는 시작할 때
+alembic_version 이 이 코드의 head 리비전과 같은지만 확인합니다. (테이블을 만들거나 검사하지 않음)
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Set
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+if TYPE_CHECKING:
+    from alembic.script import ScriptDirectory
+
+ALEMBIC_INI_PATH = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+
+class SchemaVersionError(RuntimeError):
+    pass
+
+
+def _get_script_directory() -> "ScriptDirectory":
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    return ScriptDirectory.from_config(Config(str(ALEMBIC_INI_PATH)))
+
+
+async def get_current_revisions(engine: AsyncEngine) -> Set[str]:
+    from alembic.runtime.migration import MigrationContext
+
+    async with engine.connect() as conn:
+        heads = await conn.run_sync(
+            lambda sync_conn: MigrationContext.configure(sync_conn).get_current_heads()
+        )
+    return set(heads)
+
+
+async def verify_schema_version(engine: AsyncEngine) -> None:
+    """
+    DB가 head 리비전이면 통과합니다.
+    이 코드가 모르는 리비전이면 롤링 배포 중 새 버전이 먼저 마이그레이션한 것이므로 경고만 남기고,
+    마이그레이션이 없거나 뒤처져 있으면 SchemaVersionError 로 시작을 중단합니다.
+    """
+    from alembic.util import CommandError
+
+    script = _get_script_directory()
+    expected = set(script.get_heads())
+    current = await get_current_revisions(engine)
+
+    if current == expected:
+        return
+    if not current:
+        raise SchemaVersionError(
+            "DB 스키마 버전이 없습니다. `alembic upgrade head` 를 실행하세요. "
+            "(create_all 로 만든 기존 DB는 `alembic stamp 0001` 후 upgrade)"
+        )
+    for revision in current:
+        try:
+            script.get_revision(revision)
+        except CommandError:
+            print(
+                f"DB schema revision {revision} is newer than this build "
+                f"(head {', '.join(sorted(expected))}); continuing."
+            )
+            return
+    raise SchemaVersionError(
+        f"DB 스키마가 최신이 아닙니다 (현재 {', '.join(sorted(current))}, "
+        f"필요 {', '.join(sorted(expected))}). `alembic upgrade head` 를 실행하세요."
+    )
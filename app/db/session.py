@@ -1,6 +1,10 @@
+import time
+
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import declarative_base
 from app.core.config import settings
+from app.core.metrics import metrics
 import redis.asyncio as redis
 
 # PostgreSQL (SQLAlchemy)
@@ -16,6 +20,35 @@ AsyncSessionLocal = async_sessionmaker(
 )
 Base = declarative_base()
 
+# PostgreSQL 읽기 전용 복제본 (선택)
+read_engine = (
+    create_async_engine(settings.DATABASE_READ_URL, pool_pre_ping=True, echo=False)
+    if settings.DATABASE_READ_URL
+    else None
+)
+ReadSessionLocal = (
+    async_sessionmaker(
+        bind=read_engine,
+        class_=AsyncSession,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+    if read_engine is not None
+    else None
+)
+
+# WAL을 모두 재생했다면 지연 0, 아니면 마지막 재생 트랜잭션 이후 경과 시간(초)
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+_replica_state = {"fresh": False, "checked_at": 0.0}
+
 # Redis
 redis_pool = redis.ConnectionPool.from_url(
     f"redis://:{settings.REDIS_PASSWORD}@{settings.REDIS_URL}:6379/0",
@@ -34,6 +67,48 @@ async def get_db():
             raise e
 
 
+async def _is_replica_fresh() -> bool:
+    """복제 지연을 DATABASE_READ_LAG_CHECK_INTERVAL_SECONDS 간격으로 확인해 캐시합니다."""
+    now = time.monotonic()
+    interval = settings.DATABASE_READ_LAG_CHECK_INTERVAL_SECONDS
+    if now - _replica_state["checked_at"] < interval:
+        return _replica_state["fresh"]
+
+    _replica_state["checked_at"] = now
+    try:
+        async with read_engine.connect() as conn:
+            lag = float((await conn.execute(REPLICA_LAG_QUERY)).scalar() or 0)
+        metrics.set_gauge("db_replica_lag_seconds", lag)
+        _replica_state["fresh"] = lag <= settings.DATABASE_READ_MAX_LAG_SECONDS
+    except Exception as e:
+        print(f"Error checking read replica lag: {e}")
+        _replica_state["fresh"] = False
+    return _replica_state["fresh"]
+
+
+async def get_read_db():
+    """
+    조회 전용 세션. 복제본이 설정되어 있고 지연이 DATABASE_READ_MAX_LAG_SECONDS 이내이면
+    복제본을, 아니면 기본 DB를 사용합니다. 쓰기는 커밋하지 않습니다.
+    """
+    if ReadSessionLocal is not None and await _is_replica_fresh():
+        session_factory, target = ReadSessionLocal, "replica"
+    else:
+        session_factory, target = AsyncSessionLocal, "primary"
+    metrics.increment("db_read_sessions_total", target=target)
+
+    async with session_factory() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+
+
+async def close_read_engine():
+    if read_engine is not None:
+        await read_engine.dispose()
+
+
 async def get_redis_client() -> redis.Redis:
     return redis.Redis(connection_pool=redis_pool)
 
@@ -1,11 +1,28 @@
-from fastapi import FastAPI
+import asyncio
+import secrets
+from typing import Optional
+
+from fastapi import Depends, FastAPI, Header, HTTPException, status
 from contextlib import asynccontextmanager
 
 from app.api.v1.api import api_router
 from app.core.config import settings
-from app.db.session import async_engine, Base, close_redis_pool
+from app.core.metrics import metrics
+from app.db.embedding_version import verify_embedding_version
+from app.db.schema_version import verify_schema_version
+from app.db.session import (
+    async_engine,
+    close_read_engine,
+    close_redis_pool,
+    get_redis_client,
+)
+from app.services.clients import close_clients
+from app.services.embedding_gateway import embedding_model_tag
+from app.services.job_queue import JobQueue
+from app.services.warmup import warm_up
 import uvicorn
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 # # SQLAlchemy query logging
 # logging.basicConfig()
@@ -15,14 +32,21 @@ from fastapi.middleware.cors import CORSMiddleware
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    # Create DB tables
-    async with async_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # 스키마는 alembic upgrade head 로 배포 전에 적용하고, 여기서는 버전만 확인합니다.
+    if settings.DATABASE_SCHEMA_CHECK_ENABLED:
+        await verify_schema_version(async_engine)
+        await verify_embedding_version(async_engine, embedding_model_tag())
+    # 요청을 받기 시작한 뒤 백그라운드에서 무거운 SDK를 불러오고 공유 클라이언트를 만듭니다.
+    warmup_task = asyncio.create_task(warm_up()) if settings.WARMUP_ENABLED else None
 
     yield
 
     # Shutdown
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+    await close_clients()
     await close_redis_pool()
+    await close_read_engine()
     await async_engine.dispose()
 
 
@@ -41,6 +65,12 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# 작은 응답은 압축 이득보다 CPU 비용이 커서 임계값 이상만 압축합니다. (SSE 스트림은 제외됨)
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.GZIP_MINIMUM_SIZE,
+    compresslevel=settings.GZIP_COMPRESS_LEVEL,
+)
 
 
 @app.get("/", tags=["Root"])
@@ -48,6 +78,31 @@ def read_root():
     return {"message": "Welcome to lio API"}
 
 
+def verify_metrics_token(authorization: Optional[str] = Header(None)) -> None:
+    """큐 깊이, 복제본 지연 등 내부 정보가 담겨 있으므로 METRICS_TOKEN 을 가진 요청만 허용합니다."""
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not secrets.compare_digest(
+        token.encode(), settings.METRICS_TOKEN.encode()
+    ):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+
+
+@app.get(
+    "/metrics",
+    tags=["Root"],
+    include_in_schema=False,
+    dependencies=[Depends(verify_metrics_token)],
+)
+async def read_metrics():
+    try:
+        await JobQueue(await get_redis_client()).depth()
+    except Exception as e:
+        print(f"Error reading job queue depth: {e}")
+    return metrics.snapshot()
+
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 if __name__ == "__main__":
@@ -34,7 +34,7 @@ class ChatMessage(Base):
     )
 
     chat_session_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("chat_sessions.id"), nullable=False
+        ForeignKey("chat_sessions.id"), nullable=False, index=True
     )
 
     question: Mapped[str] = mapped_column(Text, nullable=False)
@@ -3,7 +3,7 @@ from enum import Enum
 from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import String, DateTime, ForeignKey, Enum as SQLAlchemyEnum
+from sqlalchemy import String, DateTime, ForeignKey, Index, Enum as SQLAlchemyEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -33,6 +33,10 @@ class PortfolioSourceType(Enum):
 
 class Portfolio(Base):
     __tablename__ = "portfolios"
+    __table_args__ = (
+        # 사용자별 목록/게시 포트폴리오 조회 (status = ... 와 status <> 'DELETED' 모두 사용)
+        Index("ix_portfolios_user_id_status", "user_id", "status"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
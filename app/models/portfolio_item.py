@@ -6,12 +6,14 @@ from sqlalchemy import (
     String,
     DateTime,
     ForeignKey,
+    Index,
     Text,
     Enum as SQLAlchemyEnum,
     Date,
     ARRAY,
 )
 from sqlalchemy.dialects.postgresql import UUID
+from app.core.config import settings
 from app.db.session import Base
 from datetime import datetime, date
 from typing import TYPE_CHECKING, List, Optional
@@ -37,8 +39,21 @@ class PortfolioItemStatus(Enum):
     CONFIRMED = "CONFIRMED"
 
 
+class EmbeddingStatus(str, Enum):
+    """확정된 항목/Q&A의 임베딩 생성 상태 (임베딩은 확정 후 작업 큐에서 생성됩니다)"""
+
+    EMBEDDING = "EMBEDDING"
+    READY = "READY"
+    # 임베딩 작업이 dead-letter로 옮겨짐 (다시 확정하면 재시도)
+    FAILED = "FAILED"
+
+
 class PortfolioItem(Base):
     __tablename__ = "portfolio_items"
+    __table_args__ = (
+        # 포트폴리오별 항목 조회, 항목 selectinload, 임베딩 검색 후보 필터
+        Index("ix_portfolio_items_portfolio_id_status", "portfolio_id", "status"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -64,7 +79,18 @@ class PortfolioItem(Base):
         ARRAY(String), nullable=True
     )
 
-    embedding: Mapped[Optional[List[float]]] = mapped_column(Vector(768), nullable=True)
+    embedding: Mapped[Optional[List[float]]] = mapped_column(
+        Vector(settings.EMBEDDING_DIMENSION), nullable=True
+    )
+    # embedding 을 만든 모델 (embedding_model_tag(), 모델이 바뀌면 시작 시 재임베딩 요구)
+    embedding_model: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    # 확정 후 임베딩 생성 상태 (새 임베딩이 저장될 때까지 기존 embedding 은 유지)
+    embedding_state: Mapped[Optional[EmbeddingStatus]] = mapped_column(
+        SQLAlchemyEnum(EmbeddingStatus), nullable=True
+    )
+
+    # 마지막 Q&A 생성 시점의 topic/content/tech_stack 해시 (변경된 항목만 재생성)
+    qna_fingerprint: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
@@ -75,3 +101,13 @@ class PortfolioItem(Base):
 
     portfolio: Mapped["Portfolio"] = relationship(back_populates="items")
     qnas: Mapped["QnA"] = relationship(back_populates="portfolio_item")
+
+    @property
+    def embedding_status(self) -> Optional[EmbeddingStatus]:
+        if self.status != PortfolioItemStatus.CONFIRMED:
+            return None
+        if self.embedding_state is not None:
+            return self.embedding_state
+        if self.embedding is None:
+            return EmbeddingStatus.EMBEDDING
+        return EmbeddingStatus.READY
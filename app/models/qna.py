@@ -1,15 +1,17 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 import uuid
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import DateTime, ForeignKey, Text, Enum as SQLAlchemyEnum
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, Enum as SQLAlchemyEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 from pgvector.sqlalchemy import Vector
 
+from app.core.config import settings
 from app.db.session import Base
+from app.models.portfolio_item import EmbeddingStatus
 
 if TYPE_CHECKING:
     from app.models.portfolio_item import PortfolioItem
@@ -24,6 +26,10 @@ class QnAStatus(Enum):
 
 class QnA(Base):
     __tablename__ = "qnas"
+    __table_args__ = (
+        # 항목별 Q&A 조회/삭제, 임베딩 검색 후보 필터
+        Index("ix_qnas_portfolio_item_id_status", "portfolio_item_id", "status"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -33,14 +39,20 @@ class QnA(Base):
 
     answer: Mapped[str] = mapped_column(Text, nullable=False)
 
-    embedding = mapped_column(Vector(768), nullable=True)
+    embedding = mapped_column(Vector(settings.EMBEDDING_DIMENSION), nullable=True)
+    # embedding 을 만든 모델 (embedding_model_tag(), 모델이 바뀌면 시작 시 재임베딩 요구)
+    embedding_model: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    # 확정 후 임베딩 생성 상태 (새 임베딩이 저장될 때까지 기존 embedding 은 유지)
+    embedding_state: Mapped[Optional[EmbeddingStatus]] = mapped_column(
+        SQLAlchemyEnum(EmbeddingStatus), nullable=True
+    )
 
     status: Mapped[QnAStatus] = mapped_column(
         SQLAlchemyEnum(QnAStatus), default=QnAStatus.PENDING, nullable=False
     )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.id"), nullable=False
+        UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True
     )
 
     portfolio_item_id: Mapped[uuid.UUID] = mapped_column(
@@ -57,3 +69,13 @@ class QnA(Base):
 
     user: Mapped["User"] = relationship()
     portfolio_item: Mapped["PortfolioItem"] = relationship(back_populates="qnas")
+
+    @property
+    def embedding_status(self) -> Optional[EmbeddingStatus]:
+        if self.status != QnAStatus.CONFIRMED:
+            return None
+        if self.embedding_state is not None:
+            return self.embedding_state
+        if self.embedding is None:
+            return EmbeddingStatus.EMBEDDING
+        return EmbeddingStatus.READY
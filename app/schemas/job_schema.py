@@ -0,0 +1,47 @@
+import enum
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+
+class Job(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    name: str
+    payload: Dict[str, Any] = Field(default_factory=dict)
+    attempts: int = 0
+    enqueued_at: float = Field(default_factory=time.time)
+    last_error: Optional[str] = None
+
+
+class QueueDepth(BaseModel):
+    queued: int
+    processing: int
+    delayed: int
+    dead: int
+
+
+class JobStage(str, enum.Enum):
+    QUEUED = "queued"
+    DOWNLOAD = "download"
+    EXTRACT = "extract"
+    STRUCTURE = "structure"
+    SAVE = "save"
+    QNA = "qna"
+    EMBEDDING = "embedding"
+    RETRYING = "retrying"
+    DONE = "done"
+    FAILED = "failed"
+
+    @property
+    def is_terminal(self) -> bool:
+        return self in (JobStage.DONE, JobStage.FAILED)
+
+
+class JobProgressEvent(BaseModel):
+    job_id: str
+    stage: JobStage
+    percent: int = Field(ge=0, le=100)
+    detail: Optional[str] = None
+    timestamp: float = Field(default_factory=time.time)
@@ -16,6 +16,15 @@ class LLMQnAOutput(BaseModel):
     qnas: List[LLMQnA]
 
 
+class LLMItemQnAOutput(BaseModel):
+    item_id: str = Field(description="입력에 주어진 항목 ID를 그대로 사용")
+    qnas: List[LLMQnA]
+
+
+class LLMBatchQnAOutput(BaseModel):
+    results: List[LLMItemQnAOutput]
+
+
 class LLMPortfolioItem(BaseModel):
     type: PortfolioItemType = Field(
         description="항목 유형. 반드시 'INTRODUCTION', 'EXPERIENCE', 'PROJECT', 'SKILLS', 'EDUCATION', 'CONTACT' 중 하나여야 함"
@@ -2,7 +2,7 @@ import uuid
 from pydantic import BaseModel, ConfigDict
 from datetime import date, datetime
 from typing import List, Optional
-from app.models.portfolio_item import PortfolioItemType
+from app.models.portfolio_item import EmbeddingStatus, PortfolioItemType
 
 
 # PortfolioItem 관련 스키마
@@ -30,6 +30,7 @@ class PortfolioItemRead(PortfolioItemBase):
     id: uuid.UUID
     portfolio_id: uuid.UUID
     created_at: datetime
+    embedding_status: Optional[EmbeddingStatus] = None
 
 
 class PortfolioItemUpdate(BaseModel):
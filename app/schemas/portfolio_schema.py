@@ -1,8 +1,9 @@
 import uuid
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, model_validator
 from datetime import datetime
 from typing import List, Optional
 from app.models.portfolio import PortfolioStatus
+from app.models.portfolio_item import EmbeddingStatus
 from app.schemas.portfolio_item_schema import PortfolioItemCreate, PortfolioItemRead
 
 
@@ -29,6 +30,7 @@ class PortfolioCreationResponse(PortfolioBase):
 
     id: uuid.UUID
     status: PortfolioStatus
+    job_id: Optional[str] = None
 
 
 class PortfolioReadWithoutItems(PortfolioBase):
@@ -42,6 +44,12 @@ class PortfolioReadWithoutItems(PortfolioBase):
     created_at: datetime
 
 
+class PortfolioJobResponse(PortfolioReadWithoutItems):
+    """작업 큐에 등록된 요청의 응답 스키마 (job_id로 진행 상황을 구독)"""
+
+    job_id: str
+
+
 class PortfolioRead(PortfolioBase):
     """포트폴리오 조회를 위한 스키마 (API 응답용)"""
 
@@ -52,6 +60,25 @@ class PortfolioRead(PortfolioBase):
     source_url: Optional[str] = None
     created_at: datetime
     items: List[PortfolioItemRead] = []
+    embedding_status: Optional[EmbeddingStatus] = None
+
+    @model_validator(mode="after")
+    def derive_embedding_status(self) -> "PortfolioRead":
+        """확정된 항목 중 하나라도 임베딩 생성 중이면 EMBEDDING, 실패한 항목이 있으면 FAILED 입니다."""
+        statuses = {item.embedding_status for item in self.items} - {None}
+        if EmbeddingStatus.EMBEDDING in statuses:
+            self.embedding_status = EmbeddingStatus.EMBEDDING
+        elif EmbeddingStatus.FAILED in statuses:
+            self.embedding_status = EmbeddingStatus.FAILED
+        elif statuses:
+            self.embedding_status = EmbeddingStatus.READY
+        return self
+
+
+class PortfolioConfirmResponse(PortfolioRead):
+    """포트폴리오 확정 응답 스키마 (job_id로 임베딩 생성 진행 상황을 구독)"""
+
+    job_id: Optional[str] = None
 
 
 class PublishedPortfolioRead(PortfolioBase):
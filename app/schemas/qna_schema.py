@@ -1,7 +1,8 @@
 import uuid
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 
+from app.models.portfolio_item import EmbeddingStatus
 from app.models.qna import QnAStatus
 
 
@@ -20,6 +21,7 @@ class QnARead(QnABase):
     id: uuid.UUID
     status: QnAStatus
     portfolio_item_id: uuid.UUID
+    embedding_status: Optional[EmbeddingStatus] = None
 
 
 class QnACreate(QnABase):
@@ -26,6 +26,15 @@ class UserRead(UserBase):
     created_at: datetime
 
 
+class UserSnapshot(UserRead):
+    """
+    인증 의존성(get_current_user)이 반환하는 사용자 스냅샷.
+    세션에 묶이지 않은 읽기 전용 값이므로, 변경이 필요하면 UserCRUD로 다시 조회합니다.
+    """
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
 class UserUpdate(BaseModel):
     job: Optional[str] = None
     address: Optional[str] = None
@@ -4,21 +4,28 @@ from typing import Any, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from google.oauth2 import id_token
-from google.auth.transport import requests
 
 from app.crud.user_crud import UserCRUD
-from app.schemas.user_schema import UserCreate
+from app.schemas.user_schema import UserCreate, UserSnapshot
 from app.schemas.token_schema import TokenPayload
 from app.core.config import settings
-from app.models.user import User
+from app.services.google_id_token import get_google_id_token_verifier
+from app.services.user_snapshot_cache import (
+    UserSnapshotCache,
+    get_user_snapshot_cache,
+)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
 
 class AuthService:
-    def __init__(self, user_crud: UserCRUD = Depends()):
+    def __init__(
+        self,
+        user_crud: UserCRUD = Depends(),
+        user_snapshot_cache: UserSnapshotCache = Depends(get_user_snapshot_cache),
+    ):
         self.user_crud = user_crud
+        self.user_snapshot_cache = user_snapshot_cache
 
     def _create_token(
         self, subject: Any, secret_key: str, expires_in_minutes: int
@@ -48,19 +55,15 @@ class AuthService:
         except JWTError:
             return None
 
-    def _verify_google_id_token(self, *, token: str) -> Optional[dict[str, Any]]:
+    async def _verify_google_id_token(self, *, token: str) -> Optional[dict[str, Any]]:
         try:
-            return id_token.verify_oauth2_token(
-                token, requests.Request(), settings.GOOGLE_CLIENT_ID
-            )
-        except ValueError:
-            return None
+            return await get_google_id_token_verifier().verify(token)
         except Exception as e:
             print(f"An unexpected error occurred during token verification: {e}")
             return None
 
     async def login_or_register_google(self, *, id_token: str) -> dict:
-        google_user_info = self._verify_google_id_token(token=id_token)
+        google_user_info = await self._verify_google_id_token(token=id_token)
         if not google_user_info:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -91,7 +94,9 @@ class AuthService:
             "token_type": "bearer",
         }
 
-    async def get_user_from_token(self, *, token: str, secret_key: str) -> User:
+    async def get_user_from_token(
+        self, *, token: str, secret_key: str
+    ) -> UserSnapshot:
         credentials_exception = HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
@@ -101,16 +106,22 @@ class AuthService:
         if token_payload is None or token_payload.sub is None:
             raise credentials_exception
 
+        snapshot = await self.user_snapshot_cache.get(token_payload.sub)
+        if snapshot is not None:
+            return snapshot
+
         user = await self.user_crud.get_user_by_email(email=token_payload.sub)
         if user is None:
             raise credentials_exception
-        return user
+        snapshot = UserSnapshot.model_validate(user)
+        await self.user_snapshot_cache.fill(token_payload.sub, snapshot)
+        return snapshot
 
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     auth_service: AuthService = Depends(),
-) -> User:
+) -> UserSnapshot:
     """Dependency to get user from access token."""
     return await auth_service.get_user_from_token(
         token=token, secret_key=settings.ACCESS_TOKEN_SECRET_KEY
@@ -120,7 +131,7 @@ async def get_current_user(
 async def get_current_user_from_refresh_token(
     token: str = Depends(oauth2_scheme),
     auth_service: AuthService = Depends(),
-) -> User:
+) -> UserSnapshot:
     """Dependency to get user from refresh token."""
     return await auth_service.get_user_from_token(
         token=token, secret_key=settings.REFRESH_TOKEN_SECRET_KEY
@@ -2,18 +2,18 @@ from typing import List, Optional
 import uuid
 import json
 from fastapi import Depends, HTTPException, status
-from langgraph.graph import StateGraph, END
 from pydantic import BaseModel, Field
 from app.crud.chat_message_crud import ChatMessageCRUD
 from app.crud.chat_session_crud import ChatSessionCRUD
 from app.schemas.chat_message_schema import ChatMessageCreate, GraphStateQuery
-from app.crud.portfolio_crud import PortfolioCRUD
-from app.crud.qna_crud import QnACRUD
+from app.crud.portfolio_crud import PortfolioCRUD, PortfolioReadCRUD
+from app.crud.qna_crud import QnACRUD, QnAReadCRUD
 from app.crud.user_crud import UserCRUD
 from app.schemas.llm_schema import LLMChatAnswer
 from app.schemas.portfolio_item_schema import PortfolioItemLLMInput
 from app.schemas.qna_schema import QnALLMInput
-from app.services.llm_service import LLMService
+from app.services.chat_model_router import ChatModelRouter, get_chat_model_router
+from app.services.llm_service import LLMService, get_llm_service
 from app.services.rag_service import RAGService
 
 from app.services.chat_session_service import ChatSessionService
@@ -40,43 +40,25 @@ class ChatMessageService:
         user_crud: UserCRUD = Depends(),
         chat_message_crud: ChatMessageCRUD = Depends(),
         chat_session_crud: ChatSessionCRUD = Depends(),
-        llm_service: LLMService = Depends(),
+        llm_service: LLMService = Depends(get_llm_service),
         rag_service: RAGService = Depends(),
         session_service: ChatSessionService = Depends(),
+        chat_model_router: ChatModelRouter = Depends(get_chat_model_router),
+        portfolio_read_crud: PortfolioReadCRUD = Depends(),
+        qna_read_crud: QnAReadCRUD = Depends(),
     ):
         self.portfolio_crud = portfolio_crud
         self.qna_crud = qna_crud
+        # 검색 쿼리는 읽기 전용 복제본을 사용합니다.
+        self.portfolio_read_crud = portfolio_read_crud
+        self.qna_read_crud = qna_read_crud
         self.user_crud = user_crud
         self.chat_message_crud = chat_message_crud
         self.chat_session_crud = chat_session_crud
         self.llm_service = llm_service
         self.rag_service = rag_service
         self.session_service = session_service
-
-        workflow = StateGraph(GraphState)
-
-        workflow.add_node("get_context_from_session", self.get_context_from_session)
-        workflow.add_node("generate_queries_node", self.generate_queries_node)
-        workflow.add_node("embed_queries", self.embed_queries)
-        workflow.add_node("retrieve_portfolio_items", self.retrieve_portfolio_items)
-        workflow.add_node("retrieve_qnas", self.retrieve_qnas)
-        workflow.add_node("generate_chat_message", self.generate_chat_message)
-        workflow.add_node("save_chat", self.save_chat)
-        workflow.add_node("update_context_in_session", self.update_context_in_session)
-
-        workflow.set_entry_point("get_context_from_session")
-        workflow.add_edge("get_context_from_session", "generate_queries_node")
-        workflow.add_conditional_edges(
-            "generate_queries_node", self.should_embed_queries_node
-        )
-        workflow.add_edge("embed_queries", "retrieve_portfolio_items")
-        workflow.add_edge("retrieve_portfolio_items", "retrieve_qnas")
-        workflow.add_edge("retrieve_qnas", "generate_chat_message")
-        workflow.add_edge("generate_chat_message", "save_chat")
-        workflow.add_edge("save_chat", "update_context_in_session")
-        workflow.add_edge("update_context_in_session", END)
-
-        self.graph = workflow.compile()
+        self.chat_model_router = chat_model_router
 
     async def get_context_from_session(self, state: GraphState) -> dict:
         session_data = await self.session_service.get_session(state.session_id)
@@ -102,7 +84,8 @@ class ChatMessageService:
 
         return {"graph_state_queries": graph_state_queries}
 
-    def should_embed_queries_node(self, state: GraphState):
+    @staticmethod
+    def should_embed_queries_node(state: GraphState):
         if state.graph_state_queries:
             return "embed_queries"
         else:
@@ -134,7 +117,7 @@ class ChatMessageService:
         if not embeddings:
             return {"portfolio_item_ids": [], "portfolio_items": []}
 
-        portfolio_items = await self.portfolio_crud.search_portfolio_items_by_embedding(
+        portfolio_items = await self.portfolio_read_crud.search_portfolio_items_by_embedding(
             embeddings=embeddings, portfolio_id=state.portfolio_id
         )
 
@@ -166,7 +149,7 @@ class ChatMessageService:
             if query.embedding is not None
         ]
 
-        retrieved_qnas = await self.qna_crud.search_qnas_by_embeddings(
+        retrieved_qnas = await self.qna_read_crud.search_qnas_by_embeddings(
             portfolio_item_ids=portfolio_item_ids, embeddings=embeddings
         )
 
@@ -185,12 +168,18 @@ class ChatMessageService:
             "qnas": qnas_dump,
         }
 
+        route = self.chat_model_router.route(
+            question=state.input,
+            retrieved_item_count=len(state.portfolio_items),
+        )
+
         llm_chat_answer = await self.llm_service.generate_chat_answer(
             conversation_history=conversation_history,
             portfolio_context=json.dumps(portfolio_context, ensure_ascii=False),
             user_input=state.input,
+            tier=route.tier,
         )
-        
+
         return {"chat_message": llm_chat_answer}
 
     async def save_chat(self, state: GraphState):
@@ -279,5 +268,61 @@ class ChatMessageService:
             input=chat_create.question,
         )
 
-        final_state = await self.graph.ainvoke(initial_state)
+        final_state = await get_chat_graph().ainvoke(
+            initial_state, config={"configurable": {"chat_message_service": self}}
+        )
         return final_state["chat_message"].answer
+
+
+# 그래프 노드 이름. 각 노드는 같은 이름의 ChatMessageService 메서드를 실행합니다.
+CHAT_GRAPH_NODES = (
+    "get_context_from_session",
+    "generate_queries_node",
+    "embed_queries",
+    "retrieve_portfolio_items",
+    "retrieve_qnas",
+    "generate_chat_message",
+    "save_chat",
+    "update_context_in_session",
+)
+
+_chat_graph = None
+
+
+def _service_node(name: str):
+    async def node(state: GraphState, config) -> dict:
+        service = config["configurable"]["chat_message_service"]
+        return await getattr(service, name)(state)
+
+    node.__name__ = name
+    return node
+
+
+def get_chat_graph():
+    """
+    프로세스 전체에서 공유하는 채팅 그래프.
+    노드는 실행 설정(configurable)으로 받은 요청별 ChatMessageService 에 위임하므로
+    그래프는 요청마다 컴파일하지 않고 한 번만 컴파일합니다.
+    """
+    global _chat_graph
+    if _chat_graph is None:
+        from langgraph.graph import StateGraph, END
+
+        workflow = StateGraph(GraphState)
+        for name in CHAT_GRAPH_NODES:
+            workflow.add_node(name, _service_node(name))
+
+        workflow.set_entry_point("get_context_from_session")
+        workflow.add_edge("get_context_from_session", "generate_queries_node")
+        workflow.add_conditional_edges(
+            "generate_queries_node", ChatMessageService.should_embed_queries_node
+        )
+        workflow.add_edge("embed_queries", "retrieve_portfolio_items")
+        workflow.add_edge("retrieve_portfolio_items", "retrieve_qnas")
+        workflow.add_edge("retrieve_qnas", "generate_chat_message")
+        workflow.add_edge("generate_chat_message", "save_chat")
+        workflow.add_edge("save_chat", "update_context_in_session")
+        workflow.add_edge("update_context_in_session", END)
+
+        _chat_graph = workflow.compile()
+    return _chat_graph
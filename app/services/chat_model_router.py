@@ -0,0 +1,126 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.models.chat_message import ChatMessageType
+
+
+class ChatModelTier(str, Enum):
+    LITE = "LITE"
+    STANDARD = "STANDARD"
+
+
+# 질문 유형을 추정하기 위한 키워드. 앞에 있는 유형이 우선합니다.
+MESSAGE_TYPE_KEYWORDS: Tuple[Tuple[ChatMessageType, Tuple[str, ...]], ...] = (
+    (
+        ChatMessageType.CONTACT,
+        (
+            "연락", "이메일", "메일", "전화", "번호", "깃허브", "github", "블로그",
+            "blog", "링크드인", "linkedin", "email", "e-mail", "contact", "phone",
+        ),
+    ),
+    (
+        ChatMessageType.EDUCATION,
+        (
+            "학교", "대학", "전공", "학력", "졸업", "학위", "부트캠프", "수료",
+            "education", "university", "college", "degree", "major", "graduate",
+        ),
+    ),
+    (
+        ChatMessageType.TECH,
+        (
+            "기술", "스택", "아키텍처", "설계", "구현", "성능", "최적화", "트러블",
+            "장애", "개선", "프로젝트", "stack", "architecture", "design",
+            "implement", "performance", "project",
+        ),
+    ),
+    (
+        ChatMessageType.SUGGEST,
+        ("제안", "협업", "채용", "면접", "커피챗", "offer", "hire", "interview"),
+    ),
+    (
+        ChatMessageType.PERSONAL,
+        ("취미", "성격", "장점", "단점", "가치관", "hobby", "personality"),
+    ),
+    (
+        ChatMessageType.ETC,
+        ("안녕", "반가", "고마", "감사", "hello", "hi ", "thanks", "thank you"),
+    ),
+)
+
+
+def predict_message_type(question: str) -> Optional[ChatMessageType]:
+    """키워드 매칭으로 질문 유형을 추정합니다. 추정할 수 없으면 None."""
+    normalized = f"{question.lower()} "
+    for message_type, keywords in MESSAGE_TYPE_KEYWORDS:
+        if any(keyword in normalized for keyword in keywords):
+            return message_type
+    return None
+
+
+@dataclass(frozen=True)
+class ChatModelRoute:
+    tier: ChatModelTier
+    predicted_type: Optional[ChatMessageType]
+    reason: str
+
+
+class ChatModelRouter:
+    """
+    질문 길이, 추정 질문 유형, 검색된 포트폴리오 항목 수로 답변 모델 등급을 결정합니다.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = settings.CHAT_ROUTING_ENABLED,
+        lite_types: Optional[list[str]] = None,
+        lite_max_items: int = settings.CHAT_ROUTING_LITE_MAX_ITEMS,
+        lite_max_question_length: int = settings.CHAT_ROUTING_LITE_MAX_QUESTION_LENGTH,
+    ):
+        self.enabled = enabled
+        self.lite_types = {
+            ChatMessageType(t)
+            for t in (
+                lite_types
+                if lite_types is not None
+                else settings.CHAT_ROUTING_LITE_TYPES
+            )
+        }
+        self.lite_max_items = lite_max_items
+        self.lite_max_question_length = lite_max_question_length
+
+    def _decide(
+        self, *, question: str, retrieved_item_count: int
+    ) -> ChatModelRoute:
+        predicted_type = predict_message_type(question)
+
+        if not self.enabled:
+            return ChatModelRoute(ChatModelTier.STANDARD, predicted_type, "disabled")
+        if len(question) > self.lite_max_question_length:
+            return ChatModelRoute(
+                ChatModelTier.STANDARD, predicted_type, "long_question"
+            )
+        if retrieved_item_count > self.lite_max_items:
+            return ChatModelRoute(ChatModelTier.STANDARD, predicted_type, "many_items")
+        if predicted_type in self.lite_types:
+            return ChatModelRoute(ChatModelTier.LITE, predicted_type, "simple_type")
+        if predicted_type is None and retrieved_item_count == 0:
+            return ChatModelRoute(ChatModelTier.LITE, predicted_type, "no_context")
+        return ChatModelRoute(ChatModelTier.STANDARD, predicted_type, "default")
+
+    def route(self, *, question: str, retrieved_item_count: int) -> ChatModelRoute:
+        route = self._decide(
+            question=question, retrieved_item_count=retrieved_item_count
+        )
+        metrics.increment(
+            "chat_route_decisions_total", tier=route.tier.value, reason=route.reason
+        )
+        return route
+
+
+def get_chat_model_router() -> ChatModelRouter:
+    return ChatModelRouter()
+
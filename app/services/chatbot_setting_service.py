@@ -1,7 +1,7 @@
 from fastapi import Depends
 
 from app.models.chatbot_setting import ChatbotSetting
-from app.models.user import User
+from app.schemas.user_schema import UserSnapshot
 from app.crud.chatbot_setting_crud import ChatbotSettingCRUD
 from app.schemas.chatbot_setting_schema import ChatbotSettingUpdate
 
@@ -10,12 +10,12 @@ class ChatbotSettingService:
     def __init__(self, crud: ChatbotSettingCRUD = Depends()):
         self.crud = crud
 
-    async def get_settings(self, *, current_user: User) -> ChatbotSetting:
+    async def get_settings(self, *, current_user: UserSnapshot) -> ChatbotSetting:
         setting = await self.crud.get_chatbot_setting_by_user(user=current_user)
         return setting
 
     async def update_settings(
-        self, *, settings_in: ChatbotSettingUpdate, current_user: User
+        self, *, settings_in: ChatbotSettingUpdate, current_user: UserSnapshot
     ) -> ChatbotSetting:
         db_setting = await self.crud.get_chatbot_setting_by_user(user=current_user)
         updated_setting = await self.crud.update_setting(
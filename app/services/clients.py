@@ -0,0 +1,63 @@
+"""
+프로세스 범위 외부 클라이언트.
+
+GCS, FCM, Gemini, 임베딩, Google JWKS 클라이언트는 각 모듈의 get_* 함수가 프로세스마다 하나씩 만들어
+모든 요청과 작업이 공유합니다. 서버는 warmup 이 끝난 뒤 create_clients() 로 미리 만들어
+첫 요청이 자격 증명 파싱/채널 생성 비용을 치르지 않게 하고, 종료 시 close_clients() 로 한 번에 닫습니다.
+"""
+
+import time
+from typing import Callable, Tuple
+
+from app.core.metrics import metrics
+from app.services.embedding_gateway import (
+    close_embedding_gateway,
+    get_embedding_gateway,
+)
+from app.services.google_id_token import (
+    close_google_id_token_verifier,
+    get_google_id_token_verifier,
+)
+from app.services.llm_service import close_llm_service, get_llm_service
+from app.services.notification_dispatcher import (
+    close_notification_dispatcher,
+    get_notification_dispatcher,
+)
+from app.services.pdf_extractor import shutdown_pdf_executor
+from app.services.storage_service import close_storage_backend, get_storage_backend
+
+CLIENT_FACTORIES: Tuple[Tuple[str, Callable[[], object]], ...] = (
+    ("storage", get_storage_backend),
+    ("notification", get_notification_dispatcher),
+    ("embedding", get_embedding_gateway),
+    ("llm", get_llm_service),
+    ("google_id_token", get_google_id_token_verifier),
+)
+
+
+def create_clients() -> None:
+    """
+    공유 클라이언트를 미리 만듭니다. 이벤트 루프에서 호출해야 합니다.
+    (get_* 함수는 잠금 없이 전역 변수를 채우므로 다른 스레드에서 만들면 요청과 경합할 수 있음)
+    실패한 클라이언트는 첫 사용 때 다시 만들어집니다.
+    """
+    started = time.perf_counter()
+    for name, factory in CLIENT_FACTORIES:
+        try:
+            factory()
+        except Exception as e:
+            print(f"Error creating {name} client: {e}")
+    metrics.observe("client_setup_seconds", time.perf_counter() - started)
+
+
+async def close_clients() -> None:
+    """
+    공유 클라이언트를 닫습니다.
+    알림 디스패처가 남은 알림을 먼저 보내고, 임베딩/LLM 채널, HTTP 클라이언트, 저장소 순으로 닫습니다.
+    """
+    await close_notification_dispatcher()
+    await close_embedding_gateway()
+    await close_llm_service()
+    await close_google_id_token_verifier()
+    shutdown_pdf_executor()
+    await close_storage_backend()
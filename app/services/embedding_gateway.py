@@ -0,0 +1,201 @@
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, List, Optional
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+if TYPE_CHECKING:
+    from langchain_core.embeddings import Embeddings
+
+ONNX_MODEL_PREFIX = "onnx:"
+
+
+def create_embeddings_model() -> "Embeddings":
+    """EMBEDDING_MODEL이 onnx:<디렉터리> 이면 로컬 ONNX 모델, 아니면 Gemini 임베딩을 사용합니다."""
+    if settings.EMBEDDING_MODEL.startswith(ONNX_MODEL_PREFIX):
+        from app.services.onnx_embeddings import OnnxEmbeddings
+
+        return OnnxEmbeddings(settings.EMBEDDING_MODEL[len(ONNX_MODEL_PREFIX) :])
+
+    from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+    return GoogleGenerativeAIEmbeddings(
+        model=settings.EMBEDDING_MODEL,
+        google_api_key=settings.GEMINI_API_KEY,
+    )
+
+
+def embedding_model_tag() -> str:
+    """
+    저장된 임베딩에 기록하는 모델 이름. ONNX 모델은 배포마다 경로가 달라질 수 있어 디렉터리 이름만 사용합니다.
+    """
+    if settings.EMBEDDING_MODEL.startswith(ONNX_MODEL_PREFIX):
+        model_dir = settings.EMBEDDING_MODEL[len(ONNX_MODEL_PREFIX) :]
+        return ONNX_MODEL_PREFIX + os.path.basename(os.path.normpath(model_dir))
+    return settings.EMBEDDING_MODEL
+
+
+@dataclass
+class _EmbeddingRequest:
+    texts: List[str]
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class EmbeddingGateway:
+    """
+    동시에 들어온 임베딩 요청을 짧은 시간 창(EMBEDDING_BATCH_WINDOW_MS) 동안 모아 한 번에 호출합니다.
+    모인 텍스트가 API 한도(EMBEDDING_MAX_BATCH_SIZE)를 넘으면 하위 배치로 나눠 병렬로 호출하고,
+    결과는 요청별로 다시 나눠 돌려줍니다.
+    """
+
+    def __init__(self, embeddings_model: "Embeddings"):
+        self.embeddings_model = embeddings_model
+        self._pending: List[_EmbeddingRequest] = []
+        self._pending_texts = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._flushes: set[asyncio.Task] = set()
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+
+        loop = asyncio.get_running_loop()
+        request = _EmbeddingRequest(texts=list(texts), future=loop.create_future())
+        # 한도를 넘기게 되면 지금까지 모인 요청을 먼저 보내 배치가 한도에 맞게 채워지도록 합니다.
+        if (
+            self._pending
+            and self._pending_texts + len(texts) > settings.EMBEDDING_MAX_BATCH_SIZE
+        ):
+            self._flush()
+        self._pending.append(request)
+        self._pending_texts += len(texts)
+
+        if self._pending_texts >= settings.EMBEDDING_MAX_BATCH_SIZE:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                settings.EMBEDDING_BATCH_WINDOW_MS / 1000, self._flush
+            )
+        return await request.future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+
+        requests, self._pending, self._pending_texts = self._pending, [], 0
+        task = asyncio.create_task(self._run_batch(requests))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _embed_sub_batch(self, texts: List[str]) -> List[List[float]]:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(settings.EMBEDDING_MAX_CONCURRENCY)
+        async with self._semaphore:
+            started = time.perf_counter()
+            try:
+                return await self.embeddings_model.aembed_documents(
+                    texts=texts, output_dimensionality=settings.EMBEDDING_DIMENSION
+                )
+            finally:
+                metrics.observe(
+                    "embedding_call_seconds", time.perf_counter() - started
+                )
+
+    async def _run_batch(self, requests: List[_EmbeddingRequest]) -> None:
+        flushed_at = time.perf_counter()
+        texts = [text for request in requests for text in request.texts]
+        metrics.observe("embedding_batch_size", len(texts))
+        metrics.observe("embedding_batch_requests", len(requests))
+        for request in requests:
+            metrics.observe("embedding_wait_seconds", flushed_at - request.enqueued_at)
+
+        size = settings.EMBEDDING_MAX_BATCH_SIZE
+        offsets = list(range(0, len(texts), size))
+        results = await asyncio.gather(
+            *(self._embed_sub_batch(texts[offset : offset + size]) for offset in offsets),
+            return_exceptions=True,
+        )
+
+        # 하위 배치가 실패하면 그 배치에 텍스트가 포함된 요청만 실패시킵니다.
+        vectors: List[Optional[List[float]]] = []
+        errors: List[Optional[BaseException]] = []
+        for offset, result in zip(offsets, results):
+            count = len(texts[offset : offset + size])
+            if isinstance(result, BaseException):
+                vectors.extend([None] * count)
+                errors.extend([result] * count)
+            else:
+                vectors.extend(result)
+                errors.extend([None] * count)
+
+        failed: List[_EmbeddingRequest] = []
+        start = 0
+        for request in requests:
+            end = start + len(request.texts)
+            error = next((e for e in errors[start:end] if e is not None), None)
+            if request.future.done():
+                # 호출자가 이미 취소된 경우
+                pass
+            elif error is None:
+                request.future.set_result(vectors[start:end])
+            elif len(requests) > 1:
+                failed.append(request)
+            else:
+                request.future.set_exception(error)
+            start = end
+
+        # 다른 요청의 텍스트 때문에 실패했을 수 있으므로, 함께 묶였던 요청은 단독으로 한 번 더 시도합니다.
+        if failed:
+            metrics.increment("embedding_isolated_retries_total", value=len(failed))
+            await asyncio.gather(*(self._run_isolated(request) for request in failed))
+
+    async def _run_isolated(self, request: _EmbeddingRequest) -> None:
+        size = settings.EMBEDDING_MAX_BATCH_SIZE
+        try:
+            results = await asyncio.gather(
+                *(
+                    self._embed_sub_batch(request.texts[offset : offset + size])
+                    for offset in range(0, len(request.texts), size)
+                )
+            )
+            if not request.future.done():
+                request.future.set_result(
+                    [vector for result in results for vector in result]
+                )
+        except Exception as e:
+            if not request.future.done():
+                request.future.set_exception(e)
+
+    async def close(self) -> None:
+        self._flush()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+        close_model = getattr(self.embeddings_model, "close", None)
+        if callable(close_model):
+            close_model()
+
+
+_gateway: Optional[EmbeddingGateway] = None
+
+
+def get_embedding_gateway() -> EmbeddingGateway:
+    """프로세스 전체에서 공유하는 임베딩 게이트웨이."""
+    global _gateway
+    if _gateway is None:
+        _gateway = EmbeddingGateway(create_embeddings_model())
+    return _gateway
+
+
+async def close_embedding_gateway() -> None:
+    global _gateway
+    if _gateway is not None:
+        await _gateway.close()
+        _gateway = None
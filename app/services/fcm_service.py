@@ -1,31 +1,14 @@
-import firebase_admin
-from firebase_admin import credentials, messaging
-from app.core.config import settings
-import json
+from app.services.notification_dispatcher import get_notification_dispatcher
 
 
 class FCMService:
+    """푸시 알림 전송 서비스. 실제 전송은 공유 NotificationDispatcher가 묶어서 처리합니다."""
+
     def __init__(self):
-        if not firebase_admin._apps:
-            if settings.APP_ENV == "local":
-                cred = credentials.Certificate(settings.FIREBASE_CREDENTIALS)
-            else:
-                cred_json = json.loads(settings.FIREBASE_CREDENTIALS)
-                cred = credentials.Certificate(cred_json)
-            firebase_admin.initialize_app(cred)
+        self.dispatcher = get_notification_dispatcher()
 
-    def send_notification(self, token: str, title: str, body: str) -> None:
+    async def send_notification(self, token: str, title: str, body: str) -> None:
         try:
-            message = messaging.Message(
-                notification=messaging.Notification(
-                    title=title,
-                    body=body,
-                ),
-                token=token,
-            )
-            response = messaging.send(message)
-            print(f"Successfully sent message: {response}")
+            await self.dispatcher.enqueue(token=token, title=title, body=body)
         except Exception as e:
-            print(f"Error sending FCM message: {e}")
-            # TODO: Add proper logging
-
+            print(f"Error enqueueing FCM message: {e}")
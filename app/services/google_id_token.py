@@ -0,0 +1,143 @@
+import asyncio
+import re
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from jose import JWTError, jwt
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+if TYPE_CHECKING:
+    import httpx
+
+GOOGLE_JWKS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+class GoogleIdTokenVerifier:
+    """
+    Google ID 토큰을 이벤트 루프를 막지 않고 검증합니다.
+
+    서명 키(JWKS)는 프로세스 전체에서 공유하며, 응답의 Cache-Control max-age(- Age)까지 유효합니다.
+    만료 GOOGLE_JWKS_REFRESH_MARGIN_SECONDS 전부터는 캐시된 키로 검증하면서
+    백그라운드에서 새 키를 받아오고, 가져오기에 실패하면 기존 키를 계속 사용합니다.
+    토큰의 kid가 캐시에 없을 때(키 교체 직후)만 요청 경로에서 다시 받아오며,
+    위조 토큰으로 인한 반복 요청을 막기 위해 최소 간격을 둡니다.
+    """
+
+    def __init__(self):
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._expires_at = 0.0
+        self._attempted_at = float("-inf")
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    async def verify(self, token: str) -> Optional[Dict[str, Any]]:
+        """검증된 클레임을 반환하고, 유효하지 않은 토큰이면 None 을 반환합니다."""
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+        except JWTError:
+            return None
+
+        key = await self._get_key(kid)
+        if key is None:
+            metrics.increment("google_id_token_verify_total", outcome="unknown_kid")
+            return None
+        try:
+            claims = jwt.decode(
+                token,
+                key,
+                algorithms=["RS256"],
+                audience=settings.GOOGLE_CLIENT_ID,
+                issuer=GOOGLE_ISSUERS,
+                options={"verify_at_hash": False},
+            )
+        except JWTError:
+            metrics.increment("google_id_token_verify_total", outcome="invalid")
+            return None
+        metrics.increment("google_id_token_verify_total", outcome="ok")
+        return claims
+
+    async def _get_key(self, kid: Optional[str]) -> Optional[Dict[str, Any]]:
+        now = time.monotonic()
+        can_fetch = (
+            now - self._attempted_at >= settings.GOOGLE_JWKS_MIN_REFETCH_SECONDS
+        )
+        if now >= self._expires_at or kid not in self._keys:
+            if can_fetch:
+                await self._refresh(requested_at=now)
+        elif (
+            now >= self._expires_at - settings.GOOGLE_JWKS_REFRESH_MARGIN_SECONDS
+            and can_fetch
+        ):
+            self._schedule_refresh(requested_at=now)
+        return self._keys.get(kid)
+
+    def _schedule_refresh(self, *, requested_at: float) -> None:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(
+                self._refresh(requested_at=requested_at)
+            )
+
+    async def _refresh(self, *, requested_at: float) -> None:
+        async with self._lock:
+            # 기다리는 동안 다른 요청이 이미 받아왔다면(성공/실패 무관) 다시 받지 않습니다.
+            if self._attempted_at > requested_at:
+                return
+            self._attempted_at = time.monotonic()
+            try:
+                response = await self._get_client().get(GOOGLE_JWKS_URL)
+                response.raise_for_status()
+                keys = {key["kid"]: key for key in response.json()["keys"]}
+            except Exception as e:
+                print(f"Error fetching Google JWKS: {e}")
+                metrics.increment("google_jwks_fetch_total", outcome="error")
+                return
+
+            self._keys = keys
+            self._expires_at = time.monotonic() + self._max_age(response)
+            metrics.increment("google_jwks_fetch_total", outcome="ok")
+
+    def _max_age(self, response: "httpx.Response") -> float:
+        match = MAX_AGE_PATTERN.search(response.headers.get("cache-control", ""))
+        if not match:
+            return settings.GOOGLE_JWKS_DEFAULT_TTL_SECONDS
+        age = int(response.headers.get("age", "0") or 0)
+        return max(int(match.group(1)) - age, 0)
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                timeout=settings.GOOGLE_JWKS_HTTP_TIMEOUT_SECONDS
+            )
+        return self._client
+
+    async def close(self) -> None:
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+_verifier: Optional[GoogleIdTokenVerifier] = None
+
+
+def get_google_id_token_verifier() -> GoogleIdTokenVerifier:
+    """프로세스 전체에서 공유하는 Google ID 토큰 검증기."""
+    global _verifier
+    if _verifier is None:
+        _verifier = GoogleIdTokenVerifier()
+    return _verifier
+
+
+async def close_google_id_token_verifier() -> None:
+    global _verifier
+    if _verifier is not None:
+        await _verifier.close()
+        _verifier = None
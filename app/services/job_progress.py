@@ -0,0 +1,118 @@
+import time
+from typing import AsyncIterator, Optional
+
+import redis.asyncio as aioredis
+from fastapi import Depends
+
+from app.core.config import settings
+from app.db.session import get_redis_client
+from app.schemas.job_schema import JobProgressEvent, JobStage
+
+CHANNEL_PREFIX = "jobs:progress:"
+LAST_EVENT_KEY_PREFIX = "jobs:progress:last:"
+OWNER_KEY_PREFIX = "jobs:owner:"
+
+
+class JobProgress:
+    """
+    작업별 진행 상황을 Redis pub/sub으로 전달합니다.
+    마지막 이벤트는 별도 키에 저장해 늦게 구독한 클라이언트도 현재 단계를 바로 받을 수 있습니다.
+    """
+
+    def __init__(self, redis_client: aioredis.Redis):
+        self.redis = redis_client
+
+    async def register(self, job_id: str, user_id: str) -> None:
+        """작업 소유자와 초기(QUEUED) 이벤트를 저장합니다."""
+        ttl = settings.JOB_PROGRESS_TTL_SECONDS
+        await self.redis.set(f"{OWNER_KEY_PREFIX}{job_id}", user_id, ex=ttl)
+        await self.publish(job_id, JobStage.QUEUED, 0)
+
+    async def get_owner(self, job_id: str) -> Optional[str]:
+        return await self.redis.get(f"{OWNER_KEY_PREFIX}{job_id}")
+
+    async def get_last_event(self, job_id: str) -> Optional[JobProgressEvent]:
+        raw_last = await self.redis.get(f"{LAST_EVENT_KEY_PREFIX}{job_id}")
+        if not raw_last:
+            return None
+        return JobProgressEvent.model_validate_json(raw_last)
+
+    async def publish(
+        self,
+        job_id: Optional[str],
+        stage: JobStage,
+        percent: int,
+        detail: Optional[str] = None,
+    ) -> None:
+        """진행 이벤트를 발행합니다. 진행 알림 실패가 작업 자체를 실패시키지 않도록 오류는 기록만 합니다."""
+        if not job_id:
+            return
+        event = JobProgressEvent(
+            job_id=job_id, stage=stage, percent=percent, detail=detail
+        ).model_dump_json()
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.set(
+                    f"{LAST_EVENT_KEY_PREFIX}{job_id}",
+                    event,
+                    ex=settings.JOB_PROGRESS_TTL_SECONDS,
+                )
+                pipe.publish(f"{CHANNEL_PREFIX}{job_id}", event)
+                await pipe.execute()
+        except Exception as e:
+            print(f"Error publishing progress for job {job_id}: {e}")
+
+    async def stream(self, job_id: str) -> AsyncIterator[Optional[JobProgressEvent]]:
+        """
+        마지막 이벤트부터 시작해 작업이 끝날 때까지 진행 이벤트를 전달합니다.
+        구독을 먼저 연 뒤 마지막 이벤트를 읽으므로 그 사이에 발행된 이벤트를 놓치지 않습니다.
+
+        저장된 진행 상황이 없거나(만료) 이미 종료 단계이면 바로 끝나고,
+        JOB_PROGRESS_STREAM_MAX_SECONDS 가 지나면 종료 이벤트 없이 끝납니다.
+        """
+        deadline = time.monotonic() + settings.JOB_PROGRESS_STREAM_MAX_SECONDS
+        pubsub = self.redis.pubsub()
+        await pubsub.subscribe(f"{CHANNEL_PREFIX}{job_id}")
+        try:
+            event = await self.get_last_event(job_id)
+            if event is None:
+                return
+            yield event
+            if event.stage.is_terminal:
+                return
+
+            while (remaining := deadline - time.monotonic()) > 0:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=min(settings.JOB_PROGRESS_KEEPALIVE_SECONDS, remaining),
+                )
+                if message is None:
+                    # pub/sub 메시지를 놓쳤거나 진행 상황이 만료된 경우를 저장된 상태로 확인합니다.
+                    event = await self.get_last_event(job_id)
+                    if event is None:
+                        return
+                    if event.stage.is_terminal:
+                        yield event
+                        return
+                    # 연결 유지를 위해 None을 전달하면 엔드포인트가 keep-alive 주석을 보냅니다.
+                    yield None
+                    continue
+                event = JobProgressEvent.model_validate_json(message["data"])
+                yield event
+                if event.stage.is_terminal:
+                    return
+        finally:
+            await pubsub.unsubscribe()
+            await pubsub.aclose()
+
+
+async def get_job_progress(
+    redis_client: aioredis.Redis = Depends(get_redis_client),
+) -> JobProgress:
+    return JobProgress(redis_client)
+
+
+def format_sse(event: Optional[JobProgressEvent]) -> str:
+    if event is None:
+        return ": keep-alive\n\n"
+    return f"event: {event.stage.value}\ndata: {event.model_dump_json()}\n\n"
@@ -0,0 +1,243 @@
+import asyncio
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import redis.asyncio as aioredis
+from fastapi import Depends
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.session import get_redis_client
+from app.schemas.job_schema import Job, QueueDepth
+
+JobHandler = Callable[[Job, bool], Awaitable[None]]
+DeadLetterHandler = Callable[[Job], Awaitable[None]]
+
+QUEUE_KEY = "jobs:queue"
+DELAYED_KEY = "jobs:delayed"
+DEAD_KEY = "jobs:dead"
+PROCESSING_KEY_PREFIX = "jobs:processing:"
+HEARTBEAT_KEY_PREFIX = "jobs:worker:"
+
+
+class JobQueue:
+    """
+    Redis 리스트 기반의 영속 작업 큐입니다.
+
+    - jobs:queue               대기 중인 작업 (LPUSH → BLMOVE RIGHT)
+    - jobs:processing:{worker} 워커가 가져가 처리 중인 작업
+    - jobs:delayed             재시도 대기 작업 (score = 실행 가능 시각)
+    - jobs:dead                최대 시도 횟수를 넘긴 작업
+    """
+
+    def __init__(self, redis_client: aioredis.Redis):
+        self.redis = redis_client
+
+    async def enqueue(
+        self, name: str, payload: Dict[str, Any], *, job_id: Optional[str] = None
+    ) -> Job:
+        job = Job(name=name, payload=payload)
+        if job_id:
+            job.id = job_id
+        await self.redis.lpush(QUEUE_KEY, job.model_dump_json())
+        metrics.increment("jobs_enqueued_total", job=name)
+        return job
+
+    async def reserve(self, worker_id: str, timeout: float) -> Optional[str]:
+        return await self.redis.blmove(
+            QUEUE_KEY,
+            f"{PROCESSING_KEY_PREFIX}{worker_id}",
+            timeout,
+            src="RIGHT",
+            dest="LEFT",
+        )
+
+    async def ack(self, worker_id: str, raw_job: str) -> None:
+        await self.redis.lrem(f"{PROCESSING_KEY_PREFIX}{worker_id}", 1, raw_job)
+
+    async def fail(
+        self, worker_id: Optional[str], raw_job: str, job: Job, error: str
+    ) -> bool:
+        """실패한 작업을 재시도 대기열 또는 dead-letter 리스트로 옮깁니다. 재시도 여부를 반환."""
+        job.attempts += 1
+        job.last_error = error[:1000]
+        retry = job.attempts < settings.JOB_MAX_ATTEMPTS
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            if worker_id is not None:
+                pipe.lrem(f"{PROCESSING_KEY_PREFIX}{worker_id}", 1, raw_job)
+            if retry:
+                backoff = min(
+                    settings.JOB_RETRY_BACKOFF_SECONDS * 2 ** (job.attempts - 1),
+                    settings.JOB_RETRY_BACKOFF_MAX_SECONDS,
+                )
+                pipe.zadd(DELAYED_KEY, {job.model_dump_json(): time.time() + backoff})
+            else:
+                pipe.lpush(DEAD_KEY, job.model_dump_json())
+            await pipe.execute()
+        return retry
+
+    async def promote_delayed(self) -> int:
+        """실행 시각이 지난 재시도 작업을 대기열로 되돌립니다."""
+        due = await self.redis.zrangebyscore(DELAYED_KEY, "-inf", time.time())
+        promoted = 0
+        for raw_job in due:
+            # ZREM에 성공한 워커만 옮기므로 여러 워커가 동시에 실행해도 중복되지 않습니다.
+            if await self.redis.zrem(DELAYED_KEY, raw_job):
+                await self.redis.lpush(QUEUE_KEY, raw_job)
+                promoted += 1
+        return promoted
+
+    async def heartbeat(self, worker_id: str, ttl: int) -> None:
+        await self.redis.set(f"{HEARTBEAT_KEY_PREFIX}{worker_id}", 1, ex=ttl)
+
+    async def recover_orphaned(
+        self, on_dead_letter: Optional[DeadLetterHandler] = None
+    ) -> int:
+        """
+        하트비트가 끊긴 워커의 처리 중 작업을 실패로 간주해 재시도합니다.
+        최대 시도 횟수를 넘겨 dead-letter로 옮긴 작업은 on_dead_letter로 전달합니다.
+        """
+        recovered = 0
+        async for key in self.redis.scan_iter(match=f"{PROCESSING_KEY_PREFIX}*"):
+            worker_id = key[len(PROCESSING_KEY_PREFIX) :]
+            if await self.redis.exists(f"{HEARTBEAT_KEY_PREFIX}{worker_id}"):
+                continue
+            while raw_job := await self.redis.rpop(key):
+                job = Job.model_validate_json(raw_job)
+                retried = await self.fail(None, raw_job, job, "worker lost")
+                recovered += 1
+                if not retried and on_dead_letter is not None:
+                    await on_dead_letter(job)
+        return recovered
+
+    async def depth(self) -> QueueDepth:
+        processing = 0
+        async for key in self.redis.scan_iter(match=f"{PROCESSING_KEY_PREFIX}*"):
+            processing += await self.redis.llen(key)
+
+        depth = QueueDepth(
+            queued=await self.redis.llen(QUEUE_KEY),
+            processing=processing,
+            delayed=await self.redis.zcard(DELAYED_KEY),
+            dead=await self.redis.llen(DEAD_KEY),
+        )
+        for state, value in depth.model_dump().items():
+            metrics.set_gauge("job_queue_depth", value, state=state)
+        return depth
+
+
+async def get_job_queue(
+    redis_client: aioredis.Redis = Depends(get_redis_client),
+) -> JobQueue:
+    return JobQueue(redis_client)
+
+
+class JobWorker:
+    """
+    JobQueue를 소비하는 워커입니다. 최대 concurrency개의 작업을 동시에 처리하고,
+    실패한 작업은 지수 백오프로 재시도한 뒤 dead-letter 리스트로 보냅니다.
+
+    작업이 dead-letter로 옮겨지면 (핸들러 예외, 알 수 없는 작업, 워커 유실 모두)
+    작업 이름별 dead_letter_handlers 를 호출해 상태를 FAILED로 표시하고 실패 알림을 보냅니다.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handlers: Dict[str, JobHandler],
+        *,
+        dead_letter_handlers: Optional[Dict[str, DeadLetterHandler]] = None,
+        concurrency: int = settings.JOB_WORKER_CONCURRENCY,
+    ):
+        self.queue = queue
+        self.handlers = handlers
+        self.dead_letter_handlers = dead_letter_handlers or {}
+        self.concurrency = concurrency
+        self.worker_id = str(uuid.uuid4())
+        self._stopping = asyncio.Event()
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    async def run(self) -> None:
+        await self.queue.heartbeat(self.worker_id, settings.JOB_WORKER_HEARTBEAT_TTL)
+        recovered = await self.queue.recover_orphaned(self._dead_letter)
+        if recovered:
+            print(f"Recovered {recovered} orphaned jobs")
+
+        consumers = [
+            asyncio.create_task(self._consume()) for _ in range(self.concurrency)
+        ]
+        maintenance = asyncio.create_task(self._maintain())
+        await asyncio.gather(*consumers)
+        maintenance.cancel()
+
+    async def _maintain(self) -> None:
+        interval = max(settings.JOB_WORKER_HEARTBEAT_TTL // 3, 1)
+        while not self._stopping.is_set():
+            try:
+                await self.queue.heartbeat(
+                    self.worker_id, settings.JOB_WORKER_HEARTBEAT_TTL
+                )
+                await self.queue.promote_delayed()
+                await self.queue.recover_orphaned(self._dead_letter)
+                await self.queue.depth()
+            except Exception as e:
+                print(f"Job worker maintenance failed: {e}")
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _consume(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                raw_job = await self.queue.reserve(self.worker_id, timeout=1)
+            except Exception as e:
+                print(f"Error reserving job: {e}")
+                await asyncio.sleep(1)
+                continue
+            if raw_job is None:
+                continue
+            await self._process(raw_job)
+
+    async def _process(self, raw_job: str) -> None:
+        job = Job.model_validate_json(raw_job)
+        handler = self.handlers.get(job.name)
+        is_last_attempt = job.attempts + 1 >= settings.JOB_MAX_ATTEMPTS
+
+        started = time.perf_counter()
+        try:
+            if handler is None:
+                raise LookupError(f"Unknown job: {job.name}")
+            await handler(job, is_last_attempt)
+        except Exception as e:
+            print(f"Job {job.id} ({job.name}) failed on attempt {job.attempts + 1}: {e}")
+            retried = await self.queue.fail(self.worker_id, raw_job, job, repr(e))
+            metrics.increment(
+                "jobs_processed_total",
+                job=job.name,
+                outcome="retried" if retried else "dead",
+            )
+            if not retried:
+                await self._dead_letter(job)
+        else:
+            await self.queue.ack(self.worker_id, raw_job)
+            metrics.increment("jobs_processed_total", job=job.name, outcome="succeeded")
+        finally:
+            metrics.observe(
+                "job_duration_seconds", time.perf_counter() - started, job=job.name
+            )
+
+    async def _dead_letter(self, job: Job) -> None:
+        """dead-letter로 옮긴 작업의 최종 실패 처리를 실행합니다."""
+        handler = self.dead_letter_handlers.get(job.name)
+        if handler is None:
+            print(f"Job {job.id} ({job.name}) dead-lettered without a handler")
+            return
+        try:
+            await handler(job)
+        except Exception as e:
+            print(f"Dead-letter handler failed for job {job.id} ({job.name}): {e}")
@@ -1,14 +1,17 @@
+import asyncio
+import hashlib
+import inspect
 import json
-from typing import List
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser, StrOutputParser
-from langchain.output_parsers import OutputFixingParser
-from langchain_google_genai import ChatGoogleGenerativeAI
+import time
+from typing import Awaitable, Callable, List, Optional, Tuple
 
 from app.core.config import settings
+from app.core.metrics import metrics
 from app.core.prompts import (
     GENERATE_QNA_SYSTEM_PROMPT,
     GENERATE_QNA_USER_PROMPT,
+    GENERATE_BATCH_QNA_SYSTEM_PROMPT,
+    GENERATE_BATCH_QNA_USER_PROMPT,
     STRUCTURE_PORTFOLIO_SYSTEM_PROMPT,
     STRUCTURE_PORTFOLIO_USER_PROMPT,
     VECTOR_QUERY_GENERATOR_SYSTEM_PROMPT,
@@ -20,15 +23,23 @@ from app.core.prompts import (
 )
 from app.models.portfolio_item import PortfolioItem
 from app.schemas.llm_schema import (
+    LLMBatchQnAOutput,
     LLMPortfolio,
     LLMQnAOutput,
     LLMSplitQueries,
     LLMChatAnswer,
 )
+from app.services.chat_model_router import ChatModelTier
+from app.services.portfolio_chunker import (
+    merge_portfolio_items,
+    split_pages_into_chunks,
+)
 
 
 class LLMService:
     def __init__(self):
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
         self.pdf_parsing_model = ChatGoogleGenerativeAI(
             model=settings.PDF_PARSING_LLM_MODEL,
             google_api_key=settings.GEMINI_API_KEY,
@@ -51,6 +62,16 @@ class LLMService:
             temperature=0.8,
             convert_system_message_to_human=True,
         )
+        self.chat_lite_model = ChatGoogleGenerativeAI(
+            model=settings.CHAT_LITE_LLM_MODEL,
+            google_api_key=settings.GEMINI_API_KEY,
+            temperature=0.8,
+            convert_system_message_to_human=True,
+        )
+        self.chat_models = {
+            ChatModelTier.STANDARD: self.chat_model,
+            ChatModelTier.LITE: self.chat_lite_model,
+        }
         self.summarize_model = ChatGoogleGenerativeAI(
             model=settings.SUMMARIZE_LLM_MODEL,
             google_api_key=settings.GEMINI_API_KEY,
@@ -58,7 +79,49 @@ class LLMService:
             convert_system_message_to_human=True,
         )
 
+    async def close(self) -> None:
+        """모델 클라이언트가 연 gRPC 채널을 닫습니다."""
+        models = (
+            self.pdf_parsing_model,
+            self.generate_qna_model,
+            self.query_generation_model,
+            self.chat_model,
+            self.chat_lite_model,
+            self.summarize_model,
+        )
+        for model in models:
+            for client in (model.client, model.async_client_running):
+                transport = getattr(client, "transport", None)
+                if transport is None:
+                    continue
+                try:
+                    # 비동기 클라이언트의 transport.close()는 코루틴을 반환합니다.
+                    result = transport.close()
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as e:
+                    print(f"Error closing LLM client: {e}")
+
+    @staticmethod
+    def structuring_version() -> str:
+        """구조화 결과에 영향을 주는 프롬프트/모델/분할 설정의 해시 (결과 캐시 키에 사용)."""
+        source = "\n".join(
+            [
+                STRUCTURE_PORTFOLIO_SYSTEM_PROMPT,
+                STRUCTURE_PORTFOLIO_USER_PROMPT,
+                json.dumps(LLMPortfolio.model_json_schema(), sort_keys=True),
+                settings.PDF_PARSING_LLM_MODEL,
+                settings.PORTFOLIO_STRUCTURE_MODE,
+                str(settings.PORTFOLIO_CHUNK_MAX_CHARS),
+            ]
+        )
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()[:16]
+
     async def structure_portfolio_from_text(self, *, text: str) -> LLMPortfolio:
+        from langchain.output_parsers import OutputFixingParser
+        from langchain_core.output_parsers import PydanticOutputParser
+        from langchain_core.prompts import ChatPromptTemplate
+
         portfolio_parser = PydanticOutputParser(pydantic_object=LLMPortfolio)
 
         fix_parser = OutputFixingParser.from_llm(
@@ -81,9 +144,54 @@ class LLMService:
         parsed_portfolio = await chain.ainvoke({})
         return parsed_portfolio
 
+    async def structure_portfolio_from_pages(
+        self,
+        *,
+        pages: List[str],
+        on_chunk_done: Optional[Callable[[int, int], Awaitable[None]]] = None,
+    ) -> LLMPortfolio:
+        """
+        긴 포트폴리오는 페이지 경계로 나눈 청크를 동시에 구조화한 뒤 병합합니다.
+        (PORTFOLIO_STRUCTURE_MODE: single | chunked | auto)
+        on_chunk_done(완료 청크 수, 전체 청크 수)은 청크가 끝날 때마다 호출됩니다.
+        """
+        mode = settings.PORTFOLIO_STRUCTURE_MODE
+        text = " ".join(pages)
+        if mode == "single" or (
+            mode == "auto" and len(text) <= settings.PORTFOLIO_CHUNK_MAX_CHARS
+        ):
+            return await self.structure_portfolio_from_text(text=text)
+
+        chunks = split_pages_into_chunks(
+            pages, max_chars=settings.PORTFOLIO_CHUNK_MAX_CHARS
+        )
+        if len(chunks) <= 1:
+            return await self.structure_portfolio_from_text(text=text)
+
+        semaphore = asyncio.Semaphore(settings.PORTFOLIO_STRUCTURE_CONCURRENCY)
+        done = 0
+
+        async def structure_chunk(chunk: str) -> LLMPortfolio:
+            nonlocal done
+            async with semaphore:
+                result = await self.structure_portfolio_from_text(text=chunk)
+            done += 1
+            if on_chunk_done:
+                await on_chunk_done(done, len(chunks))
+            return result
+
+        results = await asyncio.gather(*(structure_chunk(c) for c in chunks))
+        return LLMPortfolio(
+            items=merge_portfolio_items([result.items for result in results])
+        )
+
     async def generate_qna_for_portfolio_item(
         self, *, item: PortfolioItem
     ) -> LLMQnAOutput:
+        from langchain.output_parsers import OutputFixingParser
+        from langchain_core.output_parsers import PydanticOutputParser
+        from langchain_core.prompts import ChatPromptTemplate
+
         qna_parser = PydanticOutputParser(pydantic_object=LLMQnAOutput)
 
         fix_parser = OutputFixingParser.from_llm(
@@ -109,7 +217,53 @@ class LLMService:
         parsed_qna = await chain.ainvoke({})
         return parsed_qna
 
+    async def generate_qna_for_portfolio_items(
+        self, *, items: List[Tuple[str, PortfolioItem]]
+    ) -> LLMBatchQnAOutput:
+        """여러 항목의 Q&A를 한 번의 호출로 생성합니다. items는 (item_id, 항목) 목록입니다."""
+        from langchain.output_parsers import OutputFixingParser
+        from langchain_core.output_parsers import PydanticOutputParser
+        from langchain_core.prompts import ChatPromptTemplate
+
+        batch_parser = PydanticOutputParser(pydantic_object=LLMBatchQnAOutput)
+
+        fix_parser = OutputFixingParser.from_llm(
+            parser=batch_parser, llm=self.generate_qna_model
+        )
+
+        prompt = ChatPromptTemplate.from_messages(
+            [
+                ("system", GENERATE_BATCH_QNA_SYSTEM_PROMPT),
+                ("human", GENERATE_BATCH_QNA_USER_PROMPT),
+            ]
+        )
+
+        prompt = prompt.partial(
+            format_instructions=batch_parser.get_format_instructions(),
+            items=json.dumps(
+                [
+                    {
+                        "item_id": item_id,
+                        "topic": item.topic,
+                        "tech_stack": item.tech_stack,
+                        "content": item.content,
+                    }
+                    for item_id, item in items
+                ],
+                ensure_ascii=False,
+                indent=2,
+            ),
+        )
+
+        chain = prompt | self.generate_qna_model | fix_parser
+
+        return await chain.ainvoke({})
+
     async def generate_queries(self, *, context: str, user_input: str) -> List[str]:
+        from langchain.output_parsers import OutputFixingParser
+        from langchain_core.output_parsers import PydanticOutputParser
+        from langchain_core.prompts import ChatPromptTemplate
+
         parser = PydanticOutputParser(pydantic_object=LLMSplitQueries)
 
         fix_parser = OutputFixingParser.from_llm(
@@ -135,11 +289,21 @@ class LLMService:
         return response.queries
 
     async def generate_chat_answer(
-        self, *, conversation_history: str, portfolio_context: str, user_input: str
+        self,
+        *,
+        conversation_history: str,
+        portfolio_context: str,
+        user_input: str,
+        tier: ChatModelTier = ChatModelTier.STANDARD,
     ) -> LLMChatAnswer:
+        from langchain.output_parsers import OutputFixingParser
+        from langchain_core.output_parsers import PydanticOutputParser
+        from langchain_core.prompts import ChatPromptTemplate
+
+        chat_model = self.chat_models[tier]
         parser = PydanticOutputParser(pydantic_object=LLMChatAnswer)
 
-        fix_parser = OutputFixingParser.from_llm(parser=parser, llm=self.chat_model)
+        fix_parser = OutputFixingParser.from_llm(parser=parser, llm=chat_model)
 
         prompt = ChatPromptTemplate.from_messages(
             [
@@ -155,12 +319,39 @@ class LLMService:
             user_input=user_input,
         )
 
-        chain = prompt | self.chat_model | fix_parser
+        chain = prompt | chat_model
 
-        response = await chain.ainvoke({})
+        started = time.perf_counter()
+        message = await chain.ainvoke({})
+        metrics.observe(
+            "chat_answer_latency_seconds",
+            time.perf_counter() - started,
+            tier=tier.value,
+            model=chat_model.model,
+        )
+        metrics.increment("chat_answer_requests_total", tier=tier.value)
+
+        usage = getattr(message, "usage_metadata", None) or {}
+        metrics.increment(
+            "chat_answer_tokens_total",
+            usage.get("input_tokens", 0),
+            tier=tier.value,
+            kind="input",
+        )
+        metrics.increment(
+            "chat_answer_tokens_total",
+            usage.get("output_tokens", 0),
+            tier=tier.value,
+            kind="output",
+        )
+
+        response = await fix_parser.ainvoke(message)
         return response
 
     async def summarize_conversation(self, *, conversation_history: str) -> str:
+        from langchain_core.output_parsers import StrOutputParser
+        from langchain_core.prompts import ChatPromptTemplate
+
         parser = StrOutputParser()
 
         prompt = ChatPromptTemplate.from_messages(
@@ -178,3 +369,21 @@ class LLMService:
 
         response = await chain.ainvoke({})
         return response
+
+
+_llm_service: Optional[LLMService] = None
+
+
+def get_llm_service() -> LLMService:
+    """프로세스 전체에서 공유하는 LLM 서비스. (모델 클라이언트와 연결을 요청마다 만들지 않음)"""
+    global _llm_service
+    if _llm_service is None:
+        _llm_service = LLMService()
+    return _llm_service
+
+
+async def close_llm_service() -> None:
+    global _llm_service
+    if _llm_service is not None:
+        await _llm_service.close()
+        _llm_service = None
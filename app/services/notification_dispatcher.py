@@ -0,0 +1,248 @@
+import asyncio
+import json
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+# FCM send_each는 한 번에 최대 500개 메시지를 허용합니다.
+FCM_MAX_BATCH_SIZE = 500
+
+
+@dataclass
+class Notification:
+    token: str
+    title: str
+    body: str
+    attempts: int = 0
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class NotificationBackend(ABC):
+    """푸시 알림 전송 백엔드."""
+
+    @abstractmethod
+    async def send_batch(
+        self, notifications: List[Notification]
+    ) -> List[Optional[Exception]]:
+        """알림 목록을 전송하고, 알림별 오류(성공 시 None)를 같은 순서로 반환합니다."""
+
+    def is_transient(self, error: Exception) -> bool:
+        return False
+
+
+class FirebaseNotificationBackend(NotificationBackend):
+    def __init__(self):
+        import firebase_admin
+        from firebase_admin import credentials
+
+        if not firebase_admin._apps:
+            if settings.APP_ENV == "local":
+                cred = credentials.Certificate(settings.FIREBASE_CREDENTIALS)
+            else:
+                cred_json = json.loads(settings.FIREBASE_CREDENTIALS)
+                cred = credentials.Certificate(cred_json)
+            firebase_admin.initialize_app(cred)
+
+    async def send_batch(
+        self, notifications: List[Notification]
+    ) -> List[Optional[Exception]]:
+        from firebase_admin import messaging
+
+        messages = [
+            messaging.Message(
+                notification=messaging.Notification(
+                    title=notification.title,
+                    body=notification.body,
+                ),
+                token=notification.token,
+            )
+            for notification in notifications
+        ]
+        # send_each는 블로킹 HTTP 호출이므로 이벤트 루프 밖에서 실행합니다.
+        batch_response = await asyncio.to_thread(messaging.send_each, messages)
+        return [response.exception for response in batch_response.responses]
+
+    def is_transient(self, error: Exception) -> bool:
+        from firebase_admin import exceptions, messaging
+
+        return isinstance(
+            error,
+            (
+                exceptions.UnavailableError,
+                exceptions.InternalError,
+                exceptions.DeadlineExceededError,
+                messaging.QuotaExceededError,
+            ),
+        )
+
+
+class LocalNotificationBackend(NotificationBackend):
+    """Firebase 자격 증명 없이 로컬에서 실행할 때 사용하는 백엔드. 알림을 전송하지 않고 로그만 남깁니다."""
+
+    async def send_batch(
+        self, notifications: List[Notification]
+    ) -> List[Optional[Exception]]:
+        for notification in notifications:
+            print(
+                f"[local notification] {notification.title} -> "
+                f"{notification.token[:12]}: {notification.body}"
+            )
+        return [None] * len(notifications)
+
+
+class NotificationDispatcher:
+    """
+    알림을 제한된 크기의 큐에 모아 하나의 워커 태스크가 send_each로 묶어 전송합니다.
+    일시적인 오류는 지수 백오프로 NOTIFICATION_MAX_ATTEMPTS까지 재시도합니다.
+    """
+
+    def __init__(self, backend: NotificationBackend):
+        self.backend = backend
+        self.queue: asyncio.Queue[Notification] = asyncio.Queue(
+            maxsize=settings.NOTIFICATION_QUEUE_SIZE
+        )
+        self._worker: Optional[asyncio.Task] = None
+        # 재시도 대기 태스크 → 알림 (종료 시 대기 중인 재시도를 바로 큐에 넣기 위해 보관)
+        self._retries: Dict[asyncio.Task, Notification] = {}
+
+    async def enqueue(self, *, token: str, title: str, body: str) -> None:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        # 큐가 가득 차면 전송 속도에 맞춰 호출자를 대기시킵니다.
+        await self.queue.put(Notification(token=token, title=title, body=body))
+        metrics.set_gauge("notification_queue_depth", self.queue.qsize())
+
+    async def _next_batch(self) -> List[Notification]:
+        batch = [await self.queue.get()]
+        batch_size = min(settings.NOTIFICATION_BATCH_SIZE, FCM_MAX_BATCH_SIZE)
+        deadline = time.perf_counter() + settings.NOTIFICATION_BATCH_WINDOW_MS / 1000
+        while len(batch) < batch_size:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._send(batch)
+            except Exception as e:
+                print(f"Error dispatching notifications: {e}")
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+                metrics.set_gauge("notification_queue_depth", self.queue.qsize())
+
+    async def _send(self, batch: List[Notification]) -> None:
+        metrics.observe("notification_batch_size", len(batch))
+        started = time.perf_counter()
+        request_failed = False
+        try:
+            errors = await self.backend.send_batch(batch)
+        except Exception as e:
+            # 요청 자체가 실패하면 모든 알림을 일시적 오류로 보고 재시도합니다.
+            print(f"Error sending notification batch: {e}")
+            errors = [e] * len(batch)
+            request_failed = True
+        metrics.observe("notification_send_seconds", time.perf_counter() - started)
+
+        now = time.perf_counter()
+        for notification, error in zip(batch, errors):
+            notification.attempts += 1
+            if error is None:
+                metrics.increment("notifications_total", outcome="sent")
+                metrics.observe(
+                    "notification_delivery_latency_seconds",
+                    now - notification.enqueued_at,
+                )
+            elif (
+                request_failed or self.backend.is_transient(error)
+            ) and notification.attempts < settings.NOTIFICATION_MAX_ATTEMPTS:
+                metrics.increment("notifications_total", outcome="retried")
+                self._schedule_retry(notification)
+            else:
+                metrics.increment("notifications_total", outcome="failed")
+                print(f"Error sending FCM message ({notification.title}): {error}")
+
+    def _schedule_retry(self, notification: Notification) -> None:
+        delay = settings.NOTIFICATION_RETRY_BACKOFF_SECONDS * 2 ** (
+            notification.attempts - 1
+        )
+
+        async def retry() -> None:
+            await asyncio.sleep(delay)
+            await self.queue.put(notification)
+
+        task = asyncio.create_task(retry())
+        self._retries[task] = notification
+        task.add_done_callback(lambda done: self._retries.pop(done, None))
+
+    def _cancel_retries(self) -> List[Notification]:
+        """재시도 대기 태스크를 취소하고 아직 큐에 들어가지 않은 알림을 반환합니다."""
+        pending = [
+            notification
+            for task, notification in self._retries.items()
+            if not task.done()
+        ]
+        for task in list(self._retries):
+            task.cancel()
+        self._retries.clear()
+        return pending
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """
+        재시도 대기 중인 알림을 백오프 없이 큐에 넣고, 대기 중인 알림을 timeout 동안 전송한 뒤 워커를 종료합니다.
+        전송하지 못한 알림 수는 로그와 notifications_total{outcome="dropped"}로 남깁니다.
+        """
+        dropped = 0
+        for notification in self._cancel_retries():
+            try:
+                self.queue.put_nowait(notification)
+            except asyncio.QueueFull:
+                dropped += 1
+
+        if not self.queue.empty() and (self._worker is None or self._worker.done()):
+            self._worker = asyncio.create_task(self._run())
+        if self._worker is not None and not self._worker.done():
+            try:
+                await asyncio.wait_for(self.queue.join(), timeout)
+            except asyncio.TimeoutError:
+                dropped += self.queue.qsize()
+            self._worker.cancel()
+        # 종료 중 다시 일시적 오류가 나서 예약된 재시도는 보내지 못합니다.
+        dropped += len(self._cancel_retries())
+
+        if dropped:
+            print(f"Dropping {dropped} undelivered notifications")
+            metrics.increment("notifications_total", value=dropped, outcome="dropped")
+
+
+_dispatcher: Optional[NotificationDispatcher] = None
+
+
+def get_notification_dispatcher() -> NotificationDispatcher:
+    """프로세스 전체에서 공유하는 알림 디스패처 (NOTIFICATION_BACKEND: firebase | local)."""
+    global _dispatcher
+    if _dispatcher is None:
+        if settings.NOTIFICATION_BACKEND == "local":
+            backend: NotificationBackend = LocalNotificationBackend()
+        else:
+            backend = FirebaseNotificationBackend()
+        _dispatcher = NotificationDispatcher(backend)
+    return _dispatcher
+
+
+async def close_notification_dispatcher() -> None:
+    global _dispatcher
+    if _dispatcher is not None:
+        await _dispatcher.close()
+        _dispatcher = None
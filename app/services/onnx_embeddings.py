@@ -0,0 +1,147 @@
+"""
+CPU에서 실행하는 로컬 ONNX 문장 임베딩 백엔드.
+
+EMBEDDING_MODEL=onnx:<모델 디렉터리> 로 선택하며, 디렉터리에는 다음 파일이 필요합니다.
+    model.onnx      (양자화 모델 권장, 예: model_quantized.onnx 를 model.onnx 로 저장)
+    tokenizer.json  (Hugging Face tokenizers 형식)
+
+모델의 출력 차원은 EMBEDDING_DIMENSION(= embedding 컬럼 차원)과 같아야 합니다.
+모델을 바꾸면 저장된 벡터를 다시 임베딩해야 합니다. (scripts/reembed.py)
+
+onnxruntime / tokenizers 는 이 백엔드를 사용할 때만 필요한 선택 의존성입니다.
+    pip install -r requirements-onnx.txt
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+from langchain_core.embeddings import Embeddings
+
+from app.core.config import settings
+
+# 각 워커 프로세스에서 initializer가 한 번 로드합니다.
+_session = None
+_tokenizer = None
+
+
+def _load_model(model_dir: str, max_length: int, threads: int) -> None:
+    global _session, _tokenizer
+    import onnxruntime
+    from tokenizers import Tokenizer
+
+    options = onnxruntime.SessionOptions()
+    options.intra_op_num_threads = threads
+    options.inter_op_num_threads = 1
+    _session = onnxruntime.InferenceSession(
+        os.path.join(model_dir, "model.onnx"),
+        sess_options=options,
+        providers=["CPUExecutionProvider"],
+    )
+    _tokenizer = Tokenizer.from_file(os.path.join(model_dir, "tokenizer.json"))
+    _tokenizer.enable_truncation(max_length=max_length)
+    _tokenizer.enable_padding()
+
+
+def _embed(texts: List[str], dimension: int) -> List[List[float]]:
+    import numpy as np
+
+    encodings = _tokenizer.encode_batch(texts)
+    input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+    attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+
+    feeds = {}
+    for model_input in _session.get_inputs():
+        if model_input.name == "input_ids":
+            feeds["input_ids"] = input_ids
+        elif model_input.name == "attention_mask":
+            feeds["attention_mask"] = attention_mask
+        elif model_input.name == "token_type_ids":
+            feeds["token_type_ids"] = np.zeros_like(input_ids)
+
+    hidden = _session.run(None, feeds)[0]
+    if hidden.ndim == 3:
+        # (batch, tokens, dim) 출력은 attention mask 기준 평균 풀링합니다.
+        mask = attention_mask[..., None].astype(hidden.dtype)
+        hidden = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+
+    # 잘라내기는 Matryoshka 학습 모델에서만 의미가 있으므로 차원이 다르면 실패시킵니다.
+    if hidden.shape[1] != dimension:
+        raise ValueError(
+            f"ONNX embedding model outputs {hidden.shape[1]} dims, "
+            f"but EMBEDDING_DIMENSION={dimension}"
+        )
+    vectors = hidden / np.clip(
+        np.linalg.norm(hidden, axis=1, keepdims=True), 1e-12, None
+    )
+    return vectors.astype(np.float32).tolist()
+
+
+class OnnxEmbeddings(Embeddings):
+    """프로세스 풀에서 ONNX 모델을 실행하는 LangChain 호환 임베딩."""
+
+    def __init__(self, model_dir: str):
+        if not os.path.isfile(os.path.join(model_dir, "model.onnx")):
+            raise FileNotFoundError(f"model.onnx not found in {model_dir}")
+        self.model_dir = model_dir
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=settings.EMBEDDING_ONNX_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_load_model,
+                initargs=(
+                    self.model_dir,
+                    settings.EMBEDDING_ONNX_MAX_LENGTH,
+                    settings.EMBEDDING_ONNX_THREADS,
+                ),
+            )
+        return self._executor
+
+    @staticmethod
+    def _split(texts: List[str]) -> List[List[str]]:
+        """워커 수만큼 나눠 프로세스 풀에서 병렬로 계산합니다."""
+        size = max(1, -(-len(texts) // settings.EMBEDDING_ONNX_WORKERS))
+        return [texts[i : i + size] for i in range(0, len(texts), size)]
+
+    async def aembed_documents(
+        self, texts: List[str], output_dimensionality: Optional[int] = None
+    ) -> List[List[float]]:
+        if not texts:
+            return []
+        dimension = output_dimensionality or settings.EMBEDDING_DIMENSION
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        parts = await asyncio.gather(
+            *(
+                loop.run_in_executor(executor, _embed, part, dimension)
+                for part in self._split(texts)
+            )
+        )
+        return [vector for part in parts for vector in part]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return (await self.aembed_documents([text]))[0]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        # 실행 중인 이벤트 루프 안에서도 호출될 수 있으므로 asyncio.run 대신 프로세스 풀을 직접 기다립니다.
+        if not texts:
+            return []
+        executor = self._get_executor()
+        futures = [
+            executor.submit(_embed, part, settings.EMBEDDING_DIMENSION)
+            for part in self._split(texts)
+        ]
+        return [vector for future in futures for vector in future.result()]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,89 @@
+import asyncio
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, List, Optional, Tuple
+
+from app.core.config import settings
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_pdf_executor() -> ProcessPoolExecutor:
+    """PDF 파싱 전용 프로세스 풀. 첫 사용 시 생성합니다."""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.PDF_EXTRACT_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def shutdown_pdf_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def _extract_first_pages(data: bytes, count: int) -> Tuple[int, List[str]]:
+    from pypdf import PdfReader
+
+    reader = PdfReader(io.BytesIO(data))
+    page_count = len(reader.pages)
+    return page_count, [
+        reader.pages[i].extract_text() for i in range(min(count, page_count))
+    ]
+
+
+def _extract_page_range(data: bytes, start: int, end: int) -> List[str]:
+    from pypdf import PdfReader
+
+    reader = PdfReader(io.BytesIO(data))
+    return [reader.pages[i].extract_text() for i in range(start, end)]
+
+
+async def iter_pdf_pages(
+    data: bytes, *, pages_per_task: Optional[int] = None
+) -> AsyncIterator[str]:
+    """
+    메모리의 PDF 바이트를 프로세스 풀에서 파싱하여 페이지 텍스트를 순서대로 내보냅니다.
+    첫 구간을 파싱하면서 전체 페이지 수를 알아내고, 나머지 구간은 병렬로 추출합니다.
+    """
+    loop = asyncio.get_running_loop()
+    executor = get_pdf_executor()
+    pages_per_task = pages_per_task or settings.PDF_EXTRACT_PAGES_PER_TASK
+
+    page_count, first_pages = await loop.run_in_executor(
+        executor, _extract_first_pages, data, pages_per_task
+    )
+    for page in first_pages:
+        yield page
+
+    # 작업마다 문서 전체를 워커로 전달하고 다시 열어야 하므로,
+    # 남은 페이지는 워커 수의 두 배를 넘지 않는 구간으로 나눕니다.
+    remaining = page_count - len(first_pages)
+    max_tasks = settings.PDF_EXTRACT_WORKERS * 2
+    range_size = max(pages_per_task, -(-remaining // max_tasks))
+    futures = [
+        loop.run_in_executor(
+            executor,
+            _extract_page_range,
+            data,
+            start,
+            min(start + range_size, page_count),
+        )
+        for start in range(len(first_pages), page_count, range_size)
+    ]
+    try:
+        for future in futures:
+            for page in await future:
+                yield page
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+async def extract_pdf_pages(data: bytes) -> List[str]:
+    return [page async for page in iter_pdf_pages(data)]
@@ -0,0 +1,82 @@
+import json
+from typing import List, Optional
+
+import redis.asyncio as aioredis
+from fastapi import Depends
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.session import get_redis_client
+from app.schemas.llm_schema import LLMPortfolio
+
+PAGES_KEY_PREFIX = "pdf:pages:"
+STRUCTURED_KEY_PREFIX = "pdf:structured:"
+
+# pypdf 추출 로직이 바뀌면 올려서 이전 추출 결과를 무효화합니다.
+PDF_EXTRACTOR_VERSION = "1"
+
+
+class PdfResultCache:
+    """
+    업로드된 PDF의 SHA-256을 키로 추출 텍스트와 구조화 결과를 보관합니다.
+    구조화 결과는 프롬프트/모델 버전을 키에 포함해 프롬프트가 바뀌면 자연스럽게 다시 생성됩니다.
+    """
+
+    def __init__(self, redis_client: aioredis.Redis):
+        self.redis = redis_client
+
+    async def _get(self, layer: str, key: str) -> Optional[str]:
+        if not settings.PDF_RESULT_CACHE_ENABLED:
+            return None
+        try:
+            value = await self.redis.get(key)
+        except Exception as e:
+            print(f"Error reading PDF result cache: {e}")
+            value = None
+        metrics.increment(
+            "pdf_result_cache_total", layer=layer, outcome="hit" if value else "miss"
+        )
+        return value
+
+    async def _set(self, key: str, value: str) -> None:
+        if not settings.PDF_RESULT_CACHE_ENABLED:
+            return
+        try:
+            await self.redis.set(
+                key, value, ex=settings.PDF_RESULT_CACHE_TTL_SECONDS
+            )
+        except Exception as e:
+            print(f"Error writing PDF result cache: {e}")
+
+    async def get_pages(self, digest: str) -> Optional[List[str]]:
+        value = await self._get(
+            "pages", f"{PAGES_KEY_PREFIX}{PDF_EXTRACTOR_VERSION}:{digest}"
+        )
+        return json.loads(value) if value else None
+
+    async def set_pages(self, digest: str, pages: List[str]) -> None:
+        await self._set(
+            f"{PAGES_KEY_PREFIX}{PDF_EXTRACTOR_VERSION}:{digest}",
+            json.dumps(pages, ensure_ascii=False),
+        )
+
+    async def get_structured(
+        self, digest: str, version: str
+    ) -> Optional[LLMPortfolio]:
+        value = await self._get(
+            "structured", f"{STRUCTURED_KEY_PREFIX}{version}:{digest}"
+        )
+        return LLMPortfolio.model_validate_json(value) if value else None
+
+    async def set_structured(
+        self, digest: str, version: str, portfolio: LLMPortfolio
+    ) -> None:
+        await self._set(
+            f"{STRUCTURED_KEY_PREFIX}{version}:{digest}", portfolio.model_dump_json()
+        )
+
+
+async def get_pdf_result_cache(
+    redis_client: aioredis.Redis = Depends(get_redis_client),
+) -> PdfResultCache:
+    return PdfResultCache(redis_client)
@@ -0,0 +1,140 @@
+import re
+from datetime import date
+from typing import Dict, List, Optional, Set, Tuple
+
+from app.models.portfolio_item import PortfolioItemType
+from app.schemas.llm_schema import LLMPortfolioItem
+
+_SECTION_BREAK = re.compile(r"\n\s*\n")
+_LINE_BREAK = re.compile(r"\n")
+_WHITESPACE = re.compile(r"\s+")
+
+# topic이 항목을 식별하지 못하는 유형은 내용으로 중복을 판단합니다.
+_CONTENT_KEYED_TYPES = {
+    PortfolioItemType.INTRODUCTION,
+    PortfolioItemType.SKILLS,
+    PortfolioItemType.EDUCATION,
+    PortfolioItemType.CONTACT,
+}
+
+
+def _split_oversized(text: str, max_chars: int) -> List[str]:
+    """한 페이지가 너무 길면 단락 → 줄 → 글자 수 순으로 경계를 찾아 자릅니다."""
+    if len(text) <= max_chars:
+        return [text]
+
+    for separator, joiner in ((_SECTION_BREAK, "\n\n"), (_LINE_BREAK, "\n")):
+        parts = [p for p in separator.split(text) if p.strip()]
+        if len(parts) > 1:
+            return _pack(parts, max_chars, joiner=joiner)
+
+    return [text[i : i + max_chars] for i in range(0, len(text), max_chars)]
+
+
+def _pack(parts: List[str], max_chars: int, joiner: str) -> List[str]:
+    chunks: List[str] = []
+    current: List[str] = []
+    current_len = 0
+    for part in parts:
+        for piece in _split_oversized(part, max_chars):
+            if current and current_len + len(joiner) + len(piece) > max_chars:
+                chunks.append(joiner.join(current))
+                current, current_len = [], 0
+            current.append(piece)
+            current_len += len(piece) + (len(joiner) if current_len else 0)
+    if current:
+        chunks.append(joiner.join(current))
+    return chunks
+
+
+def split_pages_into_chunks(pages: List[str], *, max_chars: int) -> List[str]:
+    """페이지 경계를 유지하면서 max_chars 이하의 청크로 묶습니다."""
+    pages = [page for page in pages if page.strip()]
+    return _pack(pages, max_chars, joiner="\n")
+
+
+def _normalize(value: Optional[str]) -> str:
+    return _WHITESPACE.sub(" ", value or "").strip().lower()
+
+
+def _item_key(item: LLMPortfolioItem) -> Tuple[PortfolioItemType, str]:
+    if item.type in _CONTENT_KEYED_TYPES or not item.topic:
+        return item.type, ""
+    return item.type, _normalize(item.topic)
+
+
+def _merge_content(first: str, second: str) -> str:
+    normalized_first, normalized_second = _normalize(first), _normalize(second)
+    if normalized_second in normalized_first:
+        return first
+    if normalized_first in normalized_second:
+        return second
+    return f"{first} {second}"
+
+
+def _earliest(first: Optional[date], second: Optional[date]) -> Optional[date]:
+    if first and second:
+        return min(first, second)
+    return first or second
+
+
+def _merge_items(first: LLMPortfolioItem, second: LLMPortfolioItem) -> LLMPortfolioItem:
+    tech_stack = list(dict.fromkeys((first.tech_stack or []) + (second.tech_stack or [])))
+    return LLMPortfolioItem(
+        type=first.type,
+        topic=first.topic or second.topic,
+        start_date=_earliest(first.start_date, second.start_date),
+        end_date=first.end_date or second.end_date,
+        content=_merge_content(first.content, second.content),
+        tech_stack=tech_stack or None,
+    )
+
+
+def merge_portfolio_items(
+    chunk_items: List[List[LLMPortfolioItem]],
+) -> List[LLMPortfolioItem]:
+    """
+    청크별 구조화 결과를 순서대로 합칩니다.
+    바로 앞 청크에 같은 유형/주제의 항목이 있으면 청크 경계에서 잘린 항목으로 보고 병합하고,
+    주제로 구분할 수 없는 유형은 이전 청크의 항목과 내용이 서로 포함 관계일 때만 병합합니다.
+    같은 청크 안의 항목끼리는 병합하지 않고, 내용이 비어 있는 항목도 병합하지 않습니다.
+    """
+    merged: List[LLMPortfolioItem] = []
+    previous_topics: Dict[Tuple[PortfolioItemType, str], int] = {}
+
+    for items in chunk_items:
+        chunk_topics: Dict[Tuple[PortfolioItemType, str], int] = {}
+        chunk_indices: Set[int] = set()
+        for item in items:
+            key = _item_key(item)
+            index: Optional[int] = None
+
+            if key[1]:
+                # 같은 청크 안의 동일 주제, 두 청크 이상 떨어진 동일 주제는 별개의 항목입니다.
+                if key not in chunk_topics:
+                    index = previous_topics.get(key)
+            else:
+                content = _normalize(item.content)
+                for i, existing in enumerate(merged):
+                    if not content or i in chunk_indices or existing.type != item.type:
+                        continue
+                    existing_content = _normalize(existing.content)
+                    if existing_content and (
+                        content in existing_content or existing_content in content
+                    ):
+                        index = i
+                        break
+
+            if index is None:
+                merged.append(item)
+                index = len(merged) - 1
+            else:
+                merged[index] = _merge_items(merged[index], item)
+
+            chunk_indices.add(index)
+            if key[1]:
+                chunk_topics[key] = index
+
+        previous_topics = chunk_topics
+
+    return merged
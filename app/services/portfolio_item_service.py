@@ -4,13 +4,19 @@ from fastapi import Depends, HTTPException, status
 
 from app.crud.portfolio_crud import PortfolioCRUD
 from app.crud.portfolio_item_crud import PortfolioItemCRUD
+from app.models.portfolio import PortfolioStatus
 from app.models.portfolio_item import PortfolioItemStatus
 from app.schemas.portfolio_item_schema import (
     PortfolioItemRead,
     PortfolioItemsCreate,
     PortfolioItemsUpdate,
 )
-from app.models.user import User
+from app.schemas.user_schema import UserSnapshot
+from app.services.portfolio_version import PortfolioVersion, get_portfolio_version
+from app.services.published_portfolio_cache import (
+    PublishedPortfolioCache,
+    get_published_portfolio_cache,
+)
 from app.services.rag_service import RAGService
 
 
@@ -20,13 +26,32 @@ class PortfolioItemService:
         portfolio_crud: PortfolioCRUD = Depends(),
         crud: PortfolioItemCRUD = Depends(),
         rag_service: RAGService = Depends(),
+        published_cache: PublishedPortfolioCache = Depends(
+            get_published_portfolio_cache
+        ),
+        portfolio_version: PortfolioVersion = Depends(get_portfolio_version),
     ):
         self.portfolio_crud = portfolio_crud
         self.crud = crud
         self.rag_service = rag_service
+        self.published_cache = published_cache
+        self.portfolio_version = portfolio_version
+
+    async def _commit_changes(
+        self,
+        *,
+        current_user: UserSnapshot,
+        portfolio_ids: List[uuid.UUID],
+        refresh_published: bool = True,
+    ) -> None:
+        """항목 변경을 커밋한 뒤 포트폴리오 버전(ETag)을 올리고 공개 포트폴리오 캐시를 다시 만듭니다."""
+        await self.crud.db.commit()
+        await self.portfolio_version.bump(*portfolio_ids)
+        if refresh_published:
+            await self.published_cache.refresh(db=self.crud.db, user_id=current_user.id)
 
     async def create_portfolio_items(
-        self, *, portfolio_items_create: PortfolioItemsCreate, current_user: User
+        self, *, portfolio_items_create: PortfolioItemsCreate, current_user: UserSnapshot
     ) -> List[PortfolioItemRead]:
         portfolio = await self.portfolio_crud.get_portfolio_by_id_without_items(
             portfolio_id=portfolio_items_create.portfolio_id, user_id=current_user.id
@@ -39,10 +64,15 @@ class PortfolioItemService:
         created_items = await self.crud.create_portfolio_items(
             portfolio_items_create=portfolio_items_create
         )
+        await self._commit_changes(
+            current_user=current_user,
+            portfolio_ids=[portfolio.id],
+            refresh_published=portfolio.status == PortfolioStatus.PUBLISHED,
+        )
         return [PortfolioItemRead.model_validate(item) for item in created_items]
 
     async def get_portfolio_items_by_portfolio_id(
-        self, *, portfolio_id: uuid.UUID, current_user: User
+        self, *, portfolio_id: uuid.UUID, current_user: UserSnapshot
     ) -> List[PortfolioItemRead]:
         portfolio_items = await self.crud.get_portfolio_items_by_portfolio_id(
             portfolio_id=portfolio_id
@@ -50,7 +80,7 @@ class PortfolioItemService:
         return [PortfolioItemRead.model_validate(item) for item in portfolio_items]
 
     async def update_portfolio_items(
-        self, *, items_in: PortfolioItemsUpdate, current_user: User
+        self, *, items_in: PortfolioItemsUpdate, current_user: UserSnapshot
     ) -> List[PortfolioItemRead]:
         item_ids = [item.id for item in items_in.items]
         portfolio_items = await self.crud.get_portfolio_item_by_ids(
@@ -72,6 +102,11 @@ class PortfolioItemService:
             item.type = item_update.type
             item.tech_stack = item_update.tech_stack
 
+        await self._commit_changes(
+            current_user=current_user,
+            portfolio_ids=[item.portfolio_id for item in portfolio_items],
+        )
+
         return [
             PortfolioItemRead(
                 type=portfolio_item.type,
@@ -88,15 +123,19 @@ class PortfolioItemService:
         ]
 
     async def delete_portfolio_items(
-        self, *, portfolio_item_ids: List[uuid.UUID], current_user: User
+        self, *, portfolio_item_ids: List[uuid.UUID], current_user: UserSnapshot
     ) -> None:
         # TODO: Check ownership of portfolio items
-        deleted = await self.crud.delete_portfolio_items(
+        deleted_items = await self.crud.delete_portfolio_items(
             portfolio_item_ids=portfolio_item_ids
         )
-        if not deleted:
+        if not deleted_items:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="삭제할 포트폴리오를 찾을 수 없거나 권한이 없습니다.",
             )
+        await self._commit_changes(
+            current_user=current_user,
+            portfolio_ids=[item.portfolio_id for item in deleted_items],
+        )
         return None
@@ -1,24 +1,47 @@
 import uuid
-from typing import List
+from typing import List, Optional
 from fastapi import Depends, HTTPException, status
-from app.crud.portfolio_crud import PortfolioCRUD
-from app.crud.user_crud import UserCRUD
+from app.core.config import settings
+from app.crud.portfolio_crud import PortfolioCRUD, PortfolioReadCRUD
+from app.crud.portfolio_item_crud import PortfolioItemCRUD
+from app.crud.user_crud import UserCRUD, UserReadCRUD
 from app.db.session import AsyncSessionLocal
-from app.models.portfolio_item import PortfolioItem, PortfolioItemStatus
-from app.schemas.portfolio_item_schema import PortfolioItemRead
+from app.models.portfolio_item import (
+    EmbeddingStatus,
+    PortfolioItem,
+    PortfolioItemStatus,
+)
 from app.schemas.portfolio_schema import (
     PortfolioCreateFromText,
     PortfolioCreateWithPdf,
+    PortfolioConfirmResponse,
+    PortfolioCreationResponse,
     PortfolioRead,
     PortfolioReadWithoutItems,
     PortfolioUpdate,
-    PublishedPortfolioRead,
 )
-from app.models.user import User
+from app.schemas.user_schema import UserSnapshot
+from app.schemas.portfolio_item_schema import PortfolioItemCreate, PortfolioItemsCreate
 from app.models.portfolio import PortfolioSourceType, PortfolioStatus
+from app.services.embedding_gateway import embedding_model_tag
 from app.services.rag_service import RAGService
-from app.services.llm_service import LLMService
+from app.services.llm_service import LLMService, get_llm_service
 from app.services.fcm_service import FCMService
+from app.services.job_queue import JobQueue, get_job_queue
+from app.services.job_progress import JobProgress, get_job_progress
+from app.services.pdf_extractor import iter_pdf_pages
+from app.services.pdf_result_cache import PdfResultCache, get_pdf_result_cache
+from app.services.portfolio_version import PortfolioVersion, get_portfolio_version
+from app.services.published_portfolio_cache import (
+    PublishedPortfolioCache,
+    get_published_portfolio_cache,
+    serialize_published_portfolio,
+)
+from app.schemas.llm_schema import LLMPortfolio
+from app.schemas.job_schema import Job, JobStage
+
+CREATE_PORTFOLIO_FROM_PDF_JOB = "create_portfolio_from_pdf"
+EMBED_PORTFOLIO_ITEMS_JOB = "embed_portfolio_items"
 
 
 class PortfolioService:
@@ -27,17 +50,34 @@ class PortfolioService:
         crud: PortfolioCRUD = Depends(),
         user_crud: UserCRUD = Depends(),
         rag_service: RAGService = Depends(),
-        llm_service: LLMService = Depends(),
+        llm_service: LLMService = Depends(get_llm_service),
         fcm_service: FCMService = Depends(),
+        job_queue: JobQueue = Depends(get_job_queue),
+        job_progress: JobProgress = Depends(get_job_progress),
+        pdf_result_cache: PdfResultCache = Depends(get_pdf_result_cache),
+        read_crud: PortfolioReadCRUD = Depends(),
+        user_read_crud: UserReadCRUD = Depends(),
+        published_cache: PublishedPortfolioCache = Depends(
+            get_published_portfolio_cache
+        ),
+        portfolio_version: PortfolioVersion = Depends(get_portfolio_version),
     ):
         self.crud = crud
         self.user_crud = user_crud
+        # 공개 조회 경로는 읽기 전용 복제본을 사용합니다.
+        self.read_crud = read_crud
+        self.user_read_crud = user_read_crud
+        self.published_cache = published_cache
+        self.portfolio_version = portfolio_version
         self.rag_service = rag_service
         self.llm_service = llm_service
         self.fcm_service = fcm_service
+        self.job_queue = job_queue
+        self.job_progress = job_progress
+        self.pdf_result_cache = pdf_result_cache
 
     async def create_portfolio_from_text(
-        self, *, portfolio_in: PortfolioCreateFromText, current_user: User
+        self, *, portfolio_in: PortfolioCreateFromText, current_user: UserSnapshot
     ) -> PortfolioRead:
         if not portfolio_in.text_items:
             raise HTTPException(
@@ -62,6 +102,8 @@ class PortfolioService:
 
         for i, item in enumerate(items):
             item.embedding = embeddings[i]
+            item.embedding_model = embedding_model_tag()
+            item.embedding_state = EmbeddingStatus.READY
 
         created_portfolio = await self.crud.create_portfolio(
             user_id=current_user.id,
@@ -76,7 +118,7 @@ class PortfolioService:
         return PortfolioRead.model_validate(created_portfolio)
 
     async def create_draft_portfolio(
-        self, *, portfolio_in: PortfolioCreateWithPdf, current_user: User
+        self, *, portfolio_in: PortfolioCreateWithPdf, current_user: UserSnapshot
     ) -> PortfolioRead:
         """DRAFT 상태의 포트폴리오를 생성합니다."""
         draft_portfolio = await self.crud.create_portfolio(
@@ -90,82 +132,225 @@ class PortfolioService:
         )
         return PortfolioRead.model_validate(draft_portfolio)
 
+    async def start_portfolio_creation_from_pdf(
+        self, *, portfolio_in: PortfolioCreateWithPdf, current_user: UserSnapshot
+    ) -> PortfolioCreationResponse:
+        """DRAFT 포트폴리오를 저장한 뒤 PDF 처리 작업을 작업 큐에 등록합니다."""
+        draft_portfolio = await self.create_draft_portfolio(
+            portfolio_in=portfolio_in, current_user=current_user
+        )
+        # 워커가 DRAFT 포트폴리오를 조회할 수 있도록 등록 전에 커밋합니다.
+        await self.crud.db.commit()
+
+        job = Job(
+            name=CREATE_PORTFOLIO_FROM_PDF_JOB,
+            payload={
+                "portfolio_id": str(draft_portfolio.id),
+                "user_id": str(current_user.id),
+                "file_path": portfolio_in.file_path,
+            },
+        )
+        # 워커가 첫 진행 이벤트를 발행하기 전에 소유자와 QUEUED 상태를 먼저 저장합니다.
+        await self.job_progress.register(job.id, str(current_user.id))
+        await self.job_queue.enqueue(job.name, job.payload, job_id=job.id)
+
+        return PortfolioCreationResponse(
+            id=draft_portfolio.id,
+            name=draft_portfolio.name,
+            status=draft_portfolio.status,
+            theme=draft_portfolio.theme,
+            job_id=job.id,
+        )
+
+    async def _structure_pdf(
+        self, *, file_path: str, job_id: Optional[str]
+    ) -> LLMPortfolio:
+        """
+        PDF를 내려받아 구조화합니다. 같은 내용(SHA-256)의 PDF를 이미 처리했다면
+        캐시된 추출 텍스트/구조화 결과를 재사용해 pypdf 파싱과 LLM 호출을 건너뜁니다.
+        """
+        progress = self.job_progress
+        await progress.publish(job_id, JobStage.DOWNLOAD, 5)
+        file_bytes, digest = await self.rag_service.download_pdf(file_path)
+
+        version = self.llm_service.structuring_version()
+        cached = await self.pdf_result_cache.get_structured(digest, version)
+        if cached and cached.items:
+            await progress.publish(job_id, JobStage.STRUCTURE, 85, detail="cached")
+            return cached
+
+        await progress.publish(job_id, JobStage.EXTRACT, 15)
+        pages = await self.pdf_result_cache.get_pages(digest)
+        if pages is None:
+            pages = [page async for page in iter_pdf_pages(file_bytes)]
+            await self.pdf_result_cache.set_pages(digest, pages)
+        if not "".join(pages).strip():
+            raise ValueError("PDF 파일에서 텍스트를 추출할 수 없습니다.")
+
+        await progress.publish(
+            job_id, JobStage.STRUCTURE, 30, detail=f"{len(pages)} pages"
+        )
+
+        async def on_chunk_done(done: int, total: int) -> None:
+            await progress.publish(
+                job_id,
+                JobStage.STRUCTURE,
+                30 + 55 * done // total,
+                detail=f"{done}/{total} chunks",
+            )
+
+        structured = await self.llm_service.structure_portfolio_from_pages(
+            pages=pages, on_chunk_done=on_chunk_done
+        )
+        if structured and structured.items:
+            await self.pdf_result_cache.set_structured(digest, version, structured)
+        return structured
+
     async def create_portfolio_from_pdf_background(
-        self, *, portfolio_id: uuid.UUID, user_id: uuid.UUID, file_path: str
+        self,
+        *,
+        portfolio_id: uuid.UUID,
+        user_id: uuid.UUID,
+        file_path: str,
+        job_id: Optional[str] = None,
+        is_last_attempt: bool = True,
     ):
+        """
+        PDF를 구조화하여 PENDING 포트폴리오 항목을 생성합니다. (작업 큐 워커에서 실행)
+        실패 시 예외를 다시 던져 재시도되도록 하고, 작업이 dead-letter로 옮겨지면
+        워커가 fail_create_portfolio_from_pdf 로 FAILED 표시와 실패 알림을 처리합니다.
+        항목 저장 후 ack 전에 작업이 다시 실행되면 항목이 중복 생성되므로, DRAFT가 아닌
+        포트폴리오는 버전만 올리고(이전 실행에서 실패했을 수 있음) 종료 이벤트를 발행한 뒤 끝냅니다.
+        """
         async with AsyncSessionLocal() as db:
-            portfolio = None
-            user = None
-            try:
-                portfolio_crud = PortfolioCRUD(db)
-                user_crud = UserCRUD(db)
+            portfolio_crud = PortfolioCRUD(db)
+            user_crud = UserCRUD(db)
 
-                portfolio = await portfolio_crud.get_portfolio_by_id_with_items(
-                    portfolio_id=portfolio_id, user_id=user_id
+            portfolio = await portfolio_crud.get_portfolio_by_id_with_items(
+                portfolio_id=portfolio_id, user_id=user_id
+            )
+            if not portfolio:
+                print(
+                    f"Error: Portfolio not found for background processing: {portfolio_id}"
                 )
-                if not portfolio:
-                    print(
-                        f"Error: Portfolio not found for background processing: {portfolio_id}"
-                    )
-                    return
-
-                user = await user_crud.get_user_by_id(user_id=user_id)
-
-                text = await self.rag_service.extract_text_from_gcs_pdf(
-                    gcs_url=file_path
+                await self.job_progress.publish(
+                    job_id, JobStage.FAILED, 100, detail="portfolio not found"
+                )
+                return
+            if portfolio.status != PortfolioStatus.DRAFT:
+                await self.portfolio_version.bump(portfolio_id)
+                stage = (
+                    JobStage.FAILED
+                    if portfolio.status
+                    in (PortfolioStatus.FAILED, PortfolioStatus.DELETED)
+                    else JobStage.DONE
+                )
+                await self.job_progress.publish(
+                    job_id, stage, 100, detail=f"already {portfolio.status.value}"
                 )
-                if not text.strip():
-                    raise ValueError("PDF 파일에서 텍스트를 추출할 수 없습니다.")
+                return
 
-                structured_items = await self.llm_service.structure_portfolio_from_text(
-                    text=text
+            user = await user_crud.get_user_by_id(user_id=user_id)
+            fcm_token = user.fcm_token if user else None
+
+            progress = self.job_progress
+            try:
+                structured_items = await self._structure_pdf(
+                    file_path=file_path, job_id=job_id
                 )
                 if not structured_items or not structured_items.items:
                     raise ValueError("LLM이 텍스트를 구조화하지 못했습니다.")
 
-                created_items = [
-                    PortfolioItem(
-                        type=item.type,
-                        topic=item.topic,
-                        start_date=item.start_date,
-                        end_date=item.end_date,
-                        content=item.content,
-                        tech_stack=item.tech_stack,
-                        portfolio_id=portfolio_id,
-                        status=PortfolioItemStatus.PENDING,
+                item_count = len(structured_items.items)
+                await progress.publish(job_id, JobStage.SAVE, 90)
+                if item_count >= settings.BULK_COPY_MIN_ROWS:
+                    await PortfolioItemCRUD(db).copy_create_portfolio_items(
+                        portfolio_items_create=PortfolioItemsCreate(
+                            portfolio_id=portfolio_id,
+                            portfolio_items=[
+                                PortfolioItemCreate.model_validate(item.model_dump())
+                                for item in structured_items.items
+                            ],
+                        )
                     )
-                    for item in structured_items.items
-                ]
-
-                portfolio.items.extend(created_items)
-                portfolio.status = PortfolioStatus.PENDING
-
-                if user and user.fcm_token:
-                    self.fcm_service.send_notification(
-                        token=user.fcm_token,
-                        title="create_portfolio_success",
-                        body=f"{portfolio_id}",
+                else:
+                    portfolio.items.extend(
+                        PortfolioItem(
+                            type=item.type,
+                            topic=item.topic,
+                            start_date=item.start_date,
+                            end_date=item.end_date,
+                            content=item.content,
+                            tech_stack=item.tech_stack,
+                            portfolio_id=portfolio_id,
+                            status=PortfolioItemStatus.PENDING,
+                        )
+                        for item in structured_items.items
                     )
+                portfolio.status = PortfolioStatus.PENDING
+                await db.commit()
 
             except Exception as e:
                 print(f"Error processing portfolio {portfolio_id}: {e}")
-                if portfolio:
-                    portfolio.status = PortfolioStatus.FAILED
-
-                if user and user.fcm_token:
-                    self.fcm_service.send_notification(
-                        token=user.fcm_token,
-                        title="create_portfolio_fail",
-                        body=f"{portfolio_id}",
-                    )
-            finally:
-                if portfolio:
-                    db.add(portfolio)
-                    await db.commit()
+                await db.rollback()
+                if not is_last_attempt:
+                    await progress.publish(job_id, JobStage.RETRYING, 0, detail=str(e))
+                raise
+
+            await self.portfolio_version.bump(portfolio_id)
+            await progress.publish(
+                job_id, JobStage.DONE, 100, detail=f"{item_count} items"
+            )
+            if fcm_token:
+                await self.fcm_service.send_notification(
+                    token=fcm_token,
+                    title="create_portfolio_success",
+                    body=f"{portfolio_id}",
+                )
+
+    async def fail_create_portfolio_from_pdf(
+        self,
+        *,
+        portfolio_id: uuid.UUID,
+        user_id: uuid.UUID,
+        job_id: Optional[str] = None,
+        error: Optional[str] = None,
+    ):
+        """
+        dead-letter로 옮겨진 PDF 구조화 작업을 마무리합니다. (작업 큐 워커에서 실행)
+        아직 DRAFT인 포트폴리오를 FAILED로 표시하고 실패 이벤트와 알림을 보냅니다.
+        """
+        async with AsyncSessionLocal() as db:
+            portfolio_crud = PortfolioCRUD(db)
+            user_crud = UserCRUD(db)
+
+            portfolio = await portfolio_crud.get_portfolio_by_id_without_items(
+                portfolio_id=portfolio_id, user_id=user_id
+            )
+            if portfolio and portfolio.status == PortfolioStatus.DRAFT:
+                portfolio.status = PortfolioStatus.FAILED
+                await db.commit()
+                await self.portfolio_version.bump(portfolio_id)
+
+            user = await user_crud.get_user_by_id(user_id=user_id)
+            fcm_token = user.fcm_token if user else None
+
+        await self.job_progress.publish(job_id, JobStage.FAILED, 100, detail=error)
+        if fcm_token:
+            await self.fcm_service.send_notification(
+                token=fcm_token,
+                title="create_portfolio_fail",
+                body=f"{portfolio_id}",
+            )
 
     async def confirm_portfolio(
-        self, *, portfolio_id: uuid.UUID, current_user: User
-    ) -> PortfolioRead:
+        self, *, portfolio_id: uuid.UUID, current_user: UserSnapshot
+    ) -> PortfolioConfirmResponse:
+        """
+        포트폴리오를 확정하고 임베딩 생성 작업을 작업 큐에 등록합니다.
+        새 임베딩이 저장되기 전까지 항목은 EMBEDDING 상태이며, 기존 임베딩이 있으면 그대로 검색에 사용됩니다.
+        이미 확정된 포트폴리오라도 임베딩 생성에 실패한(FAILED) 항목이 있으면 해당 항목만 다시 등록합니다.
+        """
         portfolio = await self.crud.get_portfolio_by_id_with_items(
             portfolio_id=portfolio_id, user_id=current_user.id
         )
@@ -175,23 +360,121 @@ class PortfolioService:
                 detail="포트폴리오를 찾을 수 없습니다.",
             )
 
-        if portfolio.status != PortfolioStatus.PENDING:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="이미 확정되었거나 처리 중인 포트폴리오입니다.",
+        if portfolio.status == PortfolioStatus.PENDING:
+            portfolio.status = PortfolioStatus.CONFIRMED
+            items = list(portfolio.items)
+            for item in items:
+                item.status = PortfolioItemStatus.CONFIRMED
+        else:
+            items = await PortfolioItemCRUD(
+                self.crud.db
+            ).get_confirmed_portfolio_items_failed_embedding(portfolio_id=portfolio_id)
+            if not items:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="이미 확정되었거나 처리 중인 포트폴리오입니다.",
+                )
+        for item in items:
+            item.embedding_state = EmbeddingStatus.EMBEDDING
+        # 워커가 EMBEDDING 항목을 조회할 수 있도록 등록 전에 커밋합니다.
+        await self.crud.db.commit()
+        await self.portfolio_version.bump(portfolio_id)
+
+        job = Job(
+            name=EMBED_PORTFOLIO_ITEMS_JOB,
+            payload={"portfolio_id": str(portfolio_id), "user_id": str(current_user.id)},
+        )
+        await self.job_progress.register(job.id, str(current_user.id))
+        await self.job_queue.enqueue(job.name, job.payload, job_id=job.id)
+
+        return PortfolioConfirmResponse(
+            **PortfolioRead.model_validate(portfolio).model_dump(), job_id=job.id
+        )
+
+    async def embed_portfolio_items_background(
+        self,
+        *,
+        portfolio_id: uuid.UUID,
+        user_id: uuid.UUID,
+        job_id: Optional[str] = None,
+        is_last_attempt: bool = True,
+    ):
+        """
+        확정된 항목 중 임베딩이 없는 항목을 EMBEDDING_MAX_BATCH_SIZE 단위로 임베딩해 저장합니다.
+        (작업 큐 워커에서 실행) 배치마다 커밋하므로 저장된 항목부터 채팅 검색에 포함됩니다.
+        """
+        async with AsyncSessionLocal() as db:
+            portfolio_crud = PortfolioCRUD(db)
+            portfolio_item_crud = PortfolioItemCRUD(db)
+
+            portfolio = await portfolio_crud.get_portfolio_by_id_without_items(
+                portfolio_id=portfolio_id, user_id=user_id
             )
+            if not portfolio:
+                print(f"Error: Portfolio not found for embedding: {portfolio_id}")
+                await self.job_progress.publish(
+                    job_id, JobStage.FAILED, 100, detail="portfolio not found"
+                )
+                return
 
-        portfolio.status = PortfolioStatus.CONFIRMED
-        embeddings = await self.rag_service.embed_portfolio_items(items=portfolio.items)
+            try:
+                items = await portfolio_item_crud.get_confirmed_portfolio_items_to_embed(
+                    portfolio_id=portfolio_id
+                )
+                total = len(items)
+                batch_size = settings.EMBEDDING_MAX_BATCH_SIZE
+                for start in range(0, total, batch_size):
+                    batch = items[start : start + batch_size]
+                    embeddings = await self.rag_service.embed_portfolio_items(
+                        items=batch
+                    )
+                    for item, embedding in zip(batch, embeddings):
+                        item.embedding = embedding
+                        item.embedding_model = embedding_model_tag()
+                        item.embedding_state = EmbeddingStatus.READY
+                    await db.commit()
+                    await self.portfolio_version.bump(portfolio_id)
+
+                    done = start + len(batch)
+                    await self.job_progress.publish(
+                        job_id,
+                        JobStage.EMBEDDING,
+                        100 * done // total,
+                        detail=f"{done}/{total} items",
+                    )
+            except Exception as e:
+                await db.rollback()
+                print(f"Error embedding portfolio items {portfolio_id}: {e}")
+                if not is_last_attempt:
+                    await self.job_progress.publish(
+                        job_id, JobStage.RETRYING, 0, detail=str(e)
+                    )
+                raise
 
-        for item, embedding in zip(portfolio.items, embeddings):
-            item.embedding = embedding
-            item.status = PortfolioItemStatus.CONFIRMED
+            await self.job_progress.publish(
+                job_id, JobStage.DONE, 100, detail=f"{total} items"
+            )
 
-        return PortfolioRead.model_validate(portfolio)
+    async def fail_embed_portfolio_items(
+        self,
+        *,
+        portfolio_id: uuid.UUID,
+        user_id: uuid.UUID,
+        job_id: Optional[str] = None,
+        error: Optional[str] = None,
+    ):
+        """
+        dead-letter로 옮겨진 항목 임베딩 작업을 마무리합니다. (작업 큐 워커에서 실행)
+        아직 EMBEDDING인 항목을 FAILED로 표시합니다. 기존 임베딩은 유지되고, 다시 확정하면 재시도합니다.
+        """
+        async with AsyncSessionLocal() as db:
+            await PortfolioItemCRUD(db).mark_embedding_failed(portfolio_id=portfolio_id)
+            await db.commit()
+        await self.portfolio_version.bump(portfolio_id)
+        await self.job_progress.publish(job_id, JobStage.FAILED, 100, detail=error)
 
     async def publish_portfolio(
-        self, *, portfolio_id: uuid.UUID, current_user: User
+        self, *, portfolio_id: uuid.UUID, current_user: UserSnapshot
     ) -> PortfolioReadWithoutItems:
         published_portfolio = (
             await self.crud.get_published_portfolio_by_id_without_items(
@@ -219,11 +502,16 @@ class PortfolioService:
             published_portfolio.status = PortfolioStatus.PENDING_QNA
 
         portfolio.status = PortfolioStatus.PUBLISHED
+        await self._commit_changes(
+            current_user=current_user,
+            portfolio_ids=[portfolio.id]
+            + ([published_portfolio.id] if published_portfolio else []),
+        )
 
         return PortfolioReadWithoutItems.model_validate(portfolio)
 
     async def get_portfolios_by_user(
-        self, *, current_user: User
+        self, *, current_user: UserSnapshot
     ) -> List[PortfolioReadWithoutItems]:
         portfolios = await self.crud.get_portfolios_by_user_without_items(
             user_id=current_user.id
@@ -231,7 +519,7 @@ class PortfolioService:
         return [PortfolioReadWithoutItems.model_validate(p) for p in portfolios]
 
     async def get_portfolio_by_id(
-        self, *, portfolio_id: uuid.UUID, current_user: User
+        self, *, portfolio_id: uuid.UUID, current_user: UserSnapshot
     ) -> PortfolioRead:
         """ID로 특정 포트폴리오를 조회합니다."""
         portfolio = await self.crud.get_portfolio_by_id_with_items(
@@ -244,17 +532,23 @@ class PortfolioService:
             )
         return PortfolioRead.model_validate(portfolio)
 
-    async def get_published_portfolio_by_email(
-        self, *, nickname: str
-    ) -> PublishedPortfolioRead:
-        user = await self.user_crud.get_user_by_nickname(nickname=nickname)
+    async def get_published_portfolio_by_email(self, *, nickname: str) -> str:
+        """
+        공개 포트폴리오 응답 JSON을 반환합니다.
+        캐시에 있으면 Redis GET 한 번으로 끝나고, 없으면 DB에서 만들어 캐시에 채웁니다.
+        """
+        cached = await self.published_cache.get(nickname)
+        if cached:
+            return cached
+
+        user = await self.user_read_crud.get_user_by_nickname(nickname=nickname)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"{nickname} 사용자를 찾을 수 없습니다.",
             )
 
-        portfolio = await self.crud.get_published_portfolio_by_user_id_with_items(
+        portfolio = await self.read_crud.get_published_portfolio_by_user_id_with_items(
             user_id=user.id
         )
         if not portfolio:
@@ -262,22 +556,28 @@ class PortfolioService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="포트폴리오를 찾을 수 없거나 해당 포트폴리오에 접근할 권한이 없습니다.",
             )
-        return PublishedPortfolioRead(
-            id=portfolio.id,
-            user_id=user.id,
-            status=portfolio.status,
-            name=portfolio.name,
-            created_at=portfolio.created_at,
-            items=[PortfolioItemRead.model_validate(item) for item in portfolio.items],
-            first_name=user.first_name,
-            last_name=user.last_name,
-            address=user.address,
-            job=user.job,
-            theme=portfolio.theme
-        )
+        body = serialize_published_portfolio(user, portfolio)
+        await self.published_cache.fill(nickname, body)
+        return body
+
+    async def _commit_changes(
+        self,
+        *,
+        current_user: UserSnapshot,
+        portfolio_ids: List[uuid.UUID],
+        refresh_published: bool = True,
+    ) -> None:
+        """
+        변경 사항을 커밋한 뒤 포트폴리오 버전(ETag)을 올리고 공개 포트폴리오 캐시를 다시 만듭니다.
+        커밋 전에 버전을 올리면 새 ETag로 이전 데이터가 캐시될 수 있으므로 순서를 지킵니다.
+        """
+        await self.crud.db.commit()
+        await self.portfolio_version.bump(*portfolio_ids)
+        if refresh_published:
+            await self.published_cache.refresh(db=self.crud.db, user_id=current_user.id)
 
     async def delete_portfolio(
-        self, *, portfolio_id: uuid.UUID, current_user: User
+        self, *, portfolio_id: uuid.UUID, current_user: UserSnapshot
     ) -> None:
         deleted = await self.crud.delete_portfolio(
             portfolio_id=portfolio_id, user_id=current_user.id
@@ -288,6 +588,9 @@ class PortfolioService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="삭제할 포트폴리오를 찾을 수 없거나 권한이 없습니다.",
             )
+        await self._commit_changes(
+            current_user=current_user, portfolio_ids=[portfolio_id]
+        )
         return None
 
     async def update_portfolio(
@@ -295,7 +598,7 @@ class PortfolioService:
         *,
         portfolio_id: uuid.UUID,
         portfolio_update: PortfolioUpdate,
-        current_user: User,
+        current_user: UserSnapshot,
     ) -> PortfolioReadWithoutItems:
         portfolio = await self.crud.get_portfolio_by_id_without_items(
             portfolio_id=portfolio_id, user_id=current_user.id
@@ -308,4 +611,9 @@ class PortfolioService:
             )
 
         portfolio.name = portfolio_update.name
+        await self._commit_changes(
+            current_user=current_user,
+            portfolio_ids=[portfolio_id],
+            refresh_published=portfolio.status == PortfolioStatus.PUBLISHED,
+        )
         return PortfolioReadWithoutItems.model_validate(portfolio)
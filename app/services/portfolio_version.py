@@ -0,0 +1,63 @@
+import time
+import uuid
+from typing import Optional
+
+import redis.asyncio as aioredis
+from fastapi import Depends
+
+from app.core.config import settings
+from app.core.etag import make_etag
+from app.db.session import get_redis_client
+
+VERSION_KEY_PREFIX = "portfolio:version:"
+
+
+class PortfolioVersion:
+    """
+    포트폴리오, 항목, Q&A가 바뀔 때마다 올리는 Redis 버전 카운터.
+    조회 API는 이 값으로 ETag를 만들어 행을 읽지 않고 If-None-Match 재검증에 응답합니다.
+
+    키는 bump 에서만 만들고 PORTFOLIO_VERSION_TTL_SECONDS 후 만료됩니다. 조회는 키를 만들지 않으며,
+    키가 없으면 ETag 없이 응답합니다. 다시 만들 때는 현재 시각(ns)에서 시작하므로
+    예전에 발급된 ETag와 겹치지 않습니다.
+    변경 사항을 커밋한 뒤에 bump 해야 새 ETag로 이전 데이터가 캐시되지 않습니다.
+    """
+
+    def __init__(self, redis_client: aioredis.Redis):
+        self.redis = redis_client
+
+    async def get(self, portfolio_id: uuid.UUID) -> Optional[str]:
+        try:
+            return await self.redis.get(f"{VERSION_KEY_PREFIX}{portfolio_id}")
+        except Exception as e:
+            print(f"Error reading portfolio version: {e}")
+            return None
+
+    async def bump(self, *portfolio_ids: uuid.UUID) -> None:
+        if not portfolio_ids:
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for portfolio_id in set(portfolio_ids):
+                    key = f"{VERSION_KEY_PREFIX}{portfolio_id}"
+                    pipe.set(key, time.time_ns(), nx=True)
+                    pipe.incr(key)
+                    pipe.expire(key, settings.PORTFOLIO_VERSION_TTL_SECONDS)
+                await pipe.execute()
+        except Exception as e:
+            print(f"Error bumping portfolio version: {e}")
+
+    async def etag(
+        self, resource: str, portfolio_id: uuid.UUID, user_id: uuid.UUID
+    ) -> Optional[str]:
+        """리소스 종류/소유자/버전으로 만든 약한 ETag. 버전이 없거나 읽지 못하면 None 입니다."""
+        version = await self.get(portfolio_id)
+        if version is None:
+            return None
+        return make_etag(f"{resource}:{user_id}:{portfolio_id}:{version}")
+
+
+async def get_portfolio_version(
+    redis_client: aioredis.Redis = Depends(get_redis_client),
+) -> PortfolioVersion:
+    return PortfolioVersion(redis_client)
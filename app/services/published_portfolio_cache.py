@@ -0,0 +1,131 @@
+import uuid
+from typing import Optional
+
+import redis.asyncio as aioredis
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.crud.portfolio_crud import PortfolioCRUD
+from app.crud.user_crud import UserCRUD
+from app.db.session import get_redis_client
+from app.models.portfolio import Portfolio
+from app.models.user import User
+from app.schemas.portfolio_item_schema import PortfolioItemRead
+from app.schemas.portfolio_schema import PublishedPortfolioRead
+
+PUBLISHED_KEY_PREFIX = "portfolio:published:"
+# 무효화 후 복제본이 아직 이전 데이터를 돌려줄 수 있는 동안 fill(NX)을 막는 빈 값
+TOMBSTONE = ""
+
+
+def build_published_portfolio(
+    user: User, portfolio: Portfolio
+) -> PublishedPortfolioRead:
+    return PublishedPortfolioRead(
+        id=portfolio.id,
+        user_id=user.id,
+        status=portfolio.status,
+        name=portfolio.name,
+        created_at=portfolio.created_at,
+        items=[PortfolioItemRead.model_validate(item) for item in portfolio.items],
+        first_name=user.first_name,
+        last_name=user.last_name,
+        address=user.address,
+        job=user.job,
+        theme=portfolio.theme,
+    )
+
+
+def serialize_published_portfolio(user: User, portfolio: Portfolio) -> str:
+    # 임베딩 생성 상태는 공개 페이지에 필요 없으므로 제외합니다.
+    return build_published_portfolio(user, portfolio).model_dump_json(
+        exclude={"items": {"__all__": {"embedding_status"}}}
+    )
+
+
+class PublishedPortfolioCache:
+    """
+    닉네임을 키로 공개 포트폴리오 응답 JSON을 미리 직렬화해 보관합니다.
+    게시/항목 수정/프로필 수정 시 기본 DB에서 다시 만들어 덮어쓰고(refresh),
+    캐시 미스 시 조회 경로에서 채울 때는 이미 갱신된 값을 덮어쓰지 않도록 NX로 씁니다.
+
+    조회 경로는 복제본에서 읽으므로, 무효화(invalidate)는 키를 지우는 대신 복제 지연 허용 시간 동안
+    빈 값(tombstone)을 남깁니다. 그동안 지연된 복제본의 이전 데이터가 NX로 다시 채워지지 않습니다.
+    """
+
+    def __init__(self, redis_client: aioredis.Redis):
+        self.redis = redis_client
+
+    async def get(self, nickname: str) -> Optional[str]:
+        if not settings.PUBLISHED_PORTFOLIO_CACHE_ENABLED:
+            return None
+        try:
+            value = await self.redis.get(f"{PUBLISHED_KEY_PREFIX}{nickname}")
+        except Exception as e:
+            print(f"Error reading published portfolio cache: {e}")
+            value = None
+        metrics.increment(
+            "published_portfolio_cache_total", outcome="hit" if value else "miss"
+        )
+        return value
+
+    async def fill(self, nickname: str, body: str) -> None:
+        await self._set(nickname, body, nx=True)
+
+    async def _set(self, nickname: str, body: str, *, nx: bool = False) -> None:
+        if not settings.PUBLISHED_PORTFOLIO_CACHE_ENABLED:
+            return
+        try:
+            await self.redis.set(
+                f"{PUBLISHED_KEY_PREFIX}{nickname}",
+                body,
+                ex=settings.PUBLISHED_PORTFOLIO_CACHE_TTL_SECONDS,
+                nx=nx,
+            )
+        except Exception as e:
+            print(f"Error writing published portfolio cache: {e}")
+
+    async def invalidate(self, nickname: Optional[str]) -> None:
+        if not nickname:
+            return
+        # 복제본은 최대 지연 + 지연 확인 주기 동안 이전 데이터를 돌려줄 수 있습니다.
+        tombstone_ttl = max(
+            1,
+            round(
+                settings.DATABASE_READ_MAX_LAG_SECONDS
+                + settings.DATABASE_READ_LAG_CHECK_INTERVAL_SECONDS
+            ),
+        )
+        try:
+            await self.redis.set(
+                f"{PUBLISHED_KEY_PREFIX}{nickname}", TOMBSTONE, ex=tombstone_ttl
+            )
+        except Exception as e:
+            print(f"Error invalidating published portfolio cache: {e}")
+
+    async def refresh(self, *, db: AsyncSession, user_id: uuid.UUID) -> None:
+        """
+        사용자의 공개 포트폴리오를 기본 DB에서 다시 만들어 캐시에 씁니다.
+        프로필도 db(기본 DB 세션)에서 다시 읽으므로 인증 캐시의 UserSnapshot 이 오래되어도 반영됩니다.
+        호출 전에 변경 사항을 커밋해야 다른 요청이 보는 상태와 캐시가 일치합니다.
+        """
+        user = await UserCRUD(db).get_user_by_id(user_id=user_id, populate_existing=True)
+        if not user or not user.nickname:
+            return
+        portfolio_crud = PortfolioCRUD(db)
+        portfolio = await portfolio_crud.get_published_portfolio_by_user_id_with_items(
+            user_id=user.id, populate_existing=True
+        )
+        if not portfolio:
+            await self.invalidate(user.nickname)
+            return
+        await self._set(user.nickname, serialize_published_portfolio(user, portfolio))
+        metrics.increment("published_portfolio_cache_refresh_total")
+
+
+async def get_published_portfolio_cache(
+    redis_client: aioredis.Redis = Depends(get_redis_client),
+) -> PublishedPortfolioCache:
+    return PublishedPortfolioCache(redis_client)
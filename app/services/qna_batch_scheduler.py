@@ -0,0 +1,158 @@
+import asyncio
+from typing import AsyncIterator, List, Tuple
+
+from fastapi import Depends
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.models.portfolio_item import PortfolioItem
+from app.schemas.llm_schema import LLMQnA
+from app.services.llm_service import LLMService, get_llm_service
+
+ItemQnAs = Tuple[PortfolioItem, List[LLMQnA]]
+# (생성 완료된 항목, 단건 호출로 다시 생성해야 하는 항목)
+ChunkResult = Tuple[List[ItemQnAs], List[PortfolioItem]]
+
+
+def estimate_item_tokens(item: PortfolioItem) -> int:
+    """
+    프롬프트에 들어갈 항목 크기의 대략적인 토큰 수.
+    한국어/영어가 섞인 포트폴리오 기준으로 2글자당 1토큰으로 보수적으로 계산합니다.
+    """
+    text = f"{item.topic or ''}{item.tech_stack or ''}{item.content or ''}"
+    return len(text) // 2 + 1
+
+
+def pack_items(
+    items: List[PortfolioItem], *, token_budget: int, max_items: int
+) -> List[List[PortfolioItem]]:
+    """
+    항목을 순서대로 token_budget / max_items 이내의 배치로 묶습니다.
+    예산을 혼자 넘는 큰 항목은 단독 배치가 됩니다.
+    """
+    batches: List[List[PortfolioItem]] = []
+    current: List[PortfolioItem] = []
+    current_tokens = 0
+    for item in items:
+        tokens = estimate_item_tokens(item)
+        if current and (
+            current_tokens + tokens > token_budget or len(current) >= max_items
+        ):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(item)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+class QnABatchScheduler:
+    """
+    여러 작은 항목을 한 번의 LLM 요청으로 묶어 Q&A를 생성하고, item_id로 결과를 다시 나눕니다.
+    동시 LLM 호출 수는 QNA_GENERATION_CONCURRENCY로 제한하며,
+    배치 응답에서 누락된 항목은 단건 호출로 다시 생성합니다.
+    """
+
+    def __init__(self, llm_service: LLMService = Depends(get_llm_service)):
+        self.llm_service = llm_service
+
+    async def iter_results(
+        self, items: List[PortfolioItem]
+    ) -> AsyncIterator[List[ItemQnAs]]:
+        """
+        LLM 호출이 끝나는 순서대로 (항목, Q&A 목록) 묶음을 전달합니다.
+        배치 응답에서 누락된 항목은 단건 호출로 다시 예약되어 이후 묶음으로 전달됩니다.
+        생성에 실패한 항목은 빈 Q&A 목록으로 전달됩니다.
+        """
+        if not items:
+            return
+
+        semaphore = asyncio.Semaphore(settings.QNA_GENERATION_CONCURRENCY)
+        calls = 0
+
+        async def run_single(item: PortfolioItem, kind: str) -> ChunkResult:
+            nonlocal calls
+            async with semaphore:
+                calls += 1
+                metrics.increment("qna_llm_calls_total", kind=kind)
+                try:
+                    output = await self.llm_service.generate_qna_for_portfolio_item(
+                        item=item
+                    )
+                    return [(item, output.qnas)], []
+                except Exception as e:
+                    print(f"Error generating QnA for portfolio_item_id {item.id}: {e}")
+                    return [(item, [])], []
+
+        async def run_batch(batch: List[PortfolioItem]) -> ChunkResult:
+            nonlocal calls
+            by_id = {str(index): item for index, item in enumerate(batch, start=1)}
+            async with semaphore:
+                calls += 1
+                metrics.increment("qna_llm_calls_total", kind="batch")
+                try:
+                    output = await self.llm_service.generate_qna_for_portfolio_items(
+                        items=list(by_id.items())
+                    )
+                    returned = {
+                        result.item_id.strip(): result.qnas
+                        for result in output.results
+                        if result.qnas
+                    }
+                except Exception as e:
+                    print(f"Error generating batched QnA for {len(batch)} items: {e}")
+                    returned = {}
+
+            completed = [
+                (item, returned[item_id])
+                for item_id, item in by_id.items()
+                if item_id in returned
+            ]
+            missing = [
+                item for item_id, item in by_id.items() if item_id not in returned
+            ]
+            if missing:
+                metrics.increment("qna_batch_fallback_items_total", value=len(missing))
+            return completed, missing
+
+        if settings.QNA_BATCH_ENABLED:
+            batches = pack_items(
+                items,
+                token_budget=settings.QNA_BATCH_TOKEN_BUDGET,
+                max_items=settings.QNA_BATCH_MAX_ITEMS,
+            )
+        else:
+            batches = [[item] for item in items]
+
+        # 배치 응답에 따라 단건 호출이 추가되므로 as_completed 대신 asyncio.wait로 완료 순서를 따릅니다.
+        pending = {
+            asyncio.create_task(
+                run_batch(batch) if len(batch) > 1 else run_single(batch[0], "single")
+            )
+            for batch in batches
+        }
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    completed, missing = task.result()
+                    pending |= {
+                        asyncio.create_task(run_single(item, "fallback"))
+                        for item in missing
+                    }
+                    if completed:
+                        yield completed
+        finally:
+            for task in pending:
+                task.cancel()
+
+        saved = len(items) - calls
+        if saved > 0:
+            metrics.increment("qna_llm_calls_saved_total", value=saved)
+        print(
+            f"Generated QnA for {len(items)} items with {calls} LLM calls "
+            f"({len(batches)} batches, {saved} calls saved)"
+        )
@@ -1,36 +1,67 @@
-import asyncio
+import hashlib
+import json
 import uuid
-from typing import List
-from fastapi import BackgroundTasks, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import Depends, HTTPException, status
 
+from app.core.config import settings
 from app.crud.portfolio_crud import PortfolioCRUD
 from app.db.session import AsyncSessionLocal
 from app.crud.portfolio_item_crud import PortfolioItemCRUD
 from app.crud.qna_crud import QnACRUD
+from app.crud.user_crud import UserCRUD
 from app.models.portfolio import PortfolioStatus
 from app.models.qna import QnA, QnAStatus
-from app.schemas.portfolio_schema import PortfolioReadWithoutItems
+from app.schemas.job_schema import Job, JobStage
+from app.schemas.portfolio_schema import (
+    PortfolioJobResponse,
+    PortfolioReadWithoutItems,
+)
 from app.schemas.qna_schema import (
     QnARead,
     QnACreate,
     QnAsUpdate,
 )
-from app.models.user import User
-from app.models.portfolio_item import PortfolioItem
+from app.schemas.user_schema import UserSnapshot
+from app.models.portfolio_item import EmbeddingStatus, PortfolioItem
+from app.core.metrics import metrics
+from app.services.embedding_gateway import embedding_model_tag
 from app.services.fcm_service import FCMService
-from app.services.llm_service import LLMService
+from app.services.job_progress import JobProgress, get_job_progress
+from app.services.job_queue import JobQueue, get_job_queue
+from app.services.llm_service import LLMService, get_llm_service
+from app.services.portfolio_version import PortfolioVersion, get_portfolio_version
+from app.services.qna_batch_scheduler import QnABatchScheduler
 from app.services.rag_service import RAGService
 
+GENERATE_QNA_JOB = "generate_qna"
+EMBED_QNAS_JOB = "embed_qnas"
+
+# Q&A를 다시 생성할 수 있는 포트폴리오 상태
+QNA_GENERATABLE_STATUSES = (PortfolioStatus.CONFIRMED, PortfolioStatus.PENDING_QNA)
+
+
+def compute_qna_fingerprint(item: PortfolioItem) -> str:
+    """Q&A 생성에 사용되는 topic/content/tech_stack의 SHA-256."""
+    source = json.dumps(
+        [item.topic, item.content, item.tech_stack], ensure_ascii=False
+    )
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
 
 class QnAService:
     def __init__(
         self,
         qna_crud: QnACRUD = Depends(),
-        llm_service: LLMService = Depends(),
+        llm_service: LLMService = Depends(get_llm_service),
         rag_service: RAGService = Depends(),
         portfolio_item_crud: PortfolioItemCRUD = Depends(),
         portfolio_crud: PortfolioCRUD = Depends(),
         fcm_service: FCMService = Depends(),
+        job_queue: JobQueue = Depends(get_job_queue),
+        job_progress: JobProgress = Depends(get_job_progress),
+        qna_batch_scheduler: QnABatchScheduler = Depends(),
+        portfolio_version: PortfolioVersion = Depends(get_portfolio_version),
     ):
         self.qna_crud = qna_crud
         self.portfolio_item_crud = portfolio_item_crud
@@ -38,39 +69,44 @@ class QnAService:
         self.rag_service = rag_service
         self.portfolio_crud = portfolio_crud
         self.fcm_service = fcm_service
+        self.job_queue = job_queue
+        self.job_progress = job_progress
+        self.qna_batch_scheduler = qna_batch_scheduler
+        self.portfolio_version = portfolio_version
 
-    async def _generate_qna_for_item(self, *, item: PortfolioItem) -> List[QnACreate]:
-        try:
-            parsed_output = await self.llm_service.generate_qna_for_portfolio_item(
-                item=item
-            )
-
-            return [
-                QnACreate(
-                    question=qna_set.question,
-                    answer=qna_set.answer,
-                    portfolio_item_id=item.id,
-                )
-                for qna_set in parsed_output.qnas
-            ]
-        except Exception as e:
-            print(f"Error generating QnA for portfolio_item_id {item.id}: {e}")
-            return []
+    async def _commit_changes(self, *, qnas: List[QnA]) -> None:
+        """Q&A 변경을 커밋한 뒤 해당 포트폴리오의 버전(ETag)을 올립니다."""
+        await self.qna_crud.db.commit()
+        portfolio_ids = await self.portfolio_item_crud.get_portfolio_ids_by_item_ids(
+            portfolio_item_ids=list({qna.portfolio_item_id for qna in qnas})
+        )
+        await self.portfolio_version.bump(*portfolio_ids)
 
     async def generate_qna_for_all_portfolios_background(
         self,
         *,
-        current_user: User,
+        user_id: uuid.UUID,
         portfolio_id: uuid.UUID,
+        job_id: Optional[str] = None,
+        is_last_attempt: bool = True,
     ):
+        """
+        DRAFT_QNA 포트폴리오의 항목별 Q&A를 생성합니다. (작업 큐 워커에서 실행)
+        실패 시 예외를 다시 던져 재시도되도록 하고, 작업이 dead-letter로 옮겨지면
+        워커가 fail_generate_qna 로 FAILED 표시와 실패 알림을 처리합니다.
+        """
         async with AsyncSessionLocal() as db:
-            try:
-                portfolio_crud = PortfolioCRUD(db)
-                qna_crud = QnACRUD(db)
+            portfolio_crud = PortfolioCRUD(db)
+            qna_crud = QnACRUD(db)
+            user_crud = UserCRUD(db)
 
+            user = await user_crud.get_user_by_id(user_id=user_id)
+            fcm_token = user.fcm_token if user else None
+
+            try:
                 portfolio = (
                     await portfolio_crud.get_draft_qna_portfolio_by_id_with_items(
-                        portfolio_id=portfolio_id, user_id=current_user.id
+                        portfolio_id=portfolio_id, user_id=user_id
                     )
                 )
 
@@ -78,48 +114,144 @@ class QnAService:
                     print(
                         f"No confirmed portfolio items found for portfolio_id: {portfolio_id}"
                     )
+                    await self.job_progress.publish(
+                        job_id, JobStage.FAILED, 100, detail="portfolio not found"
+                    )
                     return
 
-                tasks = [
-                    self._generate_qna_for_item(item=item) for item in portfolio.items
+                # 마지막 생성 이후 내용이 바뀐 항목만 다시 생성하고, 나머지 Q&A는 유지합니다.
+                fingerprints = {
+                    item.id: compute_qna_fingerprint(item) for item in portfolio.items
+                }
+                # 지문 컬럼 추가 전에 Q&A를 생성한 항목(지문 NULL)은 기존 Q&A를 변경되지 않은 것으로 보고
+                # 현재 지문만 기록합니다. (첫 재생성에서 모든 Q&A가 교체되지 않도록)
+                legacy_items = [
+                    item for item in portfolio.items if item.qna_fingerprint is None
+                ]
+                items_with_qnas = await qna_crud.get_portfolio_item_ids_with_qnas(
+                    portfolio_item_ids=[item.id for item in legacy_items],
+                    user_id=user_id,
+                )
+                for item in legacy_items:
+                    if item.id in items_with_qnas:
+                        item.qna_fingerprint = fingerprints[item.id]
+                changed_items = [
+                    item
+                    for item in portfolio.items
+                    if item.qna_fingerprint != fingerprints[item.id]
                 ]
-                results = await asyncio.gather(*tasks)
+                metrics.increment(
+                    "qna_items_skipped_total",
+                    value=len(portfolio.items) - len(changed_items),
+                )
+                total = len(changed_items)
+                done = 0
+                await self.job_progress.publish(
+                    job_id, JobStage.QNA, 0, detail=f"0/{total} items"
+                )
 
-                qnas_to_create = []
-                for result in results:
-                    qnas_to_create.extend(result)
+                # LLM 호출이 끝나는 대로 해당 항목의 Q&A를 교체하고 커밋하므로,
+                # 생성 중에도 Q&A 목록 조회에서 완료된 항목의 결과를 볼 수 있습니다.
+                async for completed in self.qna_batch_scheduler.iter_results(
+                    changed_items
+                ):
+                    generated = [(item, qnas) for item, qnas in completed if qnas]
+                    await qna_crud.delete_qnas_by_portfolio_item_ids(
+                        portfolio_item_ids=[item.id for item, _ in generated],
+                        user_id=user_id,
+                    )
+                    qna_list = [
+                        QnACreate(
+                            question=qna_set.question,
+                            answer=qna_set.answer,
+                            portfolio_item_id=item.id,
+                        )
+                        for item, qnas in generated
+                        for qna_set in qnas
+                    ]
+                    if len(qna_list) >= settings.BULK_COPY_MIN_ROWS:
+                        await qna_crud.copy_create_qnas(
+                            qna_list=qna_list, user_id=user_id
+                        )
+                    else:
+                        await qna_crud.bulk_create_qnas(
+                            qna_list=qna_list, user_id=user_id
+                        )
+                    for item, _ in generated:
+                        item.qna_fingerprint = fingerprints[item.id]
+                    await db.commit()
+                    await self.portfolio_version.bump(portfolio_id)
 
-                if qnas_to_create:
-                    await qna_crud.bulk_create_qnas(
-                        qna_list=qnas_to_create, user_id=current_user.id
+                    done += len(completed)
+                    await self.job_progress.publish(
+                        job_id,
+                        JobStage.QNA,
+                        90 * done // total,
+                        detail=f"{done}/{total} items",
                     )
 
                 portfolio.status = PortfolioStatus.PENDING_QNA
                 await db.commit()
-                
-                if current_user and current_user.fcm_token:
-                    self.fcm_service.send_notification(
-                        token=current_user.fcm_token,
-                        title="create_qna_success",
-                        body=f"{portfolio_id}",
-                    )
+                await self.portfolio_version.bump(portfolio_id)
+
             except Exception as e:
                 await db.rollback()
                 print(f"Error generating QnA for portfolio {portfolio_id}: {e}")
-                if current_user and current_user.fcm_token:
-                    self.fcm_service.send_notification(
-                        token=current_user.fcm_token,
-                        title="create_qna_fail",
-                        body=f"{portfolio_id}",
+                if not is_last_attempt:
+                    await self.job_progress.publish(
+                        job_id, JobStage.RETRYING, 0, detail=str(e)
                     )
+                raise
+
+            await self.job_progress.publish(job_id, JobStage.DONE, 100)
+            if fcm_token:
+                await self.fcm_service.send_notification(
+                    token=fcm_token,
+                    title="create_qna_success",
+                    body=f"{portfolio_id}",
+                )
+
+    async def fail_generate_qna(
+        self,
+        *,
+        user_id: uuid.UUID,
+        portfolio_id: uuid.UUID,
+        job_id: Optional[str] = None,
+        error: Optional[str] = None,
+    ):
+        """
+        dead-letter로 옮겨진 Q&A 생성 작업을 마무리합니다. (작업 큐 워커에서 실행)
+        아직 DRAFT_QNA인 포트폴리오를 FAILED로 표시하고 실패 이벤트와 알림을 보냅니다.
+        """
+        async with AsyncSessionLocal() as db:
+            portfolio_crud = PortfolioCRUD(db)
+            user_crud = UserCRUD(db)
+
+            portfolio = await portfolio_crud.get_portfolio_by_id_without_items(
+                portfolio_id=portfolio_id, user_id=user_id
+            )
+            if portfolio and portfolio.status == PortfolioStatus.DRAFT_QNA:
+                portfolio.status = PortfolioStatus.FAILED
+                await db.commit()
+                await self.portfolio_version.bump(portfolio_id)
+
+            user = await user_crud.get_user_by_id(user_id=user_id)
+            fcm_token = user.fcm_token if user else None
+
+        await self.job_progress.publish(job_id, JobStage.FAILED, 100, detail=error)
+        if fcm_token:
+            await self.fcm_service.send_notification(
+                token=fcm_token,
+                title="create_qna_fail",
+                body=f"{portfolio_id}",
+            )
 
     async def add_qna_generation_task(
         self,
         *,
-        background_tasks: BackgroundTasks,
-        current_user: User,
+        current_user: UserSnapshot,
         portfolio_id: uuid.UUID,
-    ) -> PortfolioReadWithoutItems:
+    ) -> PortfolioJobResponse:
         portfolio = await self.portfolio_crud.get_portfolio_by_id_without_items(
             portfolio_id=portfolio_id, user_id=current_user.id
         )
@@ -128,24 +260,39 @@ class QnAService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="포트폴리오를 찾을 수 없거나 해당 포트폴리오에 접근할 권한이 없습니다.",
             )
-            
-        if portfolio.status != PortfolioStatus.CONFIRMED:
+
+        if portfolio.status not in QNA_GENERATABLE_STATUSES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="확정되지 않은 포트폴리오 입니다.",
             )
 
         portfolio.status = PortfolioStatus.DRAFT_QNA
+        # 워커가 DRAFT_QNA 상태를 조회할 수 있도록 등록 전에 커밋합니다.
+        await self.portfolio_crud.db.commit()
+        await self.portfolio_version.bump(portfolio_id)
+
+        job = Job(
+            name=GENERATE_QNA_JOB,
+            payload={"portfolio_id": str(portfolio_id), "user_id": str(current_user.id)},
+        )
+        await self.job_progress.register(job.id, str(current_user.id))
+        await self.job_queue.enqueue(job.name, job.payload, job_id=job.id)
+        return PortfolioJobResponse(
+            **PortfolioReadWithoutItems.model_validate(portfolio).model_dump(),
+            job_id=job.id,
+        )
 
-        background_tasks.add_task(
-            self.generate_qna_for_all_portfolios_background,
-            current_user=current_user,
-            portfolio_id=portfolio_id,
+    async def is_qna_generation_in_progress(
+        self, *, portfolio_id: uuid.UUID, current_user: UserSnapshot
+    ) -> bool:
+        portfolio = await self.portfolio_crud.get_portfolio_by_id_without_items(
+            portfolio_id=portfolio_id, user_id=current_user.id
         )
-        return PortfolioReadWithoutItems.model_validate(portfolio)
+        return bool(portfolio) and portfolio.status == PortfolioStatus.DRAFT_QNA
 
     async def get_qnas_by_portfolio(
-        self, *, portfolio_id: uuid.UUID, current_user: User
+        self, *, portfolio_id: uuid.UUID, current_user: UserSnapshot
     ) -> List[QnARead]:
         qnas = await self.qna_crud.get_qnas_by_portfolio_id(
             portfolio_id=portfolio_id, user_id=current_user.id
@@ -158,12 +305,13 @@ class QnAService:
                 portfolio_item_id=qna.portfolio_item_id,
                 question=qna.question,
                 answer=qna.answer,
+                embedding_status=qna.embedding_status,
             )
             for qna in qnas
         ]
 
     async def update_qnas(
-        self, *, qnas_in: QnAsUpdate, current_user: User
+        self, *, qnas_in: QnAsUpdate, current_user: UserSnapshot
     ) -> List[QnARead]:
         qnas = await self.qna_crud.get_qnas_by_ids(
             ids=[qna.id for qna in qnas_in.qnas], user_id=current_user.id
@@ -174,6 +322,7 @@ class QnAService:
             qna_update = update_qna_dict[qna.id]
             qna.question = qna_update.question
             qna.answer = qna_update.answer
+        await self._commit_changes(qnas=qnas)
 
         return [
             QnARead(
@@ -182,23 +331,123 @@ class QnAService:
                 portfolio_item_id=qna.portfolio_item_id,
                 question=qna.question,
                 answer=qna.answer,
+                embedding_status=qna.embedding_status,
             )
             for qna in qnas
         ]
 
-    async def delete_qnas(self, *, qna_ids: List[uuid.UUID], current_user: User):
+    async def delete_qnas(self, *, qna_ids: List[uuid.UUID], current_user: UserSnapshot):
         qnas = await self.qna_crud.get_qnas_by_ids(ids=qna_ids, user_id=current_user.id)
         for qna in qnas:
             qna.status = QnAStatus.DELETED
+        await self._commit_changes(qnas=qnas)
 
     async def confirm_qnas(
-        self, *, qna_ids: List[uuid.UUID], current_user: User
+        self, *, qna_ids: List[uuid.UUID], current_user: UserSnapshot
     ) -> List[QnA]:
+        """
+        Q&A를 확정하고 임베딩 생성 작업을 작업 큐에 등록합니다.
+        새 임베딩이 저장되기 전까지 Q&A는 EMBEDDING 상태이며, 기존 임베딩이 있으면 그대로 검색에 사용됩니다.
+        임베딩 생성에 실패한(FAILED) Q&A도 다시 확정하면 재시도합니다.
+        """
         qnas = await self.qna_crud.get_qnas_by_ids(ids=qna_ids, user_id=current_user.id)
-        embeddings = await self.rag_service.embed_qnas(qnas)
+        if not qnas:
+            return qnas
 
-        for qna, embedding in zip(qnas, embeddings):
-            qna.embedding = embedding
+        for qna in qnas:
+            # 수정된 내용으로 다시 임베딩합니다. 기존 임베딩은 새 임베딩이 저장될 때까지 유지됩니다.
+            qna.embedding_state = EmbeddingStatus.EMBEDDING
             qna.status = QnAStatus.CONFIRMED
+        # 워커가 CONFIRMED Q&A를 조회할 수 있도록 등록 전에 커밋합니다.
+        await self._commit_changes(qnas=qnas)
 
+        job = Job(
+            name=EMBED_QNAS_JOB,
+            payload={
+                "qna_ids": [str(qna.id) for qna in qnas],
+                "user_id": str(current_user.id),
+            },
+        )
+        await self.job_progress.register(job.id, str(current_user.id))
+        await self.job_queue.enqueue(job.name, job.payload, job_id=job.id)
         return qnas
+
+    async def embed_qnas_background(
+        self,
+        *,
+        qna_ids: List[uuid.UUID],
+        user_id: uuid.UUID,
+        job_id: Optional[str] = None,
+        is_last_attempt: bool = True,
+    ):
+        """
+        확정된 Q&A 중 임베딩이 없는 Q&A를 EMBEDDING_MAX_BATCH_SIZE 단위로 임베딩해 저장합니다.
+        (작업 큐 워커에서 실행) 배치마다 커밋하므로 저장된 Q&A부터 채팅 검색에 포함됩니다.
+        """
+        async with AsyncSessionLocal() as db:
+            qna_crud = QnACRUD(db)
+            try:
+                qnas = await qna_crud.get_confirmed_qnas_to_embed(
+                    ids=qna_ids, user_id=user_id
+                )
+                portfolio_ids = await PortfolioItemCRUD(
+                    db
+                ).get_portfolio_ids_by_item_ids(
+                    portfolio_item_ids=list({qna.portfolio_item_id for qna in qnas})
+                )
+                total = len(qnas)
+                batch_size = settings.EMBEDDING_MAX_BATCH_SIZE
+                for start in range(0, total, batch_size):
+                    batch = qnas[start : start + batch_size]
+                    embeddings = await self.rag_service.embed_qnas(batch)
+                    for qna, embedding in zip(batch, embeddings):
+                        qna.embedding = embedding
+                        qna.embedding_model = embedding_model_tag()
+                        qna.embedding_state = EmbeddingStatus.READY
+                    await db.commit()
+                    await self.portfolio_version.bump(*portfolio_ids)
+
+                    done = start + len(batch)
+                    await self.job_progress.publish(
+                        job_id,
+                        JobStage.EMBEDDING,
+                        100 * done // total,
+                        detail=f"{done}/{total} qnas",
+                    )
+            except Exception as e:
+                await db.rollback()
+                print(f"Error embedding qnas for user {user_id}: {e}")
+                if not is_last_attempt:
+                    await self.job_progress.publish(
+                        job_id, JobStage.RETRYING, 0, detail=str(e)
+                    )
+                raise
+
+            await self.job_progress.publish(
+                job_id, JobStage.DONE, 100, detail=f"{total} qnas"
+            )
+
+    async def fail_embed_qnas(
+        self,
+        *,
+        qna_ids: List[uuid.UUID],
+        user_id: uuid.UUID,
+        job_id: Optional[str] = None,
+        error: Optional[str] = None,
+    ):
+        """
+        dead-letter로 옮겨진 Q&A 임베딩 작업을 마무리합니다. (작업 큐 워커에서 실행)
+        아직 EMBEDDING인 Q&A를 FAILED로 표시합니다. 기존 임베딩은 유지되고, 다시 확정하면 재시도합니다.
+        """
+        async with AsyncSessionLocal() as db:
+            qna_crud = QnACRUD(db)
+            await qna_crud.mark_embedding_failed(ids=qna_ids, user_id=user_id)
+            await db.commit()
+            qnas = await qna_crud.get_qnas_by_ids(ids=qna_ids, user_id=user_id)
+            portfolio_ids = await PortfolioItemCRUD(
+                db
+            ).get_portfolio_ids_by_item_ids(
+                portfolio_item_ids=list({qna.portfolio_item_id for qna in qnas})
+            )
+        await self.portfolio_version.bump(*portfolio_ids)
+        await self.job_progress.publish(job_id, JobStage.FAILED, 100, detail=error)
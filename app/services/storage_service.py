@@ -1,13 +1,46 @@
+import asyncio
+import hashlib
 import uuid
 import json
+from abc import ABC, abstractmethod
 from datetime import timedelta
-from google.cloud import storage
+from pathlib import Path
+from typing import AsyncIterator, Optional, Tuple
 from app.core.config import settings
-from google.oauth2 import service_account
 
+MIN_UPLOAD_SIZE = 1 * 1024  # 1 KB
+MAX_UPLOAD_SIZE = 30 * 1024 * 1024  # 30 MB
 
-class StorageService:
+
+class StorageBackend(ABC):
+    """업로드 URL 발급과 객체 다운로드를 담당하는 저장소 백엔드."""
+
+    @abstractmethod
+    def object_url(self, blob_name: str) -> str: ...
+
+    @abstractmethod
+    def blob_name_from_url(self, object_url: str) -> str: ...
+
+    @abstractmethod
+    async def generate_upload_url(self, blob_name: str) -> str: ...
+
+    @abstractmethod
+    async def upload_bytes(self, blob_name: str, data: bytes) -> str: ...
+
+    @abstractmethod
+    def iter_chunks(
+        self, object_url: str, chunk_size: int
+    ) -> AsyncIterator[bytes]: ...
+
+    async def close(self) -> None:
+        return None
+
+
+class GCSStorageBackend(StorageBackend):
     def __init__(self):
+        from google.cloud import storage
+        from google.oauth2 import service_account
+
         if settings.APP_ENV == "local":
             self.bucket_credential = (
                 service_account.Credentials.from_service_account_file(
@@ -23,45 +56,180 @@ class StorageService:
         self.bucket_name = settings.GCS_BUCKET_NAME
         self.bucket = self.storage_client.bucket(self.bucket_name)
 
-    async def generate_upload_url(
-        self, user_id: uuid.UUID, file_name: str
-    ) -> tuple[str, str]:
-        """
-        Generates a presigned URL for uploading a file to GCS.
-        """
-        blob_name = f"user_{user_id}/{uuid.uuid4()}/{file_name}"
-        blob = self.bucket.blob(blob_name)
+    def object_url(self, blob_name: str) -> str:
+        return f"gs://{self.bucket_name}/{blob_name}"
+
+    def blob_name_from_url(self, object_url: str) -> str:
+        if not object_url.startswith(f"gs://{self.bucket_name}/"):
+            raise ValueError("Invalid GCS URL for this bucket.")
+        return object_url.replace(f"gs://{self.bucket_name}/", "")
 
-        MIN_UPLOAD_SIZE = 1 * 1024  # 1 KB
-        MAX_UPLOAD_SIZE = 30 * 1024 * 1024  # 30 MB
+    async def generate_upload_url(self, blob_name: str) -> str:
+        blob = self.bucket.blob(blob_name)
 
         content_length_range = f"{MIN_UPLOAD_SIZE},{MAX_UPLOAD_SIZE}"
         extension_headers = {"x-goog-content-length-range": content_length_range}
 
-        url = blob.generate_signed_url(
+        # 서명(RSA)은 CPU 작업이고, 자격 증명에 따라 HTTP 호출이 발생할 수 있습니다.
+        return await asyncio.to_thread(
+            blob.generate_signed_url,
             version="v4",
             expiration=timedelta(minutes=15),
             method="POST",
             headers=extension_headers,
         )
 
-        object_url = f"gs://{self.bucket_name}/{blob_name}"
-        return url, object_url
+    async def upload_bytes(self, blob_name: str, data: bytes) -> str:
+        blob = self.bucket.blob(blob_name)
+        await asyncio.to_thread(
+            blob.upload_from_string, data, content_type="application/pdf"
+        )
+        return self.object_url(blob_name)
 
-    async def download_as_bytes(self, gcs_url: str) -> bytes:
-        """
-        Downloads a file from GCS and returns its content as bytes.
-        """
-        if not gcs_url.startswith(f"gs://{self.bucket_name}/"):
-            raise ValueError("Invalid GCS URL for this bucket.")
+    async def iter_chunks(
+        self, object_url: str, chunk_size: int
+    ) -> AsyncIterator[bytes]:
+        blob = self.bucket.blob(self.blob_name_from_url(object_url))
+        reader = blob.open("rb", chunk_size=chunk_size)
 
-        blob_name = gcs_url.replace(f"gs://{self.bucket_name}/", "")
-        blob = self.bucket.blob(blob_name)
+        try:
+            while True:
+                try:
+                    chunk = await asyncio.to_thread(reader.read, chunk_size)
+                except Exception as e:
+                    print(f"Error downloading file {object_url}: {e}")
+                    raise FileNotFoundError(
+                        f"File not found or access denied: {object_url}"
+                    ) from e
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            reader.close()
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self.storage_client.close)
+
+
+class LocalStorageBackend(StorageBackend):
+    """
+    로컬 파일 시스템 백엔드. 오프라인 환경에서 수집 파이프라인을 실행하거나
+    벤치마크할 때 사용합니다. 업로드 URL은 저장될 파일의 file:// 경로입니다.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = Path(root or settings.LOCAL_STORAGE_PATH).resolve()
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, blob_name: str) -> Path:
+        path = (self.root / blob_name).resolve()
+        if not path.is_relative_to(self.root):
+            raise ValueError("Invalid local storage path.")
+        return path
 
+    def object_url(self, blob_name: str) -> str:
+        return f"local://{blob_name}"
+
+    def blob_name_from_url(self, object_url: str) -> str:
+        if not object_url.startswith("local://"):
+            raise ValueError("Invalid local storage URL.")
+        return object_url.replace("local://", "", 1)
+
+    async def generate_upload_url(self, blob_name: str) -> str:
+        path = self._path(blob_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path.as_uri()
+
+    async def upload_bytes(self, blob_name: str, data: bytes) -> str:
+        path = self._path(blob_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(path.write_bytes, data)
+        return self.object_url(blob_name)
+
+    async def iter_chunks(
+        self, object_url: str, chunk_size: int
+    ) -> AsyncIterator[bytes]:
+        path = self._path(self.blob_name_from_url(object_url))
         try:
-            return blob.download_as_bytes()
-        except Exception as e:
-            print(f"Error downloading file {gcs_url}: {e}")
+            file = await asyncio.to_thread(path.open, "rb")
+        except OSError as e:
             raise FileNotFoundError(
-                f"File not found or access denied: {gcs_url}"
+                f"File not found or access denied: {object_url}"
             ) from e
+
+        try:
+            while True:
+                chunk = await asyncio.to_thread(file.read, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            file.close()
+
+
+_storage_backend: Optional[StorageBackend] = None
+
+
+def get_storage_backend() -> StorageBackend:
+    """프로세스 전체에서 공유하는 저장소 백엔드 (STORAGE_BACKEND: gcs | local)."""
+    global _storage_backend
+    if _storage_backend is None:
+        if settings.STORAGE_BACKEND == "local":
+            _storage_backend = LocalStorageBackend()
+        else:
+            _storage_backend = GCSStorageBackend()
+    return _storage_backend
+
+
+async def close_storage_backend() -> None:
+    global _storage_backend
+    if _storage_backend is not None:
+        await _storage_backend.close()
+        _storage_backend = None
+
+
+class StorageService:
+    def __init__(self):
+        self.backend = get_storage_backend()
+
+    async def generate_upload_url(
+        self, user_id: uuid.UUID, file_name: str
+    ) -> tuple[str, str]:
+        """
+        Generates a presigned URL for uploading a file.
+        """
+        blob_name = f"user_{user_id}/{uuid.uuid4()}/{file_name}"
+        url = await self.backend.generate_upload_url(blob_name)
+        return url, self.backend.object_url(blob_name)
+
+    async def iter_chunks(
+        self, object_url: str, chunk_size: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Streams a stored file in chunks without blocking the event loop.
+        """
+        async for chunk in self.backend.iter_chunks(
+            object_url, chunk_size or settings.STORAGE_DOWNLOAD_CHUNK_SIZE
+        ):
+            yield chunk
+
+    async def download_as_bytes(self, object_url: str) -> bytes:
+        """
+        Downloads a file and returns its content as bytes.
+        """
+        buffer = bytearray()
+        async for chunk in self.iter_chunks(object_url):
+            buffer += chunk
+        return bytes(buffer)
+
+    async def download_with_digest(self, object_url: str) -> Tuple[bytes, str]:
+        """
+        Downloads a file and returns its content with the SHA-256 hex digest,
+        hashed chunk by chunk while downloading.
+        """
+        buffer = bytearray()
+        digest = hashlib.sha256()
+        async for chunk in self.iter_chunks(object_url):
+            buffer += chunk
+            digest.update(chunk)
+        return bytes(buffer), digest.hexdigest()
@@ -1,28 +1,58 @@
 from fastapi import Depends, HTTPException, status
 from app.crud.user_crud import UserCRUD
-from app.models.user import User
-from app.schemas.user_schema import CheckNickname, UserRead, UserUpdate
+from app.schemas.user_schema import CheckNickname, UserRead, UserSnapshot, UserUpdate
+from app.services.published_portfolio_cache import (
+    PublishedPortfolioCache,
+    get_published_portfolio_cache,
+)
+from app.services.user_snapshot_cache import (
+    UserSnapshotCache,
+    get_user_snapshot_cache,
+)
 
 
 class UserService:
     def __init__(
         self,
         user_crud: UserCRUD = Depends(),
+        published_cache: PublishedPortfolioCache = Depends(
+            get_published_portfolio_cache
+        ),
+        user_snapshot_cache: UserSnapshotCache = Depends(get_user_snapshot_cache),
     ):
         self.user_crud = user_crud
+        self.published_cache = published_cache
+        self.user_snapshot_cache = user_snapshot_cache
 
     async def update_user(
-        self, *, current_user: User, user_update: UserUpdate
+        self, *, current_user: UserSnapshot, user_update: UserUpdate
     ) -> UserRead:
-        current_user.address = user_update.address
-        current_user.job = user_update.job
+        # current_user는 캐시된 스냅샷이므로 변경할 행은 다시 조회합니다.
+        user = await self.user_crud.get_user_by_id(user_id=current_user.id)
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="사용자를 찾을 수 없습니다.",
+            )
+        previous_nickname = user.nickname
+        user.address = user_update.address
+        user.job = user_update.job
         
-        if user_update.nickname and current_user.nickname != user_update.nickname:
+        if user_update.nickname and user.nickname != user_update.nickname:
             duplicate_user = await self.user_crud.get_user_by_nickname(nickname=user_update.nickname)
             if not duplicate_user:
-                current_user.nickname = user_update.nickname
+                user.nickname = user_update.nickname
+
+        # 프로필이 인증 캐시와 공개 포트폴리오에 포함되므로 커밋 후 캐시를 다시 만듭니다.
+        await self.user_crud.db.commit()
+        await self.user_snapshot_cache.refresh(
+            user.email, UserSnapshot.model_validate(user)
+        )
+        if previous_nickname != user.nickname:
+            await self.published_cache.invalidate(previous_nickname)
+        await self.published_cache.refresh(db=self.user_crud.db, user_id=user.id)
 
-        return UserRead.model_validate(current_user)
+        return UserRead.model_validate(user)
     
     
     async def check_nickname(self, *, nickname: str):
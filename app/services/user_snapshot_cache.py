@@ -0,0 +1,115 @@
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import redis.asyncio as aioredis
+from fastapi import Depends
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.session import get_redis_client
+from app.schemas.user_schema import UserSnapshot
+
+USER_SNAPSHOT_KEY_PREFIX = "user:snapshot:"
+
+# 토큰 subject -> (만료 시각(monotonic), 스냅샷). 프로세스 내에서 모든 요청이 공유합니다.
+_local_snapshots: "OrderedDict[str, Tuple[float, UserSnapshot]]" = OrderedDict()
+
+
+class UserSnapshotCache:
+    """
+    인증 요청마다 실행되던 사용자 조회를 줄이기 위한 2단 캐시 (프로세스 내 -> Redis).
+    키는 토큰 subject(이메일)이고, 값은 세션과 무관한 UserSnapshot 입니다.
+
+    사용자 정보를 바꾸면 커밋 후 refresh 로 Redis 값을 덮어쓰고, 조회 경로에서 채울 때는
+    이미 갱신된 값을 덮어쓰지 않도록 NX로 씁니다. 다른 인스턴스의 프로세스 내 캐시는
+    USER_SNAPSHOT_LOCAL_TTL_SECONDS 이내에 만료됩니다.
+    """
+
+    def __init__(self, redis_client: aioredis.Redis):
+        self.redis = redis_client
+
+    async def get(self, subject: str) -> Optional[UserSnapshot]:
+        if not settings.USER_SNAPSHOT_CACHE_ENABLED:
+            return None
+        snapshot = self._get_local(subject)
+        if snapshot is not None:
+            metrics.increment("user_snapshot_cache_total", outcome="local_hit")
+            return snapshot
+
+        try:
+            value = await self.redis.get(f"{USER_SNAPSHOT_KEY_PREFIX}{subject}")
+        except Exception as e:
+            print(f"Error reading user snapshot cache: {e}")
+            value = None
+        metrics.increment(
+            "user_snapshot_cache_total", outcome="hit" if value else "miss"
+        )
+        if not value:
+            return None
+        snapshot = UserSnapshot.model_validate_json(value)
+        self._set_local(subject, snapshot)
+        return snapshot
+
+    async def fill(self, subject: str, snapshot: UserSnapshot) -> None:
+        if await self._set(subject, snapshot, nx=True):
+            self._set_local(subject, snapshot)
+
+    async def refresh(self, subject: str, snapshot: UserSnapshot) -> None:
+        """사용자 정보 변경을 커밋한 뒤 호출해 캐시를 새 값으로 덮어씁니다."""
+        _local_snapshots.pop(subject, None)
+        if await self._set(subject, snapshot):
+            self._set_local(subject, snapshot)
+
+    async def invalidate(self, subject: Optional[str]) -> None:
+        if not subject:
+            return
+        _local_snapshots.pop(subject, None)
+        try:
+            await self.redis.delete(f"{USER_SNAPSHOT_KEY_PREFIX}{subject}")
+        except Exception as e:
+            print(f"Error invalidating user snapshot cache: {e}")
+
+    async def _set(
+        self, subject: str, snapshot: UserSnapshot, *, nx: bool = False
+    ) -> bool:
+        if not settings.USER_SNAPSHOT_CACHE_ENABLED:
+            return False
+        try:
+            return bool(
+                await self.redis.set(
+                    f"{USER_SNAPSHOT_KEY_PREFIX}{subject}",
+                    snapshot.model_dump_json(),
+                    ex=settings.USER_SNAPSHOT_CACHE_TTL_SECONDS,
+                    nx=nx,
+                )
+            )
+        except Exception as e:
+            print(f"Error writing user snapshot cache: {e}")
+            return False
+
+    def _get_local(self, subject: str) -> Optional[UserSnapshot]:
+        entry = _local_snapshots.get(subject)
+        if entry is None:
+            return None
+        expires_at, snapshot = entry
+        if expires_at <= time.monotonic():
+            _local_snapshots.pop(subject, None)
+            return None
+        _local_snapshots.move_to_end(subject)
+        return snapshot
+
+    def _set_local(self, subject: str, snapshot: UserSnapshot) -> None:
+        _local_snapshots[subject] = (
+            time.monotonic() + settings.USER_SNAPSHOT_LOCAL_TTL_SECONDS,
+            snapshot,
+        )
+        _local_snapshots.move_to_end(subject)
+        while len(_local_snapshots) > settings.USER_SNAPSHOT_LOCAL_MAX_SIZE:
+            _local_snapshots.popitem(last=False)
+
+
+async def get_user_snapshot_cache(
+    redis_client: aioredis.Redis = Depends(get_redis_client),
+) -> UserSnapshotCache:
+    return UserSnapshotCache(redis_client)
@@ -0,0 +1,44 @@
+"""
+무거운 SDK 미리 불러오기.
+
+LangChain/LangGraph/Gemini, Firebase, GCS 클라이언트는 app.main 을 가져올 때 불러오지 않고
+처음 사용하는 함수 안에서 import 합니다. 서버는 시작 직후 백그라운드 스레드에서 이 모듈들을
+미리 불러와, 콜드 스타트는 빠르게 하면서도 첫 요청이 import 비용을 치르지 않게 합니다.
+불러온 뒤에는 공유 클라이언트(app.services.clients)도 미리 만들어 둡니다.
+"""
+
+import asyncio
+import importlib
+import time
+
+from app.core.metrics import metrics
+from app.services.clients import create_clients
+
+# pypdf는 PDF 추출 프로세스 풀의 자식 프로세스에서만 사용하므로 제외합니다.
+WARMUP_MODULES = (
+    "langchain_core.prompts",
+    "langchain_core.output_parsers",
+    "langchain.output_parsers",
+    "langchain_google_genai",
+    "langgraph.graph",
+    "firebase_admin.messaging",
+    "google.cloud.storage",
+    "httpx",
+)
+
+
+def _import_modules() -> None:
+    for name in WARMUP_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError as e:
+            print(f"Error importing {name} during warmup: {e}")
+
+
+async def warm_up() -> None:
+    started = time.perf_counter()
+    await asyncio.to_thread(_import_modules)
+    create_clients()
+    elapsed = time.perf_counter() - started
+    metrics.observe("warmup_seconds", elapsed)
+    print(f"Warmup finished in {elapsed:.2f}s")
@@ -0,0 +1,197 @@
+"""
+작업 큐 워커 진입점.
+
+    python -m app.worker
+
+웹 워커는 작업을 등록만 하고, PDF 구조화, Q&A 생성, 임베딩 생성은 이 프로세스에서 실행됩니다.
+"""
+
+import asyncio
+import signal
+import uuid
+from typing import Dict, Tuple
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+from app.db.embedding_version import verify_embedding_version
+from app.db.schema_version import verify_schema_version
+from app.db.session import async_engine, close_redis_pool, redis_pool
+from app.services.clients import close_clients
+from app.services.embedding_gateway import embedding_model_tag, get_embedding_gateway
+from app.services.fcm_service import FCMService
+from app.schemas.job_schema import Job
+from app.services.job_progress import JobProgress
+from app.services.job_queue import DeadLetterHandler, JobHandler, JobQueue, JobWorker
+from app.services.llm_service import get_llm_service
+from app.services.pdf_result_cache import PdfResultCache
+from app.services.portfolio_service import (
+    CREATE_PORTFOLIO_FROM_PDF_JOB,
+    EMBED_PORTFOLIO_ITEMS_JOB,
+    PortfolioService,
+)
+from app.services.portfolio_version import PortfolioVersion
+from app.services.qna_batch_scheduler import QnABatchScheduler
+from app.services.qna_service import EMBED_QNAS_JOB, GENERATE_QNA_JOB, QnAService
+from app.services.rag_service import RAGService
+from app.services.storage_service import StorageService
+from app.services.warmup import warm_up
+
+
+async def build_handlers(
+    redis_client: aioredis.Redis,
+) -> Tuple[Dict[str, JobHandler], Dict[str, DeadLetterHandler]]:
+    """작업 이름별 핸들러와, 작업이 dead-letter로 옮겨질 때 호출할 최종 실패 핸들러를 만듭니다."""
+    job_queue = JobQueue(redis_client)
+    job_progress = JobProgress(redis_client)
+    portfolio_version = PortfolioVersion(redis_client)
+    llm_service = get_llm_service()
+    fcm_service = FCMService()
+    rag_service = RAGService(
+        storage_service=StorageService(),
+        embedding_gateway=get_embedding_gateway(),
+    )
+    # 백그라운드 작업은 자체 DB 세션을 열기 때문에 요청 범위 CRUD는 주입하지 않습니다.
+    portfolio_service = PortfolioService(
+        crud=None,
+        user_crud=None,
+        rag_service=rag_service,
+        llm_service=llm_service,
+        fcm_service=fcm_service,
+        job_queue=job_queue,
+        job_progress=job_progress,
+        pdf_result_cache=PdfResultCache(redis_client),
+        read_crud=None,
+        user_read_crud=None,
+        published_cache=None,
+        portfolio_version=portfolio_version,
+    )
+    qna_service = QnAService(
+        qna_crud=None,
+        llm_service=llm_service,
+        rag_service=rag_service,
+        portfolio_item_crud=None,
+        portfolio_crud=None,
+        fcm_service=fcm_service,
+        job_queue=job_queue,
+        job_progress=job_progress,
+        qna_batch_scheduler=QnABatchScheduler(llm_service=llm_service),
+        portfolio_version=portfolio_version,
+    )
+
+    async def create_portfolio_from_pdf(job: Job, is_last_attempt: bool) -> None:
+        await portfolio_service.create_portfolio_from_pdf_background(
+            portfolio_id=uuid.UUID(job.payload["portfolio_id"]),
+            user_id=uuid.UUID(job.payload["user_id"]),
+            file_path=job.payload["file_path"],
+            job_id=job.id,
+            is_last_attempt=is_last_attempt,
+        )
+
+    async def generate_qna(job: Job, is_last_attempt: bool) -> None:
+        await qna_service.generate_qna_for_all_portfolios_background(
+            portfolio_id=uuid.UUID(job.payload["portfolio_id"]),
+            user_id=uuid.UUID(job.payload["user_id"]),
+            job_id=job.id,
+            is_last_attempt=is_last_attempt,
+        )
+
+    async def embed_portfolio_items(job: Job, is_last_attempt: bool) -> None:
+        await portfolio_service.embed_portfolio_items_background(
+            portfolio_id=uuid.UUID(job.payload["portfolio_id"]),
+            user_id=uuid.UUID(job.payload["user_id"]),
+            job_id=job.id,
+            is_last_attempt=is_last_attempt,
+        )
+
+    async def embed_qnas(job: Job, is_last_attempt: bool) -> None:
+        await qna_service.embed_qnas_background(
+            qna_ids=[uuid.UUID(qna_id) for qna_id in job.payload["qna_ids"]],
+            user_id=uuid.UUID(job.payload["user_id"]),
+            job_id=job.id,
+            is_last_attempt=is_last_attempt,
+        )
+
+    async def create_portfolio_from_pdf_dead(job: Job) -> None:
+        await portfolio_service.fail_create_portfolio_from_pdf(
+            portfolio_id=uuid.UUID(job.payload["portfolio_id"]),
+            user_id=uuid.UUID(job.payload["user_id"]),
+            job_id=job.id,
+            error=job.last_error,
+        )
+
+    async def generate_qna_dead(job: Job) -> None:
+        await qna_service.fail_generate_qna(
+            portfolio_id=uuid.UUID(job.payload["portfolio_id"]),
+            user_id=uuid.UUID(job.payload["user_id"]),
+            job_id=job.id,
+            error=job.last_error,
+        )
+
+    async def embed_portfolio_items_dead(job: Job) -> None:
+        await portfolio_service.fail_embed_portfolio_items(
+            portfolio_id=uuid.UUID(job.payload["portfolio_id"]),
+            user_id=uuid.UUID(job.payload["user_id"]),
+            job_id=job.id,
+            error=job.last_error,
+        )
+
+    async def embed_qnas_dead(job: Job) -> None:
+        await qna_service.fail_embed_qnas(
+            qna_ids=[uuid.UUID(qna_id) for qna_id in job.payload["qna_ids"]],
+            user_id=uuid.UUID(job.payload["user_id"]),
+            job_id=job.id,
+            error=job.last_error,
+        )
+
+    handlers = {
+        CREATE_PORTFOLIO_FROM_PDF_JOB: create_portfolio_from_pdf,
+        GENERATE_QNA_JOB: generate_qna,
+        EMBED_PORTFOLIO_ITEMS_JOB: embed_portfolio_items,
+        EMBED_QNAS_JOB: embed_qnas,
+    }
+    dead_letter_handlers = {
+        CREATE_PORTFOLIO_FROM_PDF_JOB: create_portfolio_from_pdf_dead,
+        GENERATE_QNA_JOB: generate_qna_dead,
+        EMBED_PORTFOLIO_ITEMS_JOB: embed_portfolio_items_dead,
+        EMBED_QNAS_JOB: embed_qnas_dead,
+    }
+    return handlers, dead_letter_handlers
+
+
+async def run_worker() -> None:
+    if settings.DATABASE_SCHEMA_CHECK_ENABLED:
+        await verify_schema_version(async_engine)
+        await verify_embedding_version(async_engine, embedding_model_tag())
+    # 워커는 작업을 받기 전에 무거운 SDK를 불러오고 공유 클라이언트를 만듭니다.
+    if settings.WARMUP_ENABLED:
+        await warm_up()
+
+    redis_client = aioredis.Redis(connection_pool=redis_pool)
+    job_queue = JobQueue(redis_client)
+    handlers, dead_letter_handlers = await build_handlers(redis_client)
+    worker = JobWorker(
+        job_queue,
+        handlers,
+        dead_letter_handlers=dead_letter_handlers,
+        concurrency=settings.JOB_WORKER_CONCURRENCY,
+    )
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    print(
+        f"Job worker {worker.worker_id} started "
+        f"(concurrency={settings.JOB_WORKER_CONCURRENCY})"
+    )
+    try:
+        await worker.run()
+    finally:
+        await close_clients()
+        await close_redis_pool()
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_worker())
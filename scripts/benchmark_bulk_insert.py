@@ -0,0 +1,163 @@
+"""
+대량 적재 벤치마크: 멀티 로우 INSERT ... VALUES vs COPY + INSERT ... SELECT.
+
+DATABASE_URL 의 PostgreSQL(pgvector)에 임시 사용자/포트폴리오를 만들고 Q&A와
+포트폴리오 항목(768차원 임베딩 포함)을 적재한 뒤, 모든 변경은 롤백합니다.
+
+    python -m scripts.benchmark_bulk_insert --rows 1000 10000 100000
+
+VALUES 경로는 asyncpg 바인드 파라미터 한도(32767개)에 맞춰 여러 문장으로 나눠 실행합니다.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from typing import Any, Callable, Dict, List
+
+from sqlalchemy import Table, insert
+
+from app.core.config import settings
+from app.db.bulk_copy import copy_insert
+from app.db.session import AsyncSessionLocal, async_engine
+from app.models.portfolio import Portfolio, PortfolioSourceType, PortfolioStatus
+from app.models.portfolio_item import (
+    PortfolioItem,
+    PortfolioItemStatus,
+    PortfolioItemType,
+)
+from app.models.qna import QnA, QnAStatus
+from app.models.user import User
+
+# asyncpg가 한 문장에 허용하는 최대 바인드 파라미터 수
+MAX_BIND_PARAMS = 32767
+
+
+def random_embedding() -> List[float]:
+    return [random.random() for _ in range(settings.EMBEDDING_DIMENSION)]
+
+
+def qna_rows(
+    count: int, *, user_id: uuid.UUID, item_id: uuid.UUID
+) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": uuid.uuid4(),
+            "question": f"질문 {i}: 이 프로젝트에서 맡은 역할은 무엇인가요?",
+            "answer": f"답변 {i}: 결제 시스템 마이그레이션과 API 성능 개선을 담당했습니다.",
+            "portfolio_item_id": item_id,
+            "user_id": user_id,
+            "status": QnAStatus.PENDING,
+            "embedding": random_embedding(),
+        }
+        for i in range(count)
+    ]
+
+
+def portfolio_item_rows(count: int, *, portfolio_id: uuid.UUID) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": uuid.uuid4(),
+            "portfolio_id": portfolio_id,
+            "type": PortfolioItemType.PROJECT,
+            "status": PortfolioItemStatus.PENDING,
+            "topic": f"프로젝트 {i}",
+            "content": "대규모 트래픽 환경에서 주문 API의 응답 시간을 줄였습니다.",
+            "tech_stack": ["Python", "FastAPI", "PostgreSQL"],
+            "embedding": random_embedding(),
+        }
+        for i in range(count)
+    ]
+
+
+async def values_insert(
+    db, target: Table, rows: List[Dict[str, Any]], columns: List[str]
+) -> int:
+    chunk_size = MAX_BIND_PARAMS // len(columns)
+    inserted = 0
+    for start in range(0, len(rows), chunk_size):
+        chunk = [
+            {name: row.get(name) for name in columns}
+            for row in rows[start : start + chunk_size]
+        ]
+        result = await db.execute(insert(target).values(chunk))
+        inserted += result.rowcount
+    return inserted
+
+
+async def measure(
+    db, method: Callable, target: Table, rows: List[Dict[str, Any]], columns: List[str]
+) -> float:
+    savepoint = await db.begin_nested()
+    started = time.perf_counter()
+    inserted = await method(db, target, rows, columns)
+    elapsed = time.perf_counter() - started
+    await savepoint.rollback()
+    assert inserted == len(rows)
+    return len(rows) / elapsed
+
+
+async def run(row_counts: List[int]) -> None:
+    async with AsyncSessionLocal() as db:
+        user = User(email=f"bench-{uuid.uuid4().hex}@example.com")
+        db.add(user)
+        await db.flush()
+        portfolio = Portfolio(
+            user_id=user.id,
+            source_type=PortfolioSourceType.TEXT,
+            status=PortfolioStatus.CONFIRMED,
+        )
+        db.add(portfolio)
+        await db.flush()
+        item = PortfolioItem(
+            portfolio_id=portfolio.id,
+            type=PortfolioItemType.PROJECT,
+            content="benchmark",
+        )
+        db.add(item)
+        await db.flush()
+
+        tables = [
+            (
+                "qnas",
+                QnA.__table__,
+                lambda n: qna_rows(n, user_id=user.id, item_id=item.id),
+            ),
+            (
+                "portfolio_items",
+                PortfolioItem.__table__,
+                lambda n: portfolio_item_rows(n, portfolio_id=portfolio.id),
+            ),
+        ]
+
+        print(
+            f"{'table':<18}{'rows':>9}{'values(rows/s)':>17}{'copy(rows/s)':>15}{'speedup':>9}"
+        )
+        try:
+            for name, target, build_rows in tables:
+                for count in row_counts:
+                    rows = build_rows(count)
+                    columns = list(rows[0].keys())
+                    values_rate = await measure(
+                        db, values_insert, target, rows, columns
+                    )
+                    copy_rate = await measure(db, copy_insert, target, rows, columns)
+                    print(
+                        f"{name:<18}{count:>9}{values_rate:>17.0f}"
+                        f"{copy_rate:>15.0f}{copy_rate / values_rate:>8.1f}x"
+                    )
+        finally:
+            await db.rollback()
+    await async_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+    asyncio.run(run(args.rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+요청마다 FastAPI가 서비스 의존성 트리를 만드는 시간 벤치마크.
+
+엔드포인트가 사용하는 서비스 클래스를 Depends()로 받는 가짜 라우트를 만들고,
+FastAPI의 solve_dependencies 로 실제 요청과 같은 방식으로 의존성을 해석합니다.
+(DB 세션/Redis 클라이언트는 만들기만 하고 연결하지 않으므로 DB/Redis 없이 실행됩니다)
+
+    python -m scripts.benchmark_dependencies --iterations 200
+
+첫 해석(임포트, 공유 클라이언트 생성)은 측정에서 제외하고 따로 출력합니다.
+"""
+
+import argparse
+import asyncio
+import time
+from contextlib import AsyncExitStack
+from typing import Any, Callable, Dict
+
+from fastapi import Depends
+from fastapi.dependencies.utils import get_dependant, solve_dependencies
+from starlette.requests import Request
+
+from app.services.chat_message_service import ChatMessageService
+from app.services.fcm_service import FCMService
+from app.services.llm_service import get_llm_service
+from app.services.portfolio_item_service import PortfolioItemService
+from app.services.portfolio_service import PortfolioService
+from app.services.qna_service import QnAService
+from app.services.rag_service import RAGService
+from app.services.storage_service import StorageService
+
+
+def probe(dependency: Any) -> Callable:
+    async def endpoint(service: Any = Depends(dependency)) -> None:
+        return None
+
+    return endpoint
+
+
+# 엔드포인트가 Depends()로 받는 것과 같은 의존성
+PROBES: Dict[str, Any] = {
+    "StorageService": StorageService,
+    "FCMService": FCMService,
+    "LLMService": get_llm_service,
+    "RAGService": RAGService,
+    "PortfolioItemService": PortfolioItemService,
+    "PortfolioService": PortfolioService,
+    "QnAService": QnAService,
+    "ChatMessageService": ChatMessageService,
+}
+
+
+def make_request(stack: AsyncExitStack) -> Request:
+    # 최신 FastAPI는 요청 scope 의 exit stack 으로 yield 의존성을 정리합니다.
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [],
+            "query_string": b"",
+            "fastapi_inner_astack": stack,
+            "fastapi_function_astack": stack,
+        }
+    )
+
+
+async def resolve_once(dependant) -> None:
+    async with AsyncExitStack() as stack:
+        solved = await solve_dependencies(
+            request=make_request(stack),
+            dependant=dependant,
+            async_exit_stack=stack,
+            embed_body_fields=False,
+        )
+        assert not solved.errors, solved.errors
+
+
+async def run(iterations: int) -> None:
+    print(f"{'dependency tree':<24}{'first(ms)':>12}{'per request(us)':>18}")
+    for name, dependency in PROBES.items():
+        dependant = get_dependant(path="/", call=probe(dependency))
+
+        started = time.perf_counter()
+        await resolve_once(dependant)
+        first_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        for _ in range(iterations):
+            await resolve_once(dependant)
+        per_request_us = (time.perf_counter() - started) * 1e6 / iterations
+        print(f"{name:<24}{first_ms:>12.1f}{per_request_us:>18.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(run(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+임베딩 백엔드 지연 시간/처리량 벤치마크.
+
+    # Gemini 임베딩과 로컬 ONNX 모델 비교
+    python -m scripts.benchmark_embeddings --remote --onnx ./models/multilingual-e5-base
+
+    # 네트워크 없이 파이프라인만 확인 (작은 합성 ONNX 모델 생성)
+    python -m scripts.benchmark_embeddings --synthetic
+
+- 단건 지연: 채팅 한 턴처럼 질의 1개를 순차적으로 임베딩한 p50/p95
+- 처리량: --batch 크기의 문서 묶음을 반복 임베딩한 초당 텍스트 수
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from typing import List, Tuple
+
+from langchain_core.embeddings import Embeddings
+
+from app.core.config import settings
+
+QUERIES = [
+    "Redis를 도입해서 응답 속도를 얼마나 개선했나요?",
+    "가장 어려웠던 프로젝트와 해결 과정을 알려주세요.",
+    "What was your role in the payment system migration?",
+    "FastAPI와 SQLAlchemy를 선택한 이유가 있나요?",
+]
+DOCUMENT = (
+    "대규모 트래픽 환경에서 주문 API의 응답 시간을 줄이기 위해 Redis 캐시와 "
+    "비동기 작업 큐를 도입했고, p95 지연 시간을 800ms에서 120ms로 단축했습니다. "
+)
+
+
+def build_synthetic_model(
+    model_dir: str, hidden_size: int = settings.EMBEDDING_DIMENSION
+) -> None:
+    """단어 단위 토크나이저와 임베딩 조회 + 선형층으로 된 작은 ONNX 모델을 만듭니다."""
+    import numpy as np
+    import onnx
+    from onnx import TensorProto, helper, numpy_helper
+    from tokenizers import Tokenizer, models, pre_tokenizers
+
+    vocab = {"[PAD]": 0, "[UNK]": 1}
+    for text in QUERIES + [DOCUMENT]:
+        for word in text.split():
+            vocab.setdefault(word, len(vocab))
+    tokenizer = Tokenizer(models.WordLevel(vocab=vocab, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = pre_tokenizers.Whitespace()
+    tokenizer.save(os.path.join(model_dir, "tokenizer.json"))
+
+    rng = np.random.default_rng(0)
+    table = numpy_helper.from_array(
+        rng.standard_normal((len(vocab), hidden_size)).astype(np.float32), "table"
+    )
+    weight = numpy_helper.from_array(
+        rng.standard_normal((hidden_size, hidden_size)).astype(np.float32), "weight"
+    )
+    graph = helper.make_graph(
+        [
+            helper.make_node("Gather", ["table", "input_ids"], ["embedded"]),
+            helper.make_node("MatMul", ["embedded", "weight"], ["last_hidden_state"]),
+        ],
+        "synthetic_encoder",
+        [
+            helper.make_tensor_value_info("input_ids", TensorProto.INT64, ["b", "t"]),
+            helper.make_tensor_value_info(
+                "attention_mask", TensorProto.INT64, ["b", "t"]
+            ),
+        ],
+        [
+            helper.make_tensor_value_info(
+                "last_hidden_state", TensorProto.FLOAT, ["b", "t", hidden_size]
+            )
+        ],
+        initializer=[table, weight],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 17)])
+    # 설치된 onnxruntime이 읽을 수 있도록 IR 버전을 낮춰 저장합니다.
+    model.ir_version = 9
+    onnx.save(model, os.path.join(model_dir, "model.onnx"))
+
+
+async def measure(
+    model: Embeddings, *, queries: int, batch: int, rounds: int
+) -> Tuple[List[float], float]:
+    dimension = settings.EMBEDDING_DIMENSION
+    # 첫 호출은 모델 로드/연결 수립을 포함하므로 제외합니다.
+    await model.aembed_documents(texts=QUERIES[:1], output_dimensionality=dimension)
+
+    latencies = []
+    for i in range(queries):
+        started = time.perf_counter()
+        await model.aembed_documents(
+            texts=[QUERIES[i % len(QUERIES)]], output_dimensionality=dimension
+        )
+        latencies.append(time.perf_counter() - started)
+
+    documents = [f"{DOCUMENT} #{i}" for i in range(batch)]
+    started = time.perf_counter()
+    for _ in range(rounds):
+        vectors = await model.aembed_documents(
+            texts=documents, output_dimensionality=dimension
+        )
+        assert len(vectors) == batch and len(vectors[0]) == dimension
+    throughput = batch * rounds / (time.perf_counter() - started)
+    return latencies, throughput
+
+
+def report(name: str, latencies: List[float], throughput: float) -> None:
+    latencies = sorted(latencies)
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(
+        f"{name:<32}{statistics.median(latencies) * 1000:>10.1f}"
+        f"{p95 * 1000:>10.1f}{throughput:>14.1f}"
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+    from app.services.onnx_embeddings import OnnxEmbeddings
+
+    print(f"{'backend':<32}{'p50(ms)':>10}{'p95(ms)':>10}{'texts/sec':>14}")
+    backends: List[Tuple[str, Embeddings]] = []
+    if args.remote:
+        backends.append(
+            (
+                f"remote:{settings.EMBEDDING_MODEL}",
+                GoogleGenerativeAIEmbeddings(
+                    model=settings.EMBEDDING_MODEL,
+                    google_api_key=settings.GEMINI_API_KEY,
+                ),
+            )
+        )
+    for model_dir in args.onnx:
+        backends.append((f"onnx:{os.path.basename(model_dir)}", OnnxEmbeddings(model_dir)))
+
+    for name, model in backends:
+        try:
+            latencies, throughput = await measure(
+                model, queries=args.queries, batch=args.batch, rounds=args.rounds
+            )
+            report(name, latencies, throughput)
+        finally:
+            close = getattr(model, "close", None)
+            if callable(close):
+                close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--remote", action="store_true", help="Gemini 임베딩 포함")
+    parser.add_argument("--onnx", action="append", default=[], help="ONNX 모델 디렉터리")
+    parser.add_argument("--synthetic", action="store_true", help="합성 ONNX 모델 포함")
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--batch", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as synthetic_dir:
+        if args.synthetic:
+            build_synthetic_model(synthetic_dir)
+            args.onnx.append(synthetic_dir)
+        if not args.remote and not args.onnx:
+            parser.error("--remote, --onnx 또는 --synthetic 중 하나 이상이 필요합니다.")
+        asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+app.main import 시간 벤치마크 (python -X importtime 기반).
+
+새 프로세스에서 `import app.main` 을 여러 번 실행해 누적 import 시간의 중앙값과
+패키지별 비용 상위 목록, warmup 에서 미뤄 불러오는 모듈의 비용을 출력합니다.
+
+    python -m scripts.benchmark_import_time --runs 5 --budget-ms 2000
+
+다음 경우 종료 코드 1로 실패합니다. (CI 회귀 검사용)
+- app.main import 시간 중앙값이 --budget-ms 를 넘는 경우
+- LAZY_MODULES 중 하나라도 app.main import 시점에 불러와진 경우
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Set, Tuple
+
+from app.services.warmup import WARMUP_MODULES
+
+# 첫 사용 또는 warmup 때만 불러와야 하는 모듈
+LAZY_MODULES = (
+    "langchain",
+    "langchain_core",
+    "langchain_community",
+    "langchain_google_genai",
+    "langgraph",
+    "firebase_admin",
+    "google.cloud.storage",
+    "pypdf",
+    "alembic",
+    "httpx",
+)
+IMPORT_TIME_BUDGET_MS = 2000
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def run_importtime() -> List[Tuple[int, int, str]]:
+    """(누적 us, 깊이, 모듈명) 목록을 import 순서대로 반환합니다."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import app.main failed:\n{result.stderr[-2000:]}")
+    rows = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            rows.append((int(match.group(2)), len(match.group(3)) // 2, match.group(4)))
+    return rows
+
+
+def package_costs(rows: List[Tuple[int, int, str]]) -> Dict[str, int]:
+    """최상위 패키지별 누적 시간(us). 다른 패키지가 불러온 시점의 누적값만 더합니다."""
+    costs: Dict[str, int] = defaultdict(int)
+    # importtime은 자식 모듈을 부모보다 먼저 출력하므로 뒤에서부터 부모를 추적합니다.
+    parents: List[Tuple[int, str]] = []
+    for cumulative, depth, name in reversed(rows):
+        while parents and parents[-1][0] >= depth:
+            parents.pop()
+        root = name.split(".")[0]
+        parent_root = parents[-1][1].split(".")[0] if parents else None
+        if parent_root != root:
+            costs[root] += cumulative
+        parents.append((depth, name))
+    return costs
+
+
+def eager_lazy_modules(rows: List[Tuple[int, int, str]]) -> Set[str]:
+    imported = {name for _, _, name in rows}
+    return {
+        module
+        for module in LAZY_MODULES
+        if any(name == module or name.startswith(module + ".") for name in imported)
+    }
+
+
+def measure_warmup_ms() -> float:
+    code = (
+        "import importlib, time, app.main\n"
+        "started = time.perf_counter()\n"
+        f"for name in {WARMUP_MODULES!r}:\n"
+        "    importlib.import_module(name)\n"
+        "print((time.perf_counter() - started) * 1000)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_TIME_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    totals = []
+    rows: List[Tuple[int, int, str]] = []
+    for _ in range(args.runs):
+        rows = run_importtime()
+        totals.append(next(c for c, _, name in rows if name == "app.main") / 1000)
+    median_ms = statistics.median(totals)
+
+    print(f"import app.main: median {median_ms:.0f} ms over {args.runs} runs")
+    print(f"  runs: {', '.join(f'{t:.0f}' for t in totals)} ms")
+    print(f"\n{'package':<32}{'cumulative(ms)':>16}")
+    costs = package_costs(rows)
+    for name, cost in sorted(costs.items(), key=lambda x: -x[1])[: args.top]:
+        if name != "app":
+            print(f"{name:<32}{cost / 1000:>16.1f}")
+    print(f"\ndeferred to warmup: {measure_warmup_ms():.0f} ms")
+
+    failures = []
+    if median_ms > args.budget_ms:
+        failures.append(f"median {median_ms:.0f} ms > budget {args.budget_ms:.0f} ms")
+    eager = eager_lazy_modules(rows)
+    if eager:
+        failures.append(f"eagerly imported: {', '.join(sorted(eager))}")
+    if failures:
+        print("\nFAIL: " + "; ".join(failures))
+        sys.exit(1)
+    print("\nOK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+오프라인 수집 파이프라인 벤치마크 (다운로드 + PDF 텍스트 추출).
+
+로컬 파일 시스템 저장소 백엔드에 합성 PDF를 올린 뒤, RAGService가 사용하는
+스트리밍 다운로드와 프로세스 풀 추출 경로를 그대로 실행합니다.
+
+    python -m scripts.benchmark_ingestion
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+
+from app.core.config import settings
+from app.services.pdf_extractor import iter_pdf_pages, shutdown_pdf_executor
+from app.services.storage_service import StorageService, close_storage_backend
+from scripts.benchmark_pdf_extraction import SYNTHETIC_CORPUS, build_pdf
+
+
+async def run(repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        settings.STORAGE_BACKEND = "local"
+        settings.LOCAL_STORAGE_PATH = root
+        storage_service = StorageService()
+
+        await storage_service.backend.upload_bytes("warmup.pdf", build_pdf(1))
+        async for _ in iter_pdf_pages(
+            await storage_service.download_as_bytes("local://warmup.pdf")
+        ):
+            pass
+
+        print(
+            f"{'document':<24}{'size(MB)':>9}{'download(s)':>13}"
+            f"{'extract(s)':>12}{'first page(s)':>15}"
+        )
+        for pages, padding in SYNTHETIC_CORPUS:
+            object_url = await storage_service.backend.upload_bytes(
+                f"bench/{pages}.pdf", build_pdf(pages, padding)
+            )
+            downloads, extracts, first_pages = [], [], []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                data = await storage_service.download_as_bytes(object_url)
+                downloaded = time.perf_counter()
+                first_page_at = None
+                async for _ in iter_pdf_pages(data):
+                    if first_page_at is None:
+                        first_page_at = time.perf_counter()
+                finished = time.perf_counter()
+                downloads.append(downloaded - started)
+                extracts.append(finished - downloaded)
+                first_pages.append((first_page_at or finished) - downloaded)
+            print(
+                f"{f'synthetic-{pages}p':<24}{len(data) / 1024 / 1024:>9.1f}"
+                f"{statistics.median(downloads):>13.3f}"
+                f"{statistics.median(extracts):>12.3f}"
+                f"{statistics.median(first_pages):>15.3f}"
+            )
+        await close_storage_backend()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    try:
+        asyncio.run(run(args.repeat))
+    finally:
+        shutdown_pdf_executor()
+
+
+if __name__ == "__main__":
+    main()
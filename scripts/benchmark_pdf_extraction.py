@@ -0,0 +1,166 @@
+"""
+PDF 텍스트 추출 벤치마크.
+
+기존 방식(임시 파일 + PyPDFLoader + 기본 스레드 풀)과 메모리 버퍼 + 프로세스 풀 방식을
+여러 크기의 PDF로 비교합니다. 추출 중 이벤트 루프 지연(최대/평균)도 함께 측정합니다.
+
+    python -m scripts.benchmark_pdf_extraction
+    python -m scripts.benchmark_pdf_extraction --corpus ./pdfs --repeat 3
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, List, Tuple
+
+from app.services.pdf_extractor import extract_pdf_pages, shutdown_pdf_executor
+
+# (페이지 수, 패딩 바이트) - 패딩은 이미지처럼 파싱과 무관한 용량을 흉내냅니다.
+SYNTHETIC_CORPUS: Tuple[Tuple[int, int], ...] = (
+    (1, 0),
+    (10, 0),
+    (50, 1 * 1024 * 1024),
+    (200, 5 * 1024 * 1024),
+    (400, 25 * 1024 * 1024),
+)
+
+
+def build_pdf(page_count: int, padding_bytes: int = 0, lines_per_page: int = 40) -> bytes:
+    """텍스트 페이지로 이루어진 최소한의 PDF를 생성합니다."""
+    objects: List[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",  # Pages - 페이지 객체 번호가 정해진 뒤 채웁니다.
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_refs = []
+    for page_no in range(page_count):
+        lines = [
+            f"Page {page_no + 1} line {line}: FastAPI PostgreSQL pgvector Redis LangChain"
+            for line in range(lines_per_page)
+        ]
+        text_ops = "\n".join(
+            f"BT /F1 9 Tf 40 {800 - i * 18} Td ({line}) Tj ET"
+            for i, line in enumerate(lines)
+        ).encode()
+        objects.append(
+            b"<< /Length %d >>\nstream\n" % len(text_ops) + text_ops + b"\nendstream"
+        )
+        content_ref = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_ref
+        )
+        page_refs.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % ref for ref in page_refs),
+        page_count,
+    )
+    if padding_bytes:
+        padding = os.urandom(padding_bytes)
+        objects.append(
+            b"<< /Length %d >>\nstream\n" % len(padding) + padding + b"\nendstream"
+        )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref_offset = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref_offset,
+    )
+    return bytes(out)
+
+
+async def extract_legacy(data: bytes) -> List[str]:
+    from langchain_community.document_loaders import PyPDFLoader
+
+    tmp_path = ""
+    try:
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmpfile:
+            tmpfile.write(data)
+            tmp_path = tmpfile.name
+
+        loader = PyPDFLoader(tmp_path)
+        loop = asyncio.get_running_loop()
+        documents = await loop.run_in_executor(None, loader.load)
+        return [doc.page_content for doc in documents]
+    finally:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+async def measure(
+    extract: Callable[[bytes], Awaitable[List[str]]], data: bytes
+) -> Tuple[float, float, float, int]:
+    """(소요 시간, 최대 루프 지연, 평균 루프 지연, 페이지 수)를 반환합니다."""
+    interval = 0.005
+    lags: List[float] = []
+    done = asyncio.Event()
+
+    async def probe():
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(interval)
+            lags.append(time.perf_counter() - started - interval)
+
+    probe_task = asyncio.create_task(probe())
+    started = time.perf_counter()
+    pages = await extract(data)
+    elapsed = time.perf_counter() - started
+    done.set()
+    await probe_task
+    return elapsed, max(lags, default=0.0), statistics.fmean(lags or [0.0]), len(pages)
+
+
+async def run(corpus: List[Tuple[str, bytes]], repeat: int) -> None:
+    # 프로세스 풀 기동 비용은 측정에서 제외합니다.
+    await extract_pdf_pages(build_pdf(1))
+
+    print(
+        f"{'document':<28}{'size(MB)':>9}{'pages':>7}  {'method':<8}"
+        f"{'time(s)':>9}{'max lag(ms)':>13}{'avg lag(ms)':>13}"
+    )
+    for name, data in corpus:
+        for method, extract in (("legacy", extract_legacy), ("pool", extract_pdf_pages)):
+            results = [await measure(extract, data) for _ in range(repeat)]
+            elapsed = statistics.median(r[0] for r in results)
+            max_lag = max(r[1] for r in results)
+            avg_lag = statistics.fmean(r[2] for r in results)
+            print(
+                f"{name:<28}{len(data) / 1024 / 1024:>9.1f}{results[0][3]:>7}  "
+                f"{method:<8}{elapsed:>9.3f}{max_lag * 1000:>13.1f}{avg_lag * 1000:>13.2f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", type=Path, help="PDF 파일이 들어있는 디렉터리")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.corpus:
+        corpus = [(path.name, path.read_bytes()) for path in sorted(args.corpus.glob("*.pdf"))]
+    else:
+        corpus = [
+            (f"synthetic-{pages}p", build_pdf(pages, padding))
+            for pages, padding in SYNTHETIC_CORPUS
+        ]
+
+    try:
+        asyncio.run(run(corpus, args.repeat))
+    finally:
+        shutdown_pdf_executor()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+응답 직렬화/압축 벤치마크: 표준 JSONResponse vs ORJSONResponse, 무압축 vs gzip(brotli).
+
+가장 큰 응답인 포트폴리오 상세(PortfolioRead)와 Q&A 목록(List[QnARead])을 합성 데이터로 만들고,
+FastAPI가 response_model 로 하는 것과 같이 pydantic으로 JSON 호환 객체를 만든 뒤(encode)
+응답 클래스로 본문을 렌더링(render)하는 CPU 시간과 전송 바이트를 측정합니다.
+
+    python -m scripts.benchmark_serialization --items 20 100 --qnas 100 1000
+
+brotli 패키지가 설치되어 있으면 brotli 압축 크기도 함께 출력합니다.
+"""
+
+import argparse
+import gzip
+import random
+import time
+import uuid
+from datetime import date, datetime
+from typing import Any, Callable, List
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import TypeAdapter
+
+from app.core.config import settings
+from app.models.portfolio import PortfolioStatus
+from app.models.portfolio_item import PortfolioItemType
+from app.models.qna import QnAStatus
+from app.schemas.portfolio_item_schema import PortfolioItemRead
+from app.schemas.portfolio_schema import PortfolioRead
+from app.schemas.qna_schema import QnARead
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+WORDS = (
+    "주문 결제 정산 검색 추천 알림 인증 배포 모니터링 캐시 인덱스 쿼리 트래픽 장애 "
+    "마이그레이션 리팩터링 비동기 큐 파이프라인 API 서버 클라이언트 데이터베이스 "
+    "Python FastAPI PostgreSQL Redis Kafka Kubernetes GCP 응답 시간 처리량 비용 개선 "
+    "설계 도입 구축 운영 자동화 테스트 협업 리뷰 문서화 담당 주도 분석 최적화"
+).split()
+
+
+def random_text(rng: random.Random, word_count: int) -> str:
+    # 반복 문단은 실제보다 지나치게 잘 압축되므로 단어와 수치를 섞어 만듭니다.
+    words = [
+        f"{rng.randint(1, 999)}%" if rng.random() < 0.05 else rng.choice(WORDS)
+        for _ in range(word_count)
+    ]
+    return " ".join(words) + "."
+
+
+def build_portfolio(rng: random.Random, item_count: int) -> PortfolioRead:
+    portfolio_id = uuid.uuid4()
+    now = datetime.now()
+    return PortfolioRead(
+        id=portfolio_id,
+        user_id=uuid.uuid4(),
+        status=PortfolioStatus.PUBLISHED,
+        source_type="PDF",
+        name="백엔드 개발자 포트폴리오",
+        created_at=now,
+        items=[
+            PortfolioItemRead(
+                id=uuid.uuid4(),
+                portfolio_id=portfolio_id,
+                type=PortfolioItemType.PROJECT,
+                topic=f"프로젝트 {i}",
+                start_date=date(2023, 1, 1),
+                end_date=date(2024, 6, 30),
+                content=random_text(rng, 300),
+                tech_stack=["Python", "FastAPI", "PostgreSQL", "Redis", "GCP"],
+                created_at=now,
+            )
+            for i in range(item_count)
+        ],
+    )
+
+
+def build_qnas(rng: random.Random, qna_count: int) -> List[QnARead]:
+    item_id = uuid.uuid4()
+    return [
+        QnARead(
+            id=uuid.uuid4(),
+            question=f"질문 {i}: 이 프로젝트에서 성능을 어떻게 개선했나요?",
+            answer=random_text(rng, 80),
+            status=QnAStatus.CONFIRMED,
+            portfolio_item_id=item_id,
+        )
+        for i in range(qna_count)
+    ]
+
+
+def cpu_ms(fn: Callable[[], Any], repeat: int) -> float:
+    started = time.process_time()
+    for _ in range(repeat):
+        fn()
+    return (time.process_time() - started) * 1000 / repeat
+
+
+def report(name: str, adapter: TypeAdapter, value: Any, repeat: int) -> None:
+    encode = lambda: adapter.dump_python(value, mode="json")
+    content = encode()
+    body = ORJSONResponse(content).body
+    assert body == JSONResponse(content).body
+
+    encode_ms = cpu_ms(encode, repeat)
+    json_ms = cpu_ms(lambda: JSONResponse(content).body, repeat)
+    orjson_ms = cpu_ms(lambda: ORJSONResponse(content).body, repeat)
+    gzip_ms = cpu_ms(
+        lambda: gzip.compress(body, compresslevel=settings.GZIP_COMPRESS_LEVEL), repeat
+    )
+    gzip_bytes = len(gzip.compress(body, compresslevel=settings.GZIP_COMPRESS_LEVEL))
+    brotli_bytes = len(brotli.compress(body, quality=5)) if brotli else None
+
+    print(
+        f"{name:<22}{encode_ms:>10.2f}{json_ms:>12.2f}{orjson_ms:>12.2f}"
+        f"{json_ms / orjson_ms:>8.1f}x{gzip_ms:>10.2f}"
+        f"{len(body):>12}{gzip_bytes:>11}{gzip_bytes / len(body):>7.0%}"
+        f"{brotli_bytes if brotli_bytes is not None else '-':>11}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, nargs="+", default=[20, 100])
+    parser.add_argument("--qnas", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    print(
+        f"{'payload':<22}{'encode(ms)':>10}{'json(ms)':>12}{'orjson(ms)':>12}"
+        f"{'speedup':>9}{'gzip(ms)':>10}{'raw(B)':>12}{'gzip(B)':>11}{'ratio':>7}"
+        f"{'brotli(B)':>11}"
+    )
+    rng = random.Random(42)
+    portfolio_adapter = TypeAdapter(PortfolioRead)
+    for count in args.items:
+        report(
+            f"PortfolioRead x{count}",
+            portfolio_adapter,
+            build_portfolio(rng, count),
+            args.repeat,
+        )
+    qna_adapter = TypeAdapter(List[QnARead])
+    for count in args.qnas:
+        report(
+            f"List[QnARead] x{count}", qna_adapter, build_qnas(rng, count), args.repeat
+        )
+
+
+if __name__ == "__main__":
+    main()
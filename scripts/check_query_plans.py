@@ -0,0 +1,365 @@
+"""
+CRUD 조회 실행 계획 회귀 검사.
+
+DATABASE_URL 의 PostgreSQL(alembic upgrade head 적용)에 사용자/포트폴리오/항목/Q&A/채팅 데이터를
+채우고 ANALYZE 한 뒤, 주요 CRUD 메서드를 실제로 호출해 실행된 SQL을 그대로 EXPLAIN 합니다.
+각 문장은 바인드 값으로 계획하는 custom plan 과, asyncpg 준비된 문장이 재사용하는 generic plan
+(plan_cache_mode = force_generic_plan) 두 가지로 확인합니다. 모든 변경은 롤백합니다.
+
+    python -m scripts.check_query_plans --users 1000
+
+인덱스를 타야 하는 테이블(CHECKED_TABLES)에 Seq Scan 이 하나라도 있으면 종료 코드 1로 실패합니다.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event, func, select, text
+from sqlalchemy.orm import selectinload
+
+from app.core.config import settings
+from app.crud.portfolio_crud import PortfolioCRUD
+from app.crud.portfolio_item_crud import PortfolioItemCRUD
+from app.crud.qna_crud import QnACRUD
+from app.db.session import AsyncSessionLocal, async_engine
+from app.models.chat_session import ChatSession
+from app.models.qna import QnA
+
+CHECKED_TABLES = (
+    "portfolios",
+    "portfolio_items",
+    "qnas",
+    "chat_sessions",
+    "chat_messages",
+)
+# 사용자마다 상태별 포트폴리오를 하나씩 만듭니다. (PUBLISHED 는 사용자당 하나)
+PORTFOLIO_STATUSES = ("PUBLISHED", "DRAFT_QNA", "CONFIRMED", "DELETED")
+
+SEED_STATEMENTS = (
+    """
+    INSERT INTO users (id, email)
+    SELECT gen_random_uuid(), CAST(:tag AS text) || '-' || g || '@example.com'
+    FROM generate_series(1, :users) AS g
+    """,
+    """
+    INSERT INTO portfolios (id, user_id, name, status, source_type)
+    SELECT gen_random_uuid(), u.id, :tag,
+           (CAST(:portfolio_statuses AS text[]))[g]::portfoliostatus,
+           'TEXT'::portfoliosourcetype
+    FROM users AS u
+    CROSS JOIN generate_series(1, cardinality(CAST(:portfolio_statuses AS text[]))) AS g
+    WHERE u.email LIKE CAST(:tag AS text) || '-%'
+    """,
+    """
+    INSERT INTO portfolio_items (id, portfolio_id, type, status, topic, content, embedding)
+    SELECT gen_random_uuid(), p.id,
+           (ARRAY['INTRODUCTION', 'EXPERIENCE', 'PROJECT', 'SKILLS'])[1 + g % 4]::portfolioitemtype,
+           (ARRAY['CONFIRMED', 'CONFIRMED', 'PENDING', 'DELETED'])[1 + g % 4]::portfolioitemstatus,
+           'topic ' || g, 'content ' || g,
+           CASE WHEN g % 2 = 1
+                THEN array_fill((1 + g % 97) / 97.0, ARRAY[CAST(:dimension AS integer)])::vector END
+    FROM portfolios AS p
+    CROSS JOIN generate_series(1, :items) AS g
+    WHERE p.name = :tag
+    """,
+    """
+    INSERT INTO qnas (id, question, answer, status, user_id, portfolio_item_id, embedding)
+    SELECT gen_random_uuid(), 'question ' || g, 'answer ' || g,
+           (ARRAY['CONFIRMED', 'PENDING', 'DELETED'])[1 + g % 3]::qnastatus,
+           p.user_id, i.id,
+           CASE WHEN g % 2 = 1
+                THEN array_fill((1 + g % 89) / 89.0, ARRAY[CAST(:dimension AS integer)])::vector END
+    FROM portfolio_items AS i
+    JOIN portfolios AS p ON p.id = i.portfolio_id
+    CROSS JOIN generate_series(1, :qnas) AS g
+    WHERE p.name = :tag
+    """,
+    """
+    INSERT INTO chat_sessions (id, session_id, portfolio_id, user_id)
+    SELECT gen_random_uuid(), CAST(:tag AS text) || '-' || p.id, p.id, p.user_id
+    FROM portfolios AS p
+    WHERE p.name = :tag AND p.status = 'PUBLISHED'
+    """,
+    """
+    INSERT INTO chat_messages (id, type, chat_session_id, question, answer)
+    SELECT gen_random_uuid(), 'TECH'::chatmessagetype, s.id,
+           'question ' || g, 'answer ' || g
+    FROM chat_sessions AS s
+    CROSS JOIN generate_series(1, :messages) AS g
+    WHERE s.session_id LIKE CAST(:tag AS text) || '-%'
+    """,
+)
+
+
+async def seed(db, *, tag: str, args: argparse.Namespace) -> None:
+    params = {
+        "tag": tag,
+        "users": args.users,
+        "portfolio_statuses": list(PORTFOLIO_STATUSES),
+        "items": args.items,
+        "qnas": args.qnas,
+        "messages": args.messages,
+        "dimension": settings.EMBEDDING_DIMENSION,
+    }
+    for statement in SEED_STATEMENTS:
+        await db.execute(text(statement), params)
+    # ANALYZE 는 트랜잭션 안에서도 실행되며, 통계도 함께 롤백됩니다.
+    await db.execute(text(f"ANALYZE {', '.join(('users',) + CHECKED_TABLES)}"))
+
+
+SAMPLE_QUERY = """
+SELECT p.id AS portfolio_id, p.user_id, s.id AS chat_session_id,
+       (SELECT id FROM portfolios
+        WHERE user_id = p.user_id AND status = 'DRAFT_QNA') AS draft_qna_portfolio_id
+FROM portfolios AS p
+JOIN chat_sessions AS s ON s.portfolio_id = p.id
+WHERE p.name = :tag AND p.status = 'PUBLISHED'
+LIMIT 1
+"""
+
+
+async def sample_ids(db, *, tag: str) -> Dict[str, Any]:
+    result = await db.execute(text(SAMPLE_QUERY), {"tag": tag})
+    ids = dict(result.mappings().one())
+
+    result = await db.execute(
+        text("SELECT id FROM portfolio_items WHERE portfolio_id = :portfolio_id"),
+        {"portfolio_id": ids["portfolio_id"]},
+    )
+    ids["item_ids"] = list(result.scalars().all())
+
+    result = await db.execute(
+        text("SELECT id FROM qnas WHERE portfolio_item_id = ANY(:item_ids)"),
+        {"item_ids": ids["item_ids"]},
+    )
+    ids["qna_ids"] = list(result.scalars().all())
+    return ids
+
+
+def build_checks(db, ids: Dict[str, Any]) -> List[Tuple[str, Callable[[], Awaitable]]]:
+    portfolio_crud = PortfolioCRUD(db)
+    portfolio_item_crud = PortfolioItemCRUD(db)
+    qna_crud = QnACRUD(db)
+    user_id = ids["user_id"]
+    portfolio_id = ids["portfolio_id"]
+    item_ids = ids["item_ids"]
+    embeddings = [[0.5] * settings.EMBEDDING_DIMENSION] * 2
+
+    return [
+        (
+            "PortfolioCRUD.get_portfolios_by_user_without_items",
+            lambda: portfolio_crud.get_portfolios_by_user_without_items(
+                user_id=user_id
+            ),
+        ),
+        (
+            "PortfolioCRUD.get_published_portfolio_by_user_id_with_items",
+            lambda: portfolio_crud.get_published_portfolio_by_user_id_with_items(
+                user_id=user_id
+            ),
+        ),
+        (
+            "PortfolioCRUD.get_portfolio_by_id_with_items",
+            lambda: portfolio_crud.get_portfolio_by_id_with_items(
+                portfolio_id=portfolio_id, user_id=user_id
+            ),
+        ),
+        (
+            "PortfolioCRUD.get_draft_qna_portfolio_by_id_with_items",
+            lambda: portfolio_crud.get_draft_qna_portfolio_by_id_with_items(
+                portfolio_id=ids["draft_qna_portfolio_id"], user_id=user_id
+            ),
+        ),
+        (
+            "PortfolioCRUD.search_portfolio_items_by_embedding",
+            lambda: portfolio_crud.search_portfolio_items_by_embedding(
+                embeddings=embeddings, portfolio_id=portfolio_id
+            ),
+        ),
+        (
+            "PortfolioItemCRUD.get_portfolio_items_by_portfolio_id",
+            lambda: portfolio_item_crud.get_portfolio_items_by_portfolio_id(
+                portfolio_id=portfolio_id
+            ),
+        ),
+        (
+            "PortfolioItemCRUD.get_confirmed_portfolio_items_by_portfolio_id",
+            lambda: portfolio_item_crud.get_confirmed_portfolio_items_by_portfolio_id(
+                portfolio_id=portfolio_id
+            ),
+        ),
+        (
+            "PortfolioItemCRUD.get_confirmed_portfolio_items_to_embed",
+            lambda: portfolio_item_crud.get_confirmed_portfolio_items_to_embed(
+                portfolio_id=portfolio_id
+            ),
+        ),
+        (
+            "PortfolioItemCRUD.get_confirmed_portfolio_items_failed_embedding",
+            lambda: portfolio_item_crud.get_confirmed_portfolio_items_failed_embedding(
+                portfolio_id=portfolio_id
+            ),
+        ),
+        (
+            "PortfolioItemCRUD.get_portfolio_item_by_ids",
+            lambda: portfolio_item_crud.get_portfolio_item_by_ids(
+                portfolio_item_ids=item_ids
+            ),
+        ),
+        (
+            "QnACRUD.get_qnas_by_portfolio_id",
+            lambda: qna_crud.get_qnas_by_portfolio_id(
+                portfolio_id=portfolio_id, user_id=user_id
+            ),
+        ),
+        (
+            "QnACRUD.get_qnas_by_ids",
+            lambda: qna_crud.get_qnas_by_ids(ids=ids["qna_ids"], user_id=user_id),
+        ),
+        (
+            "QnACRUD.search_qnas_by_embeddings",
+            lambda: qna_crud.search_qnas_by_embeddings(
+                portfolio_item_ids=item_ids, embeddings=embeddings
+            ),
+        ),
+        (
+            "QnACRUD.delete_qnas_by_portfolio_item_ids",
+            lambda: qna_crud.delete_qnas_by_portfolio_item_ids(
+                portfolio_item_ids=item_ids, user_id=user_id
+            ),
+        ),
+        # 사용자 삭제 시 외래 키 확인과 같은 형태의 조회
+        (
+            "qnas by user_id",
+            lambda: db.execute(
+                select(func.count()).select_from(QnA).where(QnA.user_id == user_id)
+            ),
+        ),
+        (
+            "ChatSession.messages (selectinload)",
+            lambda: db.execute(
+                select(ChatSession)
+                .options(selectinload(ChatSession.messages))
+                .where(ChatSession.id == ids["chat_session_id"])
+            ),
+        ),
+    ]
+
+
+def sql_literal(value: Any) -> str:
+    """EXECUTE 인자로 넘길 SQL 리터럴. 타입은 PREPARE 가 추론한 파라미터 타입으로 변환됩니다."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        value = "{" + ",".join(str(v) for v in value) + "}"
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def iter_nodes(plan: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from iter_nodes(child)
+
+
+def scans(plan: Dict[str, Any]) -> List[str]:
+    found = []
+    for node in iter_nodes(plan):
+        relation = node.get("Relation Name")
+        if relation in CHECKED_TABLES:
+            index = node.get("Index Name")
+            found.append(
+                f"{node['Node Type']} on {relation}"
+                + (f" using {index}" if index else "")
+            )
+    return found
+
+
+async def explain(
+    driver, statement: str, params: Tuple[Any, ...], *, generic: bool
+) -> Dict[str, Any]:
+    if not generic:
+        result = await driver.fetchval(f"EXPLAIN (FORMAT JSON) {statement}", *params)
+        return json.loads(result)[0]["Plan"]
+
+    # 인자 없는 execute 는 simple query 프로토콜을 사용하므로 $n 이 그대로 PREPARE 에 전달됩니다.
+    await driver.execute("SET plan_cache_mode = force_generic_plan")
+    await driver.execute(f"PREPARE plan_check AS {statement}")
+    try:
+        arguments = f"({', '.join(sql_literal(p) for p in params)})" if params else ""
+        result = await driver.fetchval(
+            f"EXPLAIN (FORMAT JSON) EXECUTE plan_check{arguments}"
+        )
+        return json.loads(result)[0]["Plan"]
+    finally:
+        await driver.execute("DEALLOCATE plan_check")
+        await driver.execute("RESET plan_cache_mode")
+
+
+async def run(args: argparse.Namespace) -> int:
+    tag = f"plan-check-{uuid.uuid4().hex[:8]}"
+    captured: Optional[List[Tuple[str, Tuple[Any, ...]]]] = None
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if captured is not None:
+            captured.append((statement, tuple(parameters or ())))
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", capture)
+    failures = 0
+    async with AsyncSessionLocal() as db:
+        try:
+            await seed(db, tag=tag, args=args)
+            ids = await sample_ids(db, tag=tag)
+            raw_connection = await (await db.connection()).get_raw_connection()
+            driver = raw_connection.driver_connection
+
+            for label, call in build_checks(db, ids):
+                captured = []
+                await call()
+                statements, captured = captured, None
+                db.expunge_all()
+
+                for number, (statement, params) in enumerate(statements, start=1):
+                    name = label if len(statements) == 1 else f"{label} #{number}"
+                    for generic in (False, True):
+                        plan = await explain(driver, statement, params, generic=generic)
+                        found = scans(plan)
+                        seq_scans = [s for s in found if s.startswith("Seq Scan")]
+                        failures += bool(seq_scans)
+                        print(
+                            f"{'FAIL' if seq_scans else 'ok':<5}"
+                            f"{'generic' if generic else 'custom':<9}{name}"
+                        )
+                        for scan in found:
+                            print(f"{'':<14}{scan}")
+        finally:
+            await db.rollback()
+    event.remove(async_engine.sync_engine, "before_cursor_execute", capture)
+    await async_engine.dispose()
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--items", type=int, default=8, help="포트폴리오당 항목 수")
+    parser.add_argument("--qnas", type=int, default=2, help="항목당 Q&A 수")
+    parser.add_argument("--messages", type=int, default=20, help="세션당 메시지 수")
+    args = parser.parse_args()
+
+    failures = asyncio.run(run(args))
+    if failures:
+        print(f"\nFAIL: {failures} plan(s) use a sequential scan")
+        sys.exit(1)
+    print("\nOK")
+
+
+if __name__ == "__main__":
+    main()
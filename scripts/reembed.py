@@ -0,0 +1,87 @@
+"""
+저장된 임베딩을 현재 EMBEDDING_MODEL 로 다시 만듭니다.
+
+EMBEDDING_MODEL 을 바꾸면 서버/워커는 다른 모델로 만든 벡터가 남아 있는 동안 시작하지 않습니다.
+새 설정으로 이 스크립트를 실행하면 embedding_model 이 현재 모델과 다른 항목/Q&A를 배치 단위로
+다시 임베딩합니다. 기존 벡터는 새 벡터를 쓸 때 함께 교체되고, 배치마다 커밋하므로 중단해도
+다시 실행하면 남은 행부터 이어서 진행합니다.
+
+    EMBEDDING_MODEL=onnx:./models/multilingual-e5-base python -m scripts.reembed
+"""
+
+import argparse
+import asyncio
+from typing import Awaitable, Callable, List
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal, async_engine
+from app.models.portfolio_item import PortfolioItem
+from app.models.qna import QnA
+from app.services.embedding_gateway import (
+    close_embedding_gateway,
+    embedding_model_tag,
+    get_embedding_gateway,
+)
+from app.services.rag_service import RAGService
+
+
+async def reembed_table(
+    model, embed: Callable[[List], Awaitable[List[List[float]]]], batch_size: int
+) -> int:
+    tag = embedding_model_tag()
+    total = 0
+    while True:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(model)
+                .where(
+                    model.embedding.is_not(None),
+                    model.embedding_model.is_distinct_from(tag),
+                )
+                .limit(batch_size)
+            )
+            rows = list(result.scalars().all())
+            if not rows:
+                return total
+
+            embeddings = await embed(rows)
+            for row, embedding in zip(rows, embeddings):
+                row.embedding = embedding
+                row.embedding_model = tag
+            await db.commit()
+
+        total += len(rows)
+        print(f"{model.__tablename__}: {total} rows re-embedded")
+
+
+async def run(batch_size: int) -> None:
+    # 임베딩만 사용하므로 저장소 클라이언트는 만들지 않습니다.
+    rag_service = RAGService(
+        storage_service=None, embedding_gateway=get_embedding_gateway()
+    )
+    print(f"Re-embedding with {embedding_model_tag()}")
+    try:
+        await reembed_table(
+            PortfolioItem,
+            lambda items: rag_service.embed_portfolio_items(items=items),
+            batch_size,
+        )
+        await reembed_table(QnA, rag_service.embed_qnas, batch_size)
+    finally:
+        await close_embedding_gateway()
+        await async_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--batch-size", type=int, default=settings.EMBEDDING_MAX_BATCH_SIZE
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()